@@ -105,22 +105,337 @@
     brinees = [Brine(),Brine(),Brine()]
     json.dumps(brinees, default=brining.default, indent=2)
 
+    To stream many brined objects to a file
+    brining.dump_many(brinees, "brinees.jsonl")
+
+    To emit shared objects once and allow cycles with @id and @ref keys
+    @brined(referenced=True)
+
+    To persist changes to a brined object as appends to a journal
+    journal = brining.Journal(b, "b.json")
+    journal.recover()
+    journal.record(x=5)
+
+    To record per class counts, latencies and bytes
+    brining.meter()
+    brining.stats()
+    brining.resetStats()
+    And samples of serializations slower than 10 ms by attribute
+    brining.sample(0.01)
+    brining.samples()
+
+    MessagePack:
+
+    The same keys and "@class" hint as JSON in MessagePack.
+    msgpack is used when installed otherwise a pure Python engine.
+    data = b._packb()
+    b._unpackb(data)
+    a = brining.debrine_packed(data, [B])
+
+    Struct Layout:
+
+    Fixed size binary records of the bool, int and float fields for random
+    access in a buffer, mmap or file.
+    @brined(layout='struct')
+    class P(object):
+        x: int = 0
+        y: float = 0.0
+    buffer = brining.pack_many(points)
+    points = brining.unpack_many(buffer, P, start=100, count=10)
+
+    Codecs:
+
+    Values of types JSON does not support serialize in a tagged form that
+    debrines, _loads and _load restore. datetime, date, time, timedelta,
+    Decimal, UUID, Enum, set, frozenset and buffers are built in.
+    {"@type": "uuid", "@data": "2f1e..."}
+    Register more types with
+    brining.register(Point, 'point', lambda p: [p.x, p.y], lambda d: Point(*d))
+
+    Buffers:
+
+    bytes, bytearray, memoryview and numpy array attributes serialize as
+    {"@type": "ndarray", "dtype": "<f8", "shape": [3], "@data": "<base64>"}
+    Or out of band without base64
+    s, segments = brining.dumps_segmented(b)
+    b = brining.debrines_segmented(s, segments, [B])
+
+    Columns:
+
+    A list of objects of one class as one list per attribute so each key
+    appears once.
+    columns = brining.to_columns(points, kind='array')
+    points = brining.from_columns(columns, P)
+    brining.dump_columns(points, "points.json")
+    points = brining.debrine_columns("points.json", [P])
+
+    JSON Backend:
+
+    The JSON engine is pluggable. simplejson when installed, otherwise the
+    standard library json, is used by default. orjson is opt in since the
+    checks that keep its output identical cost more than it saves.
+    brining.setBackend('orjson')
+    Or per class
+    @brined(backend='simplejson')
+
     See LICENSE.txt for Licensing details
     Copyright (c) <2013> <Samuel M. Smith>
 
 """
 import sys
 import os
+import re
 import errno
 import inspect
+import keyword
+import typing
+import stat
+import uuid
+import enum
+import decimal
+import datetime
+import struct
+import array
+import binascii
+import io
+import time
+import weakref
+import copy
+import threading
+import itertools
+import operator
+import functools
+import collections
+import contextlib
+import asyncio
+import concurrent.futures
+import json as stdjson
 
 from collections import OrderedDict as odict
 #from ioflo.aid import odict
 
-import simplejson as json
+try:
+    import simplejson as json
+except ImportError: # fall back to standard library
+    json = stdjson
+
+try:
+    import orjson # optional faster backend
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack # optional faster MessagePack engine
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy # optional array columns and codecs
+except ImportError:
+    numpy = None
+
+
+class ParameterError(ValueError):
+    """ Missing or invalid parameter such as an empty filename"""
+
+
+class JsonBackend(object):
+    """ JsonBackend
+
+        JSON engine used to serialize and deserialize brined objects.
+        Wraps a module with the json/simplejson interface such as the standard
+        library json or simplejson.
+
+        Attributes:
+            name, registry name of backend in Backends
+            module, wrapped json compatible module
+            options, dict of keyword arguments of every encode, for
+                simplejson encoding=None and use_decimal=False so bytes and
+                Decimal go to default and their codecs, see register
+    """
+    def __init__(self, name, module, options=None):
+        self.name = name
+        self.module = module
+        self.options = options if options is not None else {}
+
+    def dumps(self, obj, default=None, indent=None, **kwa):
+        """ Returns JSON serialization of obj as str"""
+        if self.options:
+            kwa = dict(self.options, **kwa)
+        return self.module.dumps(obj, default=default, indent=indent, **kwa)
+
+    def dump(self, obj, fp, default=None, indent=None, **kwa):
+        """ Writes JSON serialization of obj to file object fp"""
+        if self.options:
+            kwa = dict(self.options, **kwa)
+        self.module.dump(obj, fp, default=default, indent=indent, **kwa)
+
+    def loads(self, s, hook=odict):
+        """ Returns deserialization of JSON s with hook as object_pairs_hook"""
+        return self.module.loads(s, object_pairs_hook=hook)
+
+    def load(self, fp, hook=odict):
+        """ Returns deserialization of JSON in file object fp with hook as
+            object_pairs_hook
+        """
+        return self.module.load(fp, object_pairs_hook=hook)
+
+    def encoder(self, default=None, indent=None, **kwa):
+        """ Returns reusable encode function of one argument, obj"""
+        if self.options:
+            kwa = dict(self.options, **kwa)
+        return self.module.JSONEncoder(default=default, indent=indent, **kwa).encode
+
+    def decoder(self, hook=odict):
+        """ Returns reusable decode function of one argument, s"""
+        return self.module.JSONDecoder(object_pairs_hook=hook).decode
+
+
+class OrjsonBackend(JsonBackend):
+    """ OrjsonBackend
+
+        JSON engine using the optional orjson package.
+
+        orjson is only used when its output is identical to that of the
+        fallback backend. That is compact output with separators (',', ':')
+        or indent 2 output with ensure_ascii output that has no float
+        exponents, DEL characters, nulls or untagged UUID values, which orjson
+        serializes natively instead of through their codec. orjson emits NaN
+        and Infinity as null so output with null is made by fallback, which
+        writes them or raises as it does without orjson. Everything else,
+        including options orjson does not support, is delegated to fallback,
+        as is everything once an Enum codec is registered, see register.
+
+        Deserialization with an object_pairs_hook, which includes all
+        debrining, is delegated to fallback since applying a hook to the parsed
+        result in Python is slower than a hook called by the fallback C scanner.
+        Without hook, input orjson rejects or that may hold integers beyond
+        64 bits is delegated to fallback so results and errors match.
+
+        Attributes:
+            fallback, JsonBackend used when orjson cannot match its output
+    """
+    Differs = re.compile(br'\d[eE]|0\.0000|\x7f|null|' # output that may differ
+                         br'(?<!"@data":)(?<!"@data": )"[0-9a-f]{8}-[0-9a-f]{4}-') # UUID
+    BigInts = re.compile(r'\d{19}') # input that may exceed 64 bit integers
+
+    def __init__(self, name='orjson', module=None, fallback=None):
+        super(OrjsonBackend, self).__init__(name, module if module is not None else orjson)
+        self.fallback = fallback
+
+    def option(self, indent=None, **kwa):
+        """ Returns orjson option for parameters or None if not supported"""
+        separators = kwa.pop('separators', None)
+        kwa.pop('ensure_ascii', None)
+        if kwa:
+            return None
+        if indent is None:
+            if separators is not None and tuple(separators) == (',', ':'):
+                return 0
+            return None
+        if indent == 2 and (separators is None or tuple(separators) == (',', ': ')):
+            return self.module.OPT_INDENT_2
+        return None
+
+    def dumps(self, obj, default=None, indent=None, **kwa):
+        """ Returns JSON serialization of obj as str"""
+        option = self.option(indent, **kwa)
+        if option is not None and not EnumCodecs: # orjson would emit Enum values
+            try:
+                b = self.module.dumps(obj,
+                                      default=default,
+                                      option=option |
+                                             self.module.OPT_PASSTHROUGH_DATETIME |
+                                             self.module.OPT_PASSTHROUGH_DATACLASS)
+            except TypeError as ex: # unsupported, let fallback decide
+                pass
+            else:
+                if ((b.isascii() or not kwa.get('ensure_ascii', True)) and
+                        not self.Differs.search(b)):
+                    return b.decode('utf-8')
+        return self.fallback.dumps(obj, default=default, indent=indent, **kwa)
+
+    def dump(self, obj, fp, default=None, indent=None, **kwa):
+        """ Writes JSON serialization of obj to file object fp"""
+        fp.write(self.dumps(obj, default=default, indent=indent, **kwa))
+
+    def loads(self, s, hook=odict):
+        """ Returns deserialization of JSON s with hook as object_pairs_hook"""
+        if hook is not None: # fallback calls hook from its C scanner, faster
+            return self.fallback.loads(s, hook=hook)
+        if isinstance(s, bytes):
+            s = s.decode('utf-8')
+        if self.BigInts.search(s): # orjson parses these as float
+            return self.fallback.loads(s, hook=hook)
+        try:
+            return self.module.loads(s)
+        except ValueError as ex: # let fallback parse or raise its error
+            return self.fallback.loads(s, hook=hook)
+
+    def load(self, fp, hook=odict):
+        """ Returns deserialization of JSON in file object fp"""
+        if hook is not None:
+            return self.fallback.load(fp, hook=hook)
+        return self.loads(fp.read(), hook=hook)
+
+    def encoder(self, default=None, indent=None, **kwa):
+        """ Returns reusable encode function of one argument, obj"""
+        return functools.partial(self.dumps, default=default, indent=indent, **kwa)
+
+    def decoder(self, hook=odict):
+        """ Returns reusable decode function of one argument, s"""
+        if hook is not None:
+            return self.fallback.decoder(hook=hook)
+        return functools.partial(self.loads, hook=hook)
+
+
+Backends = odict() # registry of available JsonBackend keyed by name
+Backends['json'] = JsonBackend('json', stdjson)
+if json is not stdjson:
+    Backends['simplejson'] = JsonBackend('simplejson', json,
+                                           options=dict(encoding=None, use_decimal=False))
+if orjson is not None:
+    Backends['orjson'] = OrjsonBackend(fallback=Backends[json.__name__])
+
+def detectBackend():
+    """ Returns name of fastest available backend. orjson is ranked last, see
+        benchmarks.benchBackend, since scanning its output for what would
+        differ and often serializing again with its fallback makes it slower
+        than simplejson and json.
+    """
+    for name in ('simplejson', 'json', 'orjson'):
+        if name in Backends:
+            return name
+
+ActiveBackend = Backends[detectBackend()] # global default backend
+
+def getBackend(backend=None):
+    """ Returns JsonBackend for backend which may be a JsonBackend instance,
+        a name in Backends, or None for the global default ActiveBackend
+    """
+    if backend is None:
+        return ActiveBackend
+    if isinstance(backend, JsonBackend):
+        return backend
+    try:
+        return Backends[backend]
+    except KeyError as ex:
+        raise ParameterError("Unknown or unavailable backend '%s'." % backend)
+
+def setBackend(backend=None):
+    """ Sets global default backend used when a class _Backend is None.
+        backend may be a JsonBackend instance, a name in Backends or
+        None to autodetect the fastest available backend.
+        Returns the new default JsonBackend.
+    """
+    global ActiveBackend
+    ActiveBackend = getBackend(backend if backend is not None else detectBackend())
+    return ActiveBackend
 
 
-def brined(keys=None, propertied=False, safed=False, hinted=True, extendable=False):
+def brined(keys=None, propertied=False, safed=False, hinted=True, extendable=False,
+           backend=None, compiled=False, tracked=False, referenced=False,
+           layout=None):
     """ Explicit decorator to explicitly augment cls with brining
         (JSON serializationdeserialization)
 
@@ -158,8 +473,33 @@ def brined(keys=None, propertied=False, safed=False, hinted=True, extendable=Fal
             extendable, If True allow unique keys in deserialization to create
                 new attributes in object.
 
+            backend, JsonBackend or name of backend in Backends to use for
+                this class. None means use the global default, see setBackend.
+
+            compiled, If True generate specialized dumpable and update
+                functions from the class annotations. Only annotated fields
+                (and properties when propertied) are serialized.
+                Unannotated classes use the generic path.
+
+            tracked, If True hook attribute assignment to mark instances dirty
+                and cache the serialization of clean instances so dumps of
+                mostly unchanged trees of tracked objects splice in cached
+                fragments instead of walking them again. In place changes of
+                attribute values must be followed by ._touch().
+
+            referenced, If True dumps emit each brined object reachable from
+                the dumped object once with an "@id" and later as {"@ref": id}
+                so shared objects are not repeated and cycles are serializable.
+                debrines rebuilds the shared objects and cycles.
+
+            layout, If 'struct' then also serialize to fixed size binary
+                records of the bool, int and float fields from _Keys or the
+                annotations with ._pack, ._unpack, pack_many and unpack_many.
+                See StructLayout.
+
         These will set the associated class attributes:
-            _Keys, _Propertied, _Safed, _Hinted, _Extendable
+            _Keys, _Propertied, _Safed, _Hinted, _Extendable, _Backend, _Compiled,
+            _Tracked, _Referenced, _Layout
 
 
     """
@@ -167,30 +507,28 @@ def brined(keys=None, propertied=False, safed=False, hinted=True, extendable=Fal
     def briner(cls):
         """ Implicit decorator
         """
-        if not hasattr(cls, "_Brined"):
-            cls._Brined = True
-            cls._Keys = keys # custom inclusion and ordering, when None do not use
-            cls._Propertied = propertied # When True include data descriptor properties
-            cls._Safed = safed # When True test for and exclude non-serializible attributes
-            cls._Hinted = hinted
-            cls._Extendable = extendable
-
-            cls._dumpable = dumpable
-            cls._default = staticmethod(default)
-            cls._dumps = dumps
-            cls._update = update
-            cls._loads = loads
-            cls._ocfn = staticmethod(ocfn)
-            cls._dump = dump
-            cls._load = load
-        return cls
+        return brinify(cls,
+                       keys=keys,
+                       propertied=propertied,
+                       safed=safed,
+                       hinted=hinted,
+                       extendable=extendable,
+                       backend=backend,
+                       compiled=compiled,
+                       tracked=tracked,
+                       referenced=referenced,
+                       layout=layout)
 
     return briner
 
-def brinify(cls, keys=None, propertied=False, safed=False, hinted=True, extendable=False):
+def brinify(cls, keys=None, propertied=False, safed=False, hinted=True, extendable=False,
+            backend=None, compiled=False, tracked=False, referenced=False,
+            layout=None):
     """ Class wrapper to explicitly augment cls with brining (JSON serialization
         deserialization)
     """
+    if layout not in (None, 'struct'):
+        raise ParameterError("Invalid layout '%s'." % layout)
     if not hasattr(cls, "_Brined"):
         cls._Brined = True
         cls._Keys = keys # custom inclusion and ordering, when None do not use
@@ -198,18 +536,237 @@ def brinify(cls, keys=None, propertied=False, safed=False, hinted=True, extendab
         cls._Safed = safed # When True test for and exclude non-serializible attributes
         cls._Hinted = hinted # When True require hinting
         cls._Extendable = extendable # When True allow new attributes from deserialization
+        cls._Backend = backend # When None use global default backend
+        cls._Compiled = compiled # When True generate serializers from annotations
+        cls._Tracked = tracked # When True cache serializations of clean instances
+        cls._Referenced = referenced # When True emit shared objects once with @id
+        cls._Layout = layout # When 'struct' pack fixed size binary records
+        cls._DumpPlan = DumpPlan(cls) # cached per class dump plan
+        cls._UpdatePlan = UpdatePlan(cls) # cached per class update plan
+        AttrKinds.clear() # cls is now brined so forget cached kinds
+        SafeKinds.pop(cls, None)
 
         cls._dumpable = dumpable
         cls._default = staticmethod(default)
         cls._dumps = dumps
         cls._update = update
         cls._loads = loads
+        cls._packb = packs
+        cls._unpackb = unpacks
+        cls._pack = pack
+        cls._unpack = unpack
         cls._ocfn = staticmethod(ocfn)
         cls._dump = dump
         cls._load = load
+        cls._adump = adump
+        cls._aload = aload
+        cls._touch = touch
+        if tracked:
+            track(cls)
+        if layout == 'struct':
+            structLayout(cls) # fail early on unsupported fields
+        BrinedClasses.add(cls)
+        if Metering:
+            meter(True, cls)
     return cls
 
 
+PLAIN = 0 # attribute kinds returned by attrKind
+BRINED = 1
+ROUTINE = 2
+CODEC = 3
+
+AttrKinds = {} # memo of attribute kind keyed by type of attribute
+
+def attrKind(attr):
+    """ Returns kind of attribute value attr as one of
+        PLAIN, BRINED (has _Brined), ROUTINE (function or method) or
+        CODEC (has an eager Codec, see register)
+
+        The kind only depends on the type of attr so it is memoized per type in
+        AttrKinds. This replaces a per attribute inspect.isroutine call, which
+        is the dominant cost of dumpable and update, with one dict lookup.
+        brined, brinify and register clear the memo since they change the kind
+        of a type.
+    """
+    kind = AttrKinds.get(attr.__class__)
+    if kind is None:
+        if hasattr(attr.__class__, '_Brined'): # not attr, a brined class is a type
+            kind = BRINED
+        elif inspect.isroutine(attr):
+            kind = ROUTINE
+        else:
+            codec = codecOf(attr.__class__)
+            kind = CODEC if codec is not None and codec.eager else PLAIN
+        if len(AttrKinds) > 1024: # bound memo when classes are made dynamically
+            AttrKinds.clear()
+        AttrKinds[attr.__class__] = kind
+    return kind
+
+SAFE = 0 # serializibility verdicts of types memoized in SafeKinds
+UNSAFE = 1
+SEQUENCE = 2
+MAPPING = 3
+
+SafeKinds = {type(None): SAFE} # memo of serializibility verdict keyed by type
+SafeKeys = (str, int, float, bool, type(None)) # types JSON allows as object keys
+
+def safeKind(cls):
+    """ Returns serializibility verdict of type cls as one of
+        SAFE, UNSAFE, SEQUENCE (walk items), MAPPING (walk keys and values)
+        memoized in SafeKinds.
+
+        JSON native scalars, brined classes and types with a Codec are SAFE.
+        Other types are probed once with json.dumps on an instance by brineSafe.
+    """
+    kind = SafeKinds.get(cls)
+    if kind is None:
+        if (issubclass(cls, (str, int, float)) or hasattr(cls, '_Brined') or
+                codecOf(cls) is not None):
+            kind = SAFE
+        elif issubclass(cls, (list, tuple)):
+            kind = SEQUENCE
+        elif issubclass(cls, dict):
+            kind = MAPPING
+        else:
+            return None # unknown until probed
+        if len(SafeKinds) > 1024: # bound memo when classes are made dynamically
+            SafeKinds.clear()
+            SafeKinds[type(None)] = SAFE
+        SafeKinds[cls] = kind
+    return kind
+
+def brineSafe(obj, _active=None):
+    """ Returns True if obj can be serialized by brining dumps, that is
+        it is made of JSON native values, lists, tuples, dicts, values with a
+        Codec and brined objects. Returns False otherwise, including for
+        circular containers.
+
+        The verdict for scalars and other leaf types is memoized per type in
+        SafeKinds so containers are walked once and nothing is serialized.
+        Leaf types that are not known up front are probed once with
+        json.dumps on the first instance seen.
+        This replaces serializing each attribute with json.dumps in _Safed mode.
+    """
+    kind = SafeKinds.get(obj.__class__)
+    if kind is None:
+        kind = safeKind(obj.__class__)
+        if kind is None: # probe unknown leaf type once
+            try:
+                json.dumps(obj)
+            except (TypeError, ValueError) as ex:
+                kind = UNSAFE
+            else:
+                kind = SAFE
+            SafeKinds[obj.__class__] = kind
+
+    if kind == SAFE:
+        return True
+    if kind == UNSAFE:
+        return False
+
+    if _active is None: # ids of containers being walked for cycle detection
+        _active = set()
+    if id(obj) in _active:
+        return False # circular reference
+    _active.add(id(obj))
+
+    get = SafeKinds.get
+    if kind == SEQUENCE:
+        for item in obj:
+            if get(item.__class__) != SAFE and not brineSafe(item, _active):
+                return False
+    else: # MAPPING
+        for key, value in obj.items():
+            if key.__class__ is not str and not isinstance(key, SafeKeys):
+                return False
+            if get(value.__class__) != SAFE and not brineSafe(value, _active):
+                return False
+
+    _active.discard(id(obj))
+    return True
+
+def slotNames(cls):
+    """ Returns tuple of public __slots__ attribute names declared across the
+        mro of cls in declaration order, most derived class first.
+    """
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots, )
+        for name in slots:
+            if not name.startswith('_') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+class DumpPlan(object):
+    """ Compiled per class dump plan used by dumpable
+
+        Caches the class level introspection that does not depend on the
+        instance so it is done once per class instead of once per dump:
+            names, tuple of public names from _Keys in order or None when
+                _Keys is None
+            slots, tuple of public __slots__ names across the mro, these are
+                instance attributes that are not in the instance __dict__
+            props, tuple of public data descriptor property names other than
+                slots when _Propertied else empty
+            hint, class name hint when _Hinted else None
+            compiled, generated dumpable function when _Compiled and cls
+                has annotations else None, see compileDumpable
+
+        The plan remembers the _Keys, _Propertied, _Safed, _Hinted, _Compiled
+        values it was built from. dumpPlan rebuilds it whenever any of these
+        class attributes is reassigned. Mutating the _Keys list in place is not detected,
+        reassign _Keys instead.
+    """
+    __slots__ = ('keys', 'propertied', 'safed', 'hinted', 'compiling', 'names',
+                 'slots', 'props', 'hint', 'compiled')
+
+    def __init__(self, cls):
+        self.keys = cls._Keys
+        self.propertied = cls._Propertied
+        self.safed = cls._Safed
+        self.hinted = cls._Hinted
+        self.compiling = cls._Compiled
+
+        if self.keys is None:
+            self.names = None
+        else:
+            self.names = tuple(key for key in self.keys if not key.startswith('_'))
+
+        self.slots = slotNames(cls)
+
+        if self.propertied: # data descriptor properties from class
+            self.props = tuple(key for key in dir(cls) if not key.startswith('_') and
+                               key not in self.slots and
+                               inspect.isdatadescriptor(getattr(cls, key)))
+        else:
+            self.props = ()
+
+        self.hint = cls.__name__ if self.hinted else None
+        self.compiled = compileDumpable(cls, self) if self.compiling else None
+
+    def valid(self, cls):
+        """ Returns True if plan still matches the brining attributes of cls"""
+        return (self.keys is cls._Keys and
+                self.propertied == cls._Propertied and
+                self.safed == cls._Safed and
+                self.hinted == cls._Hinted and
+                self.compiling == cls._Compiled)
+
+def dumpPlan(cls):
+    """ Returns current DumpPlan for brined class cls building a new one when
+        there is none or the cached one is stale.
+        The plan is looked up in cls.__dict__ so subclasses of a brined class
+        such as Brine each get their own plan.
+    """
+    plan = cls.__dict__.get('_DumpPlan')
+    if plan is None or not plan.valid(cls):
+        plan = DumpPlan(cls)
+        cls._DumpPlan = plan
+    return plan
+
 def dumpable(self, deep=False):
     """
         Return nested ordered dict of dumpable attributes including
@@ -219,67 +776,666 @@ def dumpable(self, deep=False):
             This is useful if want to convert to dumpable full nested Briners
             when using as standalone function not part of dump or dumps
     """
-    if self._Keys is None:
-        keys = list(self.__dict__.keys()) #include instance attribute keys
-        if self._Propertied: # include data descripter propertiesf from class
-            props = [key for key in dir(self) if hasattr(self.__class__, key) and
-                     inspect.isdatadescriptor(getattr(self.__class__, key))]
-            keys.extend(props)
+    plan = dumpPlan(self.__class__)
+    if plan.compiled is not None:
+        return plan.compiled(self, deep)
+
+    if plan.names is None:
+        keys = [key for key in getattr(self, '__dict__', ())
+                if not key.startswith('_')] #include instance attribute keys
+        keys.extend(plan.slots) # include slot attributes, unset ones are skipped below
+        keys.extend(plan.props) # include data descripter properties from class
         keys.sort()
-
     else:
-        keys = self._Keys
+        keys = plan.names
 
     dumpable = odict() #use odict so serialization is ordered
 
     for name in keys:  #build nested OrderedDict of serializible attributes
-        if name.startswith('_'): continue #skip private
-
         try: #get the attr associate with name
             attr = getattr(self, name)
         except AttributeError as ex: #skip if fails getattr
             continue
 
-        if inspect.isroutine(attr): continue  #skip methods
+        kind = attrKind(attr)
+        if kind == ROUTINE: continue  #skip methods
 
-        if deep and hasattr(attr, '_Brined'): # descend into Brined objects
-            dumpable[name] = attr._dumpable() #recusively operate on Briner instances
-            continue
+        if kind == BRINED:
+            if deep: # descend into Brined objects
+                attr = attr._dumpable() #recusively operate on Briner instances
 
-        if not hasattr(attr, '_Brined') and self._Safed:
-            try: #last resort, skip attributes that are not json serializible
-                temp = json.dumps(attr)
-            except TypeError as ex:
-                continue
+        elif kind == CODEC: # tagged form, see register
+            attr = Codecs[attr.__class__].encode(attr)
+
+        elif plan.safed and not brineSafe(attr):
+            continue #skip attributes that are not json serializible
 
         dumpable[name] = attr #valid attribute
 
-    if self._Hinted:
-        dumpable["@class"] = self.__class__.__name__
+    if plan.hint is not None:
+        dumpable["@class"] = plan.hint
 
     return dumpable
 
 def default(obj):
-    """ Method for simplejson default"""
+    """ Method for simplejson default. Values of types with a Codec are
+        encoded in tagged form, see register.
+    """
     if not hasattr(obj, '_Brined'):
-        raise TypeError("%s is not JSON serializable" % type(obj))
+        return encodeValue(obj)
 
     return obj._dumpable()
 
+class Codec(object):
+    """ Codec
+
+        Encoder and decoder of values of a type JSON does not support as a
+        tagged odict such as {"@type": "uuid", "@data": "..."}, see register.
+
+        Attributes:
+            cls, type of encoded values
+            name, "@type" tag unique per codec
+            encode, function (obj, segments=None, raw=False) returning tagged
+                odict, see encodeBuffer
+            decode, function (tagged odict, segments=None) returning value
+            match, function (odict) returning True if the odict is exactly
+                the tagged form of the codec, by default the two keys "@type"
+                and "@data". Other odicts with an "@type" key, as in JSON-LD,
+                are left as plain data.
+            eager, True if _dumpable encodes attribute values of cls up front
+                so every backend emits the tagged form even for types orjson
+                would serialize natively such as UUID and Enum. Otherwise only
+                the default function encodes them, as for buffers so
+                dumps_segmented can move them out of band.
+    """
+    __slots__ = ('cls', 'name', 'encode', 'decode', 'match', 'eager')
+
+    def __init__(self, cls, name, encode, decode, match=None, eager=True):
+        self.cls = cls
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+        self.match = match if match is not None else dataTagged
+        self.eager = eager
+
+def dataTagged(dct):
+    """ Returns True if odict dct has exactly the keys "@type" and "@data" """
+    return len(dct) == 2 and "@data" in dct
+
+def decodeTagged(dct, segments=None):
+    """ Returns value decoded from odict dct when it is exactly the tagged
+        form of a Codec, see Codec.match, else dct unchanged
+    """
+    try:
+        codec = CodecNames.get(dct["@type"])
+    except TypeError as ex: # unhashable "@type" such as a JSON-LD list
+        return dct
+    if codec is None or not codec.match(dct):
+        return dct
+    return codec.decode(dct, segments)
+
+Codecs = {} # Codec keyed by type for O(1) encode dispatch, includes subclass memos
+EnumCodecs = set() # Enum classes with a codec, orjson cannot encode them through default
+CodecNames = {} # Codec keyed by "@type" tag for O(1) decode dispatch
+
+def addCodec(codec):
+    """ Adds Codec codec to the registry replacing any codec of its type and
+        forgets memoized subclasses and kinds. Raises ParameterError if its
+        name is the tag of a codec of another type, unregister that first.
+    """
+    checkName(codec)
+    removeCodec(codec.cls)
+    Codecs[codec.cls] = codec
+    CodecNames[codec.name] = codec
+    forgetKinds()
+    return codec
+
+def checkName(codec):
+    """ Raises ParameterError if the name of Codec codec is already the tag
+        of a codec of another type, which would silently decode its values
+        as the other type or leave them as tagged odicts.
+    """
+    old = CodecNames.get(codec.name)
+    if old is not None and old.cls is not codec.cls:
+        raise ParameterError("Codec name '%s' of '%s' is taken by '%s'." %
+                             (codec.name, codec.cls.__qualname__, old.cls.__qualname__))
+
+def removeCodec(cls):
+    """ Removes codec of type cls if any from the registry. Returns it or None"""
+    codec = Codecs.get(cls)
+    if codec is None or codec.cls is not cls: # none or only subclass memo
+        return None
+    del Codecs[cls]
+    CodecNames.pop(codec.name, None)
+    forgetKinds()
+    return codec
+
+def forgetKinds():
+    """ Clears subclass memos in Codecs and the kind memos that depend on codecs"""
+    for key in [key for key, codec in Codecs.items() if codec.cls is not key]:
+        del Codecs[key]
+    EnumCodecs.clear()
+    EnumCodecs.update(key for key, codec in Codecs.items() if issubclass(key, enum.Enum))
+    AttrKinds.clear()
+    SafeKinds.clear()
+    SafeKinds[type(None)] = SAFE
+
+def register(cls, name=None, encode=None, decode=None, eager=True):
+    """ Registers codec for type cls so its values serialize as
+            {"@type": name, "@data": encode(value)}
+        and debrines, ._loads, ._load and the MessagePack loads restore them
+        with decode(data). encode must return a JSON serializable value.
+        name defaults to cls.__name__. For Enum classes encode and decode
+        default to the member value and cls. Subclasses of cls without a codec
+        of their own use the codec of cls. Replaces any codec of cls. Raises
+        ParameterError if name is the tag of a codec of another type.
+        Returns the Codec.
+
+        Attribute values are encoded by _dumpable, see Codec.eager, values in
+        lists and dicts by the default function. orjson serializes Enum
+        members natively without calling default so once any Enum codec is
+        registered the orjson backend delegates to its fallback, see
+        EnumCodecs, and every backend emits the same tagged form.
+    """
+    if name is None:
+        name = cls.__name__
+    return addCodec(makeCodec(cls, name, encode, decode, eager))
+
+def makeCodec(cls, name, encode=None, decode=None, eager=True):
+    """ Returns Codec of type cls tagged name, see register"""
+    if issubclass(cls, enum.Enum):
+        encode = encode if encode is not None else operator.attrgetter('value')
+        decode = decode if decode is not None else cls
+    if encode is None or decode is None:
+        raise ParameterError("Codec of '%s' needs encode and decode." % cls.__name__)
+
+    def encoder(obj, segments=None, raw=False):
+        return odict([("@type", name), ("@data", encode(obj))])
+
+    def decoder(dct, segments=None):
+        try:
+            return decode(dct["@data"])
+        except (TypeError, ValueError, ArithmeticError) as ex: # not its data
+            return dct
+
+    return Codec(cls, name, encoder, decoder, eager=eager)
+
+def unregister(cls):
+    """ Removes the codec of type cls. Returns True if there was one"""
+    return removeCodec(cls) is not None
+
+def codecOf(cls):
+    """ Returns Codec of type cls, or of its nearest base class with one,
+        memoized in Codecs, else None. Enum classes without a codec are
+        registered on first use tagged with their module and qualified name,
+        so Enums that share a name do not collide. Register them up front to
+        load them in another process. Raises ParameterError if the tag is
+        taken by another class, as for an Enum class defined again.
+    """
+    codec = Codecs.get(cls)
+    if codec is None:
+        for base in cls.__mro__[1:]:
+            codec = Codecs.get(base)
+            if codec is not None and codec.cls is base:
+                Codecs[cls] = codec
+                break
+        else:
+            if issubclass(cls, enum.Enum) and cls.__members__:
+                codec = makeCodec(cls, "%s.%s" % (cls.__module__, cls.__qualname__))
+                checkName(codec)
+                Codecs[cls] = CodecNames[codec.name] = codec
+                EnumCodecs.add(cls) # only memos of cls depend on its codec
+                AttrKinds.pop(cls, None)
+                SafeKinds.pop(cls, None)
+            else:
+                codec = None
+    return codec
+
+def encodeValue(obj, segments=None, raw=False):
+    """ Returns tagged odict of obj from its codec. Raises TypeError if none"""
+    codec = Codecs.get(obj.__class__) or codecOf(obj.__class__)
+    if codec is None:
+        raise TypeError("%s is not JSON serializable" % type(obj))
+    return codec.encode(obj, segments=segments, raw=raw)
+
+BufferNames = {bytes: 'bytes', bytearray: 'bytearray', memoryview: 'memoryview'}
+
+def encodeBuffer(obj, segments=None, raw=False):
+    """ Returns odict tagged with "@type" that encodes buffer obj, one of
+        bytes, bytearray, memoryview or numpy array, or None if obj is not one.
+        The bytes go under "@data" as a base64 str, or as is when raw as for
+        MessagePack, or when segments is a list they are appended to it out of
+        band, without a copy, and "@segment" is their index in segments.
+        Arrays also get "dtype" and "shape" and memoryviews of other than
+        unsigned bytes get "format" and "shape". Raises TypeError for numpy
+        arrays of Python objects.
+    """
+    name = BufferNames.get(obj.__class__)
+    if name is None and isinstance(obj, (bytes, bytearray, memoryview)): # subclass
+        name = [BufferNames[cls] for cls in BufferNames if isinstance(obj, cls)][0]
+    if name is not None:
+        tagged = odict([("@type", name)])
+        if name == 'memoryview':
+            if not obj.c_contiguous:
+                obj = memoryview(obj.tobytes()).cast(obj.format, obj.shape)
+            if obj.format != 'B' or obj.ndim != 1:
+                tagged["format"] = obj.format
+                tagged["shape"] = list(obj.shape)
+    elif numpy is not None and isinstance(obj, numpy.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("numpy array of dtype object is not serializable")
+        tagged = odict([("@type", "ndarray"),
+                        ("dtype", obj.dtype.str),
+                        ("shape", list(obj.shape))])
+        obj = memoryview(numpy.ascontiguousarray(obj))
+    else:
+        return None
+
+    if segments is not None:
+        tagged["@segment"] = len(segments)
+        segments.append(obj)
+    elif raw:
+        tagged["@data"] = obj if name == 'bytes' else bytes(obj)
+    else:
+        tagged["@data"] = binascii.b2a_base64(obj, newline=False).decode('ascii')
+    return tagged
+
+def decodeBuffer(dct, segments=None):
+    """ Returns buffer from odict dct tagged by encodeBuffer. Out of band data
+        is looked up in segments. Avoids copies where the type allows, bytes
+        segments become bytes as is, memoryviews and numpy arrays are views of
+        the decoded bytes or segment so arrays are read only when these are.
+    """
+    name = dct["@type"]
+    if "@segment" in dct:
+        if segments is None:
+            raise ValueError("No segments for out of band buffer.")
+        data = segments[dct["@segment"]]
+    else:
+        data = dct["@data"]
+        if isinstance(data, str):
+            data = binascii.a2b_base64(data)
+
+    if name == 'bytes':
+        return data if type(data) is bytes else bytes(data)
+    if name == 'bytearray':
+        return bytearray(data)
+    if name == 'memoryview':
+        view = memoryview(data)
+        if "format" in dct:
+            view = view.cast('B').cast(dct["format"], dct["shape"])
+        return view
+    if name == 'ndarray':
+        if numpy is None:
+            raise ParameterError("Decoding numpy array requires numpy.")
+        return numpy.frombuffer(data, dtype=numpy.dtype(dct["dtype"])).reshape(dct["shape"])
+    raise ValueError("Unknown buffer type '%s'." % name)
+
+TaggedKeys = frozenset(['@type', '@data', '@segment'])
+BufferExtras = {'bytes': (frozenset(), ),
+                'bytearray': (frozenset(), ),
+                'memoryview': (frozenset(), frozenset(['format', 'shape'])),
+                'ndarray': (frozenset(['dtype', 'shape']), )} # metadata keys
+
+def bufferTagged(dct):
+    """ Returns True if odict dct is exactly the tagged form of encodeBuffer,
+        "@type" and one of "@data" or "@segment" plus the metadata keys of
+        its buffer type
+    """
+    if ("@data" in dct) == ("@segment" in dct):
+        return False
+    extras = frozenset(dct) - TaggedKeys
+    return extras in BufferExtras.get(dct["@type"], ())
+
+
+def sortedItems(items):
+    """ Returns list of items, sorted when orderable so sets serialize the same
+        every run
+    """
+    try:
+        return sorted(items)
+    except TypeError as ex:
+        return list(items)
+
+register(datetime.datetime, 'datetime', datetime.datetime.isoformat,
+         datetime.datetime.fromisoformat)
+register(datetime.date, 'date', datetime.date.isoformat, datetime.date.fromisoformat)
+register(datetime.time, 'time', datetime.time.isoformat, datetime.time.fromisoformat)
+register(datetime.timedelta, 'timedelta',
+         lambda delta: [delta.days, delta.seconds, delta.microseconds],
+         lambda data: datetime.timedelta(*data))
+register(decimal.Decimal, 'decimal', str, decimal.Decimal)
+register(uuid.UUID, 'uuid', str, uuid.UUID)
+register(set, 'set', sortedItems, set)
+register(frozenset, 'frozenset', sortedItems, frozenset)
+for cls, name in BufferNames.items():
+    addCodec(Codec(cls, name, encodeBuffer, decodeBuffer, match=bufferTagged, eager=False))
+if numpy is not None:
+    addCodec(Codec(numpy.ndarray, 'ndarray', encodeBuffer, decodeBuffer, match=bufferTagged,
+                   eager=False))
+
+def untag(dct):
+    """ Returns value decoded from odict dct if tagged by a Codec else dct"""
+    if "@type" in dct:
+        return decodeTagged(dct)
+    return dct
+
+def tagHook(pairs):
+    """ Method for object_pairs_hook. Returns odict of pairs or the value
+        it encodes, see register
+    """
+    return untag(odict(pairs))
+
+def segmenter(segments):
+    """ Returns default function that serializes brined objects like default
+        and buffers out of band by appending them to list segments, see
+        encodeBuffer. For example
+        segments = []
+        s = json.dumps(brinee, default=brining.segmenter(segments))
+    """
+    def default(obj):
+        """ Method for simplejson default with out of band buffers"""
+        if hasattr(obj, '_Brined'):
+            return obj._dumpable()
+        return encodeValue(obj, segments=segments)
+
+    return default
+
+def referencer():
+    """ Returns default function for one serialization of a graph of brined
+        objects that emits each brined object once. The first time an object
+        is seen its dumpable gets an "@id" key with an integer id unique to
+        the serialization. Every later time it is emitted as {"@ref": id}.
+        Shared objects are not repeated and cycles are serializable.
+        debrines rebuilds the shared objects and cycles.
+
+        Use a new referencer for each serialization with check_circular off
+        since the encoder marks objects passed to default, for example
+        json.dumps(brinees, default=brining.referencer(), check_circular=False)
+    """
+    ids = {} # ident keyed by id of object
+    seen = [] # keep objects alive so their ids are not reused
+
+    def default(obj):
+        """ Method for simplejson default with @id and @ref"""
+        if not hasattr(obj, '_Brined'):
+            return encodeValue(obj)
+
+        ident = ids.get(id(obj))
+        if ident is not None:
+            return odict([("@ref", ident)])
+        ident = ids[id(obj)] = len(ids) + 1
+        seen.append(obj)
+        dumpable = obj._dumpable()
+        dumpable["@id"] = ident
+        return dumpable
+
+    return default
+
+def dereference(self, dct):
+    """ Returns dct, the parsed serialization of referenced brined self, see
+        referencer, with each exact {"@ref": ident} replaced by the object
+        whose dict has "@id" ident. That object is self or one of its nested
+        brined attributes, so that update of self restores shared objects and
+        cycles in place. Other {"@ref": ident} dicts are left as is.
+    """
+    ids = Decoding().ids # same @id state as a Debriner decode
+    stack = [(self, dct)]
+    while stack: # dct is a tree so this ends even when objects form cycles
+        obj, items = stack.pop()
+        try:
+            ident = items.get('@id')
+            if ident is not None:
+                ids[ident] = obj
+        except TypeError as ex: # unhashable so not an @id
+            pass
+        for key, value in items.items():
+            if isinstance(value, dict) and not (len(value) == 1 and '@ref' in value):
+                attr = getattr(obj, key, None) if isinstance(key, str) else None
+                if attr is not None and attrKind(attr) == BRINED:
+                    stack.append((attr, value))
+
+    def swap(value):
+        if isinstance(value, dict):
+            if len(value) == 1 and '@ref' in value: # exact form only
+                try:
+                    return ids.get(value['@ref'], value)
+                except TypeError as ex: # unhashable so plain data
+                    return value
+            for key, item in value.items():
+                value[key] = swap(item)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = swap(item)
+        return value
+
+    return swap(dct)
 
 def dumps(self, indent=2, **kwa):
     """ Return json serialization as string"""
+    if self._Tracked and not kwa and not self._Referenced:
+        s = trackedDumps(self, indent=indent)
+        if s is not None:
+            return s
+
+    backend = getBackend(self._Backend)
     if 'default' in kwa: #allow override of default function
         default = kwa['default']
         del kwa['default']
+    elif self._Referenced:
+        default = referencer()
+        backend = getattr(backend, 'fallback', None) or backend # calls default once
+        kwa.setdefault('check_circular', False) # would reject revisits for @ref
+        return backend.dumps(default(self), default=default, indent=indent, **kwa)
     else:
         default = self._default
 
-    return json.dumps(self._dumpable(),
-                      default=default,
-                      indent=indent,
-                      **kwa)
+    return backend.dumps(self._dumpable(),
+                         default=default,
+                         indent=indent,
+                         **kwa)
+
+
+NoFragments = {} # stand in __dict__ of instances without one, never written
+
+def track(cls):
+    """ Hooks attribute assignment and deletion on cls so they mark the instance
+        dirty by dropping its cached serialized fragments, see trackedDumps.
+        Any existing __setattr__ and __delattr__ of cls are still called.
+    """
+    setter = cls.__setattr__
+    deleter = cls.__delattr__
+
+    def __setattr__(self, name, value):
+        setter(self, name, value)
+        fragments = getattr(self, '__dict__', NoFragments)
+        if '_Fragments' in fragments:
+            del fragments['_Fragments']
+
+    def __delattr__(self, name):
+        deleter(self, name)
+        fragments = getattr(self, '__dict__', NoFragments)
+        if '_Fragments' in fragments:
+            del fragments['_Fragments']
+
+    cls.__setattr__ = __setattr__
+    cls.__delattr__ = __delattr__
+    return cls
 
+def touch(self):
+    """ Mark self dirty. Needed after mutating an attribute value in place,
+        such as appending to a list, since only assignment is tracked.
+    """
+    fragments = getattr(self, '__dict__', NoFragments)
+    if '_Fragments' in fragments:
+        del fragments['_Fragments']
+
+def fragment(obj, indent, backend, raw):
+    """ Returns serialization of tracked brined obj at indent using JsonBackend
+        backend and raw, its RawJSON class, to splice in the serializations of
+        nested tracked brined objects.
+
+        The serialization is cached on obj in ._Fragments keyed by indent as
+        entry list [serialization, links, spliced, plan] where spliced is the
+        dumpable of obj with raw in place of nested tracked objects and links
+        is a list of [child, serialization, container, key, depth] lists, one
+        per raw, with the child serialization that was spliced into
+        container[key]. While obj is clean only children whose serialization
+        changed are respliced and only then is spliced serialized again.
+        plan is the DumpPlan of the class the entry was made with so the entry
+        is dropped once dumpPlan rebuilds it, as when _Keys is reassigned.
+        Nothing is cached when obj has no __dict__ or a nested brined object is
+        not tracked since its changes are unknown.
+    """
+    fragments = getattr(obj, '__dict__', NoFragments).get('_Fragments')
+    entry = fragments.get(indent) if fragments is not None else None
+    plan = dumpPlan(obj.__class__)
+    if entry is not None and entry[3] is plan:
+        changed = False
+        for link in entry[1]:
+            s = fragment(link[0], indent, backend, raw)
+            if s is not link[1]:
+                link[1] = s
+                link[2][link[3]] = raw(reindent(s, indent, link[4]))
+                changed = True
+        if changed:
+            entry[0] = backend.dumps(entry[2], default=obj._default, indent=indent)
+        return entry[0]
+
+    links = []
+    cacheable = [getattr(obj, '__dict__', None) is not None]
+
+    def splice(container, key, value, depth):
+        """ Sets container[key] to value with nested tracked brined objects
+            replaced by raw
+        """
+        if isinstance(value, (list, tuple)):
+            value = list(value)
+            for index, item in enumerate(value):
+                splice(value, index, item, depth + 1)
+        elif isinstance(value, dict):
+            value = odict(value)
+            for name, item in value.items():
+                splice(value, name, item, depth + 1)
+        elif attrKind(value) == BRINED:
+            if not value._Tracked:
+                cacheable[0] = False # its changes are unknown
+            else:
+                s = fragment(value, indent, backend, raw)
+                if (getattr(value, '__dict__', NoFragments).get('_Fragments')
+                        or NoFragments).get(indent) is None:
+                    cacheable[0] = False # value is not cacheable
+                links.append([value, s, container, key, depth])
+                value = raw(reindent(s, indent, depth))
+        container[key] = value
+
+    spliced = obj._dumpable()
+    for key, value in spliced.items():
+        splice(spliced, key, value, 1)
+    s = backend.dumps(spliced, default=obj._default, indent=indent)
+
+    if cacheable[0]:
+        if fragments is None:
+            fragments = obj.__dict__['_Fragments'] = {} # bypass tracking __setattr__
+        fragments[indent] = [s, links, spliced, plan]
+    return s
+
+def reindent(s, indent, depth):
+    """ Returns serialization s indented depth levels deeper for indent"""
+    if indent is None or not depth:
+        return s
+    pad = ' ' * indent if isinstance(indent, int) else indent
+    return s.replace('\n', '\n' + pad * depth)
+
+def trackedDumps(self, indent=2):
+    """ Returns json serialization of tracked brined self reusing the cached
+        serialized fragments of self and nested tracked brined objects that
+        have not been assigned to since they were last serialized.
+        Serializing a mostly unchanged tree only costs a walk of the clean
+        tracked objects plus serializing the changed ones.
+        Returns None when the backend has no RawJSON to splice fragments with.
+    """
+    backend = getBackend(self._Backend)
+    backend = getattr(backend, 'fallback', None) or backend # orjson output is identical
+    raw = getattr(backend.module, 'RawJSON', None)
+    if raw is None:
+        return None
+    return fragment(self, indent, backend, raw)
+
+
+class UpdatePlan(object):
+    """ Compiled per class update plan used by update
+
+        Caches the class level parts of the update key selection:
+            keyset, frozenset of public names from _Keys or None when
+                _Keys is None
+            slots, frozenset of public __slots__ names across the mro. Slots are
+                declared attributes so they are updated even when unset.
+            props, frozenset of public data descriptor property names other
+                than slots when _Propertied (limited to keyset when given)
+                else empty
+            hint, required class name hint when _Hinted else None
+            safed, extendable, copies of _Safed and _Extendable
+            compiled, generated update function when _Compiled and cls
+                has annotations else None, see compileUpdate
+
+        Membership tests against these sets replace the per call key lists
+        so update is linear in the number of items in the loaded dict.
+        updatePlan rebuilds the plan whenever any of _Keys, _Propertied,
+        _Safed, _Hinted, _Extendable, _Compiled is reassigned.
+    """
+    __slots__ = ('keys', 'propertied', 'safed', 'hinted', 'extendable', 'compiling',
+                 'keyset', 'slots', 'props', 'hint', 'compiled')
+
+    def __init__(self, cls):
+        self.keys = cls._Keys
+        self.propertied = cls._Propertied
+        self.safed = cls._Safed
+        self.hinted = cls._Hinted
+        self.extendable = cls._Extendable
+        self.compiling = cls._Compiled
+
+        if self.keys is None:
+            self.keyset = None
+        else:
+            self.keyset = frozenset(key for key in self.keys if not key.startswith('_'))
+
+        self.slots = frozenset(slotNames(cls))
+
+        if self.propertied:
+            props = [key for key in dir(cls) if not key.startswith('_') and
+                     key not in self.slots and
+                     inspect.isdatadescriptor(getattr(cls, key))]
+            if self.keyset is not None:
+                props = [key for key in props if key in self.keyset]
+            self.props = frozenset(props)
+        else:
+            self.props = frozenset()
+
+        self.hint = cls.__name__ if self.hinted else None
+        self.compiled = compileUpdate(cls, self) if self.compiling else None
+
+    def valid(self, cls):
+        """ Returns True if plan still matches the brining attributes of cls"""
+        return (self.keys is cls._Keys and
+                self.propertied == cls._Propertied and
+                self.safed == cls._Safed and
+                self.hinted == cls._Hinted and
+                self.extendable == cls._Extendable and
+                self.compiling == cls._Compiled)
+
+NoNames = frozenset() # stand in __dict__ for instances of slotted classes
+Tags = frozenset(['@class', '@id', '@ref', '@type']) # keys never made into attributes
+
+def updatePlan(cls):
+    """ Returns current UpdatePlan for brined class cls building a new one
+        when there is none or the cached one is stale.
+    """
+    plan = cls.__dict__.get('_UpdatePlan')
+    if plan is None or not plan.valid(cls):
+        plan = UpdatePlan(cls)
+        cls._UpdatePlan = plan
+    return plan
 
 def update(self, dct):
     """ Update attributes from items in dict dct. If an attribute of self does
@@ -302,70 +1458,645 @@ def update(self, dct):
         Private attributes and functions are always excluded from the update.
 
     """
-    if self._Hinted:
-        if dct.get("@class") != self.__class__.__name__:
+    plan = updatePlan(self.__class__)
+    if plan.compiled is not None:
+        return plan.compiled(self, dct)
+
+    if plan.hint is not None:
+        if dct.get("@class") != plan.hint:
             raise TypeError("Class hint '%s' does not match class name '%s'."
-                            % (dct.get("@class"), self.__class__.__name__))
-
-    if self._Keys == None:
-        keys = list(self.__dict__.keys())
-    else: #filter on both self._Keys and self.__dict__
-        keys = [key for key in self._Keys if key in self.__dict__]
-    if self._Propertied:
-        props = [key for key in dir(self) if hasattr(self.__class__, key) and
-                 inspect.isdatadescriptor(getattr(self.__class__, key)) ]
-        if props:
-            if self._Keys is None:
-                keys.extend(props)
-            else:
-                keys.extend([key for key in props if key in self._Keys])
+                            % (dct.get("@class"), plan.hint))
 
-    if self._Extendable:
-        extends = [key for key in dct if not hasattr(self, key) and key != '@class']
-        if extends:
-            if self._Keys is None:
-                keys.extend(extends)
-            else:
-                keys.extend([key for key in extends if key in self._Keys])
+    names = getattr(self, '__dict__', NoNames) # preexisting instance attributes
+    keyset = plan.keyset
+    slots = plan.slots
+    props = plan.props
 
     for key, value in dct.items():
-        if key not in keys:
-            continue #skip not preexisting instance attribute
         if key.startswith('_'):
-            continue #skip private attribute if not privily
+            continue #skip private attribute
+        if keyset is not None and key not in keyset:
+            continue #skip not in _Keys
+
+        if key not in names and key not in slots and key not in props:
+            if (plan.extendable and names is not NoNames and key not in Tags and
+                    not hasattr(self, key)): # no new attributes without __dict__
+                setattr(self, key, value) #new attribute
+            continue #skip not preexisting instance attribute
 
         try:
             attr = getattr(self, key)
         except AttributeError as ex:
-            if self._Extendable:
+            if plan.extendable or key in slots: # new or unset slot attribute
                 setattr(self, key, value)  #update attribute
             continue #otherwise skip
 
-        if inspect.isroutine(attr): #skip methods
+        kind = attrKind(attr)
+        if kind == ROUTINE: #skip methods
             continue
 
-        if hasattr(attr, '_Brined'): #recursively load
+        if kind == BRINED and isinstance(value, dict): #recursively load
             attr._update(value)
             continue
 
-        if not hasattr(attr, '_Brined') and self._Safed:
-            try: #last resort, skip attributes that are not json serializible
-                temp = json.dumps(attr)
-            except TypeError as ex:
-                continue
+        if plan.safed and not brineSafe(attr):
+            continue #skip attributes that are not json serializible
 
         setattr(self, key, value)  #update attribute
     return self
 
 
+Missing = object() # sentinel for missing items
+
+SCALAR = 0 # annotated field types for compiled serializers
+BRINE = 1
+GENERIC = 2
+
+def annotatedTypes(cls):
+    """ Returns odict of annotation keyed by public annotated attribute name
+        across the mro of cls, base classes first. String annotations are
+        resolved when possible and Optional[x] is reduced to x.
+        ClassVar annotations are excluded.
+    """
+    annotations = odict()
+    for base in reversed(cls.__mro__):
+        for name, annotation in base.__dict__.get('__annotations__', {}).items():
+            if not name.startswith('_'):
+                annotations[name] = annotation
+    try: # resolve string annotations when possible
+        hints = typing.get_type_hints(cls)
+    except Exception as ex:
+        hints = {}
+
+    types = odict()
+    for name, annotation in annotations.items():
+        annotation = hints.get(name, annotation)
+        if typing.get_origin(annotation) is typing.ClassVar:
+            continue
+        if typing.get_origin(annotation) is typing.Union: # Optional[x]
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(args) == 1:
+                annotation = args[0]
+        types[name] = annotation
+    return types
+
+def annotatedFields(cls):
+    """ Returns odict of field type keyed by public annotated attribute name
+        across the mro of cls, base classes first. Field type is one of
+        SCALAR (int, float, str, bool, optionally None), BRINE (brined class,
+        optionally None) or GENERIC (anything else).
+        ClassVar annotations are excluded.
+    """
+    fields = odict()
+    for name, annotation in annotatedTypes(cls).items():
+        if annotation in (int, float, str, bool):
+            fields[name] = SCALAR
+        elif isinstance(annotation, type) and hasattr(annotation, '_Brined'):
+            fields[name] = BRINE
+        else:
+            fields[name] = GENERIC
+    return fields
+
+def compiledNames(cls, fields, props):
+    """ Returns tuple of names a compiled serializer of cls handles in order
+        or None when cls has no annotated fields to compile.
+        With _Keys the public _Keys names in order else the sorted
+        annotated fields and props.
+    """
+    if not fields:
+        return None
+    if cls._Keys is not None:
+        return tuple(key for key in cls._Keys if not key.startswith('_'))
+    return tuple(sorted(set(fields) | set(props)))
+
+def compileSource(source, name, cls):
+    """ Returns function name defined by exec of source for class cls"""
+    namespace = dict(odict=odict,
+                     Missing=Missing,
+                     attrKind=attrKind,
+                     brineSafe=brineSafe,
+                     Codecs=Codecs,
+                     BRINED=BRINED,
+                     ROUTINE=ROUTINE,
+                     CODEC=CODEC)
+    code = compile(source, "<brining %s %s>" % (name, cls.__name__), "exec")
+    exec(code, namespace)
+    function = namespace[name]
+    function.__source__ = source # keep for inspection and debugging
+    return function
+
+def attrSource(name):
+    """ Returns source expression of attribute name of self"""
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return "self.%s" % name
+    return "getattr(self, %r)" % name
+
+def compileDumpable(cls, plan):
+    """ Returns dumpable function generated for brined class cls from its
+        annotations and dump plan, or None when cls has no annotations.
+
+        Each field is read directly. Fields annotated int, float, str or bool
+        are copied with no routine, brined or safe checks.
+        Fields annotated with a brined class are only checked for deep.
+        Other fields get the same checks as the generic dumpable.
+        Unset fields are skipped.
+    """
+    fields = annotatedFields(cls)
+    names = compiledNames(cls, fields, plan.props)
+    if names is None:
+        return None
+
+    lines = ["def dumpable(self, deep=False):",
+             "    dumpable = odict()"]
+    for name in names:
+        kind = fields.get(name, GENERIC)
+        lines.extend(["    try:",
+                      "        value = %s" % attrSource(name),
+                      "    except AttributeError:",
+                      "        pass",
+                      "    else:"])
+        if kind == BRINE:
+            lines.extend(["        if deep and attrKind(value) == BRINED:",
+                          "            value = value._dumpable()"])
+        elif kind == GENERIC:
+            lines.extend(["        kind = attrKind(value)",
+                          "        if kind == ROUTINE:",
+                          "            pass",
+                          "        elif kind == BRINED:",
+                          "            dumpable[%r] = value._dumpable() if deep else value" % name,
+                          "        elif kind == CODEC:",
+                          "            dumpable[%r] = Codecs[value.__class__].encode(value)" % name])
+            if plan.safed:
+                lines.extend(["        elif brineSafe(value):",
+                              "            dumpable[%r] = value" % name])
+            else:
+                lines.extend(["        else:",
+                              "            dumpable[%r] = value" % name])
+            continue
+        lines.append("        dumpable[%r] = value" % name)
+    if plan.hint is not None:
+        lines.append("    dumpable['@class'] = %r" % plan.hint)
+    lines.append("    return dumpable")
+    return compileSource("\n".join(lines) + "\n", "dumpable", cls)
+
+def compileUpdate(cls, plan):
+    """ Returns update function generated for brined class cls from its
+        annotations and update plan, or None when cls has no annotations or
+        is _Extendable.
+
+        Annotated fields are declared attributes so like slots they are
+        updated even when unset on self. Fields annotated int, float, str or
+        bool are assigned directly. Fields holding brined objects are updated
+        recursively. Other fields get the same checks as the generic update.
+    """
+    if plan.extendable:
+        return None
+    fields = annotatedFields(cls)
+    names = compiledNames(cls, fields, plan.props)
+    if names is None:
+        return None
+
+    lines = ["def update(self, dct):"]
+    if plan.hint is not None:
+        lines.extend(["    if dct.get('@class') != %r:" % plan.hint,
+                      "        raise TypeError(\"Class hint '%s' does not match class name '%s'.\"",
+                      "                        %% (dct.get('@class'), %r))" % plan.hint])
+    lines.append("    get = dct.get")
+    for name in names:
+        kind = fields.get(name, GENERIC)
+        lines.extend(["    value = get(%r, Missing)" % name,
+                      "    if value is not Missing:"])
+        if kind == SCALAR:
+            lines.append("        %s = value" % attrSource(name))
+            continue
+        lines.extend(["        try:",
+                      "            attr = %s" % attrSource(name),
+                      "        except AttributeError:",
+                      "            %s = value" % attrSource(name),
+                      "        else:",
+                      "            kind = attrKind(attr)",
+                      "            if kind == BRINED and isinstance(value, dict):",
+                      "                attr._update(value)"])
+        if kind == GENERIC:
+            lines.extend(["            elif kind == ROUTINE:",
+                          "                pass"])
+            if plan.safed:
+                lines.extend(["            elif brineSafe(attr):",
+                              "                %s = value" % attrSource(name)])
+                continue
+        lines.extend(["            else:",
+                      "                %s = value" % attrSource(name)])
+    lines.append("    return self")
+    return compileSource("\n".join(lines) + "\n", "update", cls)
+
 def loads(self, s):
     """ Deserialize s into dict  and update attributes of self with
         items from this dict
         Returns self
     """
-    dct = json.loads(s, object_pairs_hook=odict)
+    dct = getBackend(self._Backend).loads(s, hook=tagHook)
+    if self._Referenced:
+        dct = dereference(self, dct)
+    return self._update(dct)
+
+def pyPackb(obj, default=None):
+    """ Returns MessagePack serialization of obj as bytes. Pure Python fallback
+        of msgpack.packb(obj, default=default, use_bin_type=True) with the same
+        output. Supports None, bool, int, float, str, bytes, bytearray,
+        memoryview, list, tuple and dict. Other objects are replaced by
+        default(obj) or raise TypeError.
+    """
+    buf = bytearray()
+    pack = struct.pack
+
+    def put(obj, depth):
+        if depth > 512:
+            raise ValueError("Nesting too deep to pack.")
+        kind = obj.__class__
+        if obj is None:
+            buf.append(0xc0)
+        elif kind is bool:
+            buf.append(0xc3 if obj else 0xc2)
+        elif kind is int:
+            if obj >= 0:
+                if obj < 0x80:
+                    buf.append(obj)
+                elif obj <= 0xff:
+                    buf.extend(pack(">BB", 0xcc, obj))
+                elif obj <= 0xffff:
+                    buf.extend(pack(">BH", 0xcd, obj))
+                elif obj <= 0xffffffff:
+                    buf.extend(pack(">BI", 0xce, obj))
+                elif obj <= 0xffffffffffffffff:
+                    buf.extend(pack(">BQ", 0xcf, obj))
+                else:
+                    raise OverflowError("Integer value out of range")
+            elif -0x20 <= obj:
+                buf.append(obj & 0xff)
+            elif -0x80 <= obj:
+                buf.extend(pack(">Bb", 0xd0, obj))
+            elif -0x8000 <= obj:
+                buf.extend(pack(">Bh", 0xd1, obj))
+            elif -0x80000000 <= obj:
+                buf.extend(pack(">Bi", 0xd2, obj))
+            elif -0x8000000000000000 <= obj:
+                buf.extend(pack(">Bq", 0xd3, obj))
+            else:
+                raise OverflowError("Integer value out of range")
+        elif kind is float:
+            buf.extend(pack(">Bd", 0xcb, obj))
+        elif kind is str:
+            data = obj.encode('utf-8')
+            size = len(data)
+            if size < 32:
+                buf.append(0xa0 | size)
+            elif size <= 0xff:
+                buf.extend(pack(">BB", 0xd9, size))
+            elif size <= 0xffff:
+                buf.extend(pack(">BH", 0xda, size))
+            else:
+                buf.extend(pack(">BI", 0xdb, size))
+            buf.extend(data)
+        elif kind in (bytes, bytearray, memoryview):
+            size = obj.nbytes if kind is memoryview else len(obj)
+            if size <= 0xff:
+                buf.extend(pack(">BB", 0xc4, size))
+            elif size <= 0xffff:
+                buf.extend(pack(">BH", 0xc5, size))
+            else:
+                buf.extend(pack(">BI", 0xc6, size))
+            buf.extend(obj)
+        elif isinstance(obj, (list, tuple)):
+            size = len(obj)
+            if size < 16:
+                buf.append(0x90 | size)
+            elif size <= 0xffff:
+                buf.extend(pack(">BH", 0xdc, size))
+            else:
+                buf.extend(pack(">BI", 0xdd, size))
+            for item in obj:
+                put(item, depth + 1)
+        elif isinstance(obj, dict):
+            size = len(obj)
+            if size < 16:
+                buf.append(0x80 | size)
+            elif size <= 0xffff:
+                buf.extend(pack(">BH", 0xde, size))
+            else:
+                buf.extend(pack(">BI", 0xdf, size))
+            for key, value in obj.items():
+                put(key, depth + 1)
+                put(value, depth + 1)
+        elif isinstance(obj, int):
+            put(int(obj), depth)
+        elif isinstance(obj, float):
+            put(float(obj), depth)
+        elif isinstance(obj, str):
+            put(str(obj), depth)
+        elif default is not None:
+            put(default(obj), depth + 1)
+        else:
+            raise TypeError("%s is not MessagePack serializable" % type(obj))
+
+    put(obj, 0)
+    return bytes(buf)
+
+def pyUnpackb(data, hook=odict):
+    """ Returns deserialization of MessagePack bytes data with maps passed as
+        lists of key value duples to hook. Pure Python fallback of
+        msgpack.unpackb(data, object_pairs_hook=hook, raw=False,
+        strict_map_key=False). Raises ValueError on malformed data.
+    """
+    view = memoryview(data)
+    unpack = struct.unpack_from
+    end = len(view)
+
+    def need(offset, size):
+        if offset + size > end:
+            raise ValueError("Truncated MessagePack data.")
+
+    def take(offset):
+        """ Returns duple (obj, offset after obj)"""
+        need(offset, 1)
+        code = view[offset]
+        offset += 1
+        if code <= 0x7f:
+            return (code, offset)
+        if code >= 0xe0:
+            return (code - 0x100, offset)
+        if 0xa0 <= code <= 0xbf:
+            size = code & 0x1f
+        elif 0x90 <= code <= 0x9f:
+            return array(code & 0x0f, offset)
+        elif 0x80 <= code <= 0x8f:
+            return mapping(code & 0x0f, offset)
+        elif code == 0xc0:
+            return (None, offset)
+        elif code == 0xc2:
+            return (False, offset)
+        elif code == 0xc3:
+            return (True, offset)
+        elif code in Fixed:
+            fmt, size = Fixed[code]
+            need(offset, size)
+            return (unpack(fmt, view, offset)[0], offset + size)
+        elif code in Sized:
+            fmt, size, kind = Sized[code]
+            need(offset, size)
+            count = unpack(fmt, view, offset)[0]
+            offset += size
+            if kind == 'array':
+                return array(count, offset)
+            if kind == 'map':
+                return mapping(count, offset)
+            need(offset, count)
+            chunk = view[offset:offset + count]
+            if kind == 'bin':
+                return (bytes(chunk), offset + count)
+            return (str(chunk, 'utf-8'), offset + count)
+        else:
+            raise ValueError("Unsupported MessagePack type 0x%02x." % code)
+        need(offset, size)
+        return (str(view[offset:offset + size], 'utf-8'), offset + size)
+
+    def array(count, offset):
+        items = []
+        for i in range(count):
+            item, offset = take(offset)
+            items.append(item)
+        return (items, offset)
+
+    def mapping(count, offset):
+        pairs = []
+        for i in range(count):
+            key, offset = take(offset)
+            value, offset = take(offset)
+            pairs.append((key, value))
+        return (hook(pairs) if hook is not None else dict(pairs), offset)
+
+    obj, offset = take(0)
+    if offset != end:
+        raise ValueError("Extra data after MessagePack object.")
+    return obj
+
+Fixed = {0xcc: (">B", 1), 0xcd: (">H", 2), 0xce: (">I", 4), 0xcf: (">Q", 8),
+         0xd0: (">b", 1), 0xd1: (">h", 2), 0xd2: (">i", 4), 0xd3: (">q", 8),
+         0xca: (">f", 4), 0xcb: (">d", 8)} # fixed size MessagePack scalars
+Sized = {0xd9: (">B", 1, 'str'), 0xda: (">H", 2, 'str'), 0xdb: (">I", 4, 'str'),
+         0xc4: (">B", 1, 'bin'), 0xc5: (">H", 2, 'bin'), 0xc6: (">I", 4, 'bin'),
+         0xdc: (">H", 2, 'array'), 0xdd: (">I", 4, 'array'),
+         0xde: (">H", 2, 'map'), 0xdf: (">I", 4, 'map')} # length prefixed types
+
+def packb(obj, default=None):
+    """ Returns MessagePack serialization of obj as bytes with msgpack when
+        installed otherwise the pure Python pyPackb
+    """
+    if msgpack is not None:
+        return msgpack.packb(obj, default=default, use_bin_type=True)
+    return pyPackb(obj, default=default)
+
+def unpackb(data, hook=odict):
+    """ Returns deserialization of MessagePack bytes data with hook as
+        object_pairs_hook, with msgpack when installed otherwise pyUnpackb
+    """
+    if msgpack is not None:
+        try:
+            return msgpack.unpackb(data,
+                                   object_pairs_hook=hook,
+                                   raw=False,
+                                   strict_map_key=False)
+        except (msgpack.UnpackException, msgpack.ExtraData) as ex:
+            raise ValueError(str(ex))
+    return pyUnpackb(data, hook=hook)
+
+PackScalars = frozenset([str, int, float, bool, bytes, type(None)]) # never tagged
+
+def tagBuffers(obj):
+    """ Returns obj with bytearray and memoryview values, also in nested lists,
+        tuples and dicts, replaced by their raw tagged form from encodeBuffer.
+        MessagePack packs these natively as bin so without tags they would
+        unpack as bytes. Containers are only copied when something is tagged.
+    """
+    kind = obj.__class__
+    if kind in PackScalars:
+        return obj
+    if kind is bytearray or kind is memoryview:
+        return encodeBuffer(obj, raw=True)
+    if isinstance(obj, dict):
+        tagged = None
+        for key, value in obj.items():
+            item = tagBuffers(value)
+            if item is not value:
+                if tagged is None:
+                    tagged = obj.copy()
+                tagged[key] = item
+        return obj if tagged is None else tagged
+    if isinstance(obj, (list, tuple)):
+        tagged = None
+        for i, value in enumerate(obj):
+            item = tagBuffers(value)
+            if item is not value:
+                if tagged is None:
+                    tagged = list(obj)
+                tagged[i] = item
+        return obj if tagged is None else tagged
+    if isinstance(obj, (bytearray, memoryview)): # subclass
+        return encodeBuffer(obj, raw=True)
+    return obj
+
+def packable(obj):
+    """ Method for MessagePack default. Returns dumpable of brined obj or
+        tagged form of obj with a Codec, with buffers tagged by tagBuffers
+    """
+    if not hasattr(obj, '_Brined'):
+        codec = Codecs.get(obj.__class__) or codecOf(obj.__class__)
+        if codec is None:
+            raise TypeError("%s is not MessagePack serializable" % type(obj))
+        return tagBuffers(codec.encode(obj, raw=True))
+
+    return tagBuffers(obj._dumpable())
+
+def packs(self):
+    """ Returns MessagePack serialization of self as bytes with the same keys
+        and "@class" hint, if any, as dumps
+    """
+    return packb(packable(self), default=packable)
+
+def unpacks(self, data):
+    """ Deserialize MessagePack bytes data and update attributes of self
+        with its items, see packs
+        Returns self
+    """
+    dct = unpackb(data, hook=tagHook)
+    if self._Referenced:
+        dct = dereference(self, dct)
     return self._update(dct)
 
+StructCodes = {bool: '?', int: 'q', float: 'd'} # struct format codes of field types
+
+class StructLayout(object):
+    """ StructLayout
+
+        Fixed binary record layout of a brined class with layout='struct'.
+        Fields and their order come from _Keys if set, otherwise from the
+        class annotations in declaration order. Field types come from the
+        annotations or else from the attributes of a default instance,
+        cls(). Fields must be bool, int (64 bit) or float (double).
+        Records are little endian with no padding, see .struct.size.
+
+        Attributes:
+            keys, _Keys of class when built, to detect a change
+            names, tuple of field names in order
+            struct, struct.Struct of a record
+            get, function of one argument returning tuple of field values
+    """
+    __slots__ = ('keys', 'names', 'struct', 'get')
+
+    def __init__(self, cls):
+        self.keys = cls._Keys
+        types = annotatedTypes(cls)
+        if cls._Keys is not None:
+            names = [key for key in cls._Keys if not key.startswith('_')]
+        else:
+            names = list(types)
+        if not names:
+            raise ParameterError("No fields for struct layout of '%s'." % cls.__name__)
+        missing = [name for name in names if name not in types]
+        if missing: # take types from a default instance
+            instance = cls()
+            for name in missing:
+                types[name] = type(getattr(instance, name))
+
+        codes = []
+        for name in names:
+            code = StructCodes.get(types[name])
+            if code is None:
+                raise ParameterError("Field '%s' of '%s' is not bool, int or float."
+                                     % (name, cls.__name__))
+            codes.append(code)
+        self.names = tuple(names)
+        self.struct = struct.Struct('<' + ''.join(codes))
+        getter = operator.attrgetter(*names)
+        self.get = getter if len(names) > 1 else lambda obj: (getter(obj), )
+
+def structLayout(cls):
+    """ Returns StructLayout of brined class cls rebuilt if _Keys changed.
+        Raises ParameterError if cls is not brined with layout='struct'.
+    """
+    layout = cls.__dict__.get('_StructLayout')
+    if layout is None or layout.keys is not cls._Keys:
+        if getattr(cls, '_Layout', None) != 'struct':
+            raise ParameterError("Class '%s' not brined with layout='struct'."
+                                 % cls.__name__)
+        layout = StructLayout(cls)
+        cls._StructLayout = layout
+    return layout
+
+def pack(self):
+    """ Returns fixed size binary record of self as bytes, see StructLayout"""
+    layout = structLayout(self.__class__)
+    return layout.struct.pack(*layout.get(self))
+
+def unpack(self, data, offset=0):
+    """ Sets fields of self from binary record at offset in data, a bytes like
+        object, see StructLayout
+        Returns self
+    """
+    layout = structLayout(self.__class__)
+    for name, value in zip(layout.names, layout.struct.unpack_from(data, offset)):
+        setattr(self, name, value)
+    return self
+
+def pack_many(brinees, buffer=None, offset=0):
+    """ Packs brinees, a sequence of brined objects of one class with
+        layout='struct', as consecutive fixed size records into buffer at
+        offset. buffer is a writable bytes like object such as bytearray,
+        memoryview or mmap, None means a new bytearray of the exact size.
+        Returns buffer.
+        Record i is at offset + i * cls._StructLayout.struct.size so files
+        of records can be read with random access, see unpack_many.
+    """
+    if not isinstance(brinees, (list, tuple)):
+        brinees = list(brinees)
+    if not brinees:
+        return buffer if buffer is not None else bytearray()
+    layout = structLayout(brinees[0].__class__)
+    size = layout.struct.size
+    if buffer is None:
+        buffer = bytearray(offset + size * len(brinees))
+    elif len(buffer) < offset + size * len(brinees):
+        raise ParameterError("Buffer too small for %d records." % len(brinees))
+    into = layout.struct.pack_into
+    get = layout.get
+    for brinee in brinees:
+        into(buffer, offset, *get(brinee))
+        offset += size
+    return buffer
+
+def unpack_many(buffer, cls, start=0, count=None, offset=0):
+    """ Returns list of count new instances of brined class cls with
+        layout='struct' from the fixed size records starting with record
+        index start after offset bytes in buffer, a bytes like object.
+        count None means all remaining whole records.
+    """
+    layout = structLayout(cls)
+    size = layout.struct.size
+    begin = offset + start * size
+    available = max(0, (len(buffer) - begin) // size)
+    if count is None:
+        count = available
+    elif count > available:
+        raise ParameterError("Buffer holds %d records, not %d." % (available, count))
+    view = memoryview(buffer)[begin:begin + count * size]
+    names = layout.names
+    brinees = []
+    for values in layout.struct.iter_unpack(view):
+        brinee = cls()
+        for name, value in zip(names, values):
+            setattr(brinee, name, value)
+        brinees.append(brinee)
+    return brinees
+
 def ocfn(filename, openMode = 'r+'):
     """ Atomically open or create file from filename.
 
@@ -383,21 +2114,101 @@ def ocfn(filename, openMode = 'r+'):
             raise
     return newfile
 
-def dump(self, filename = "", indent=2, **kwa):
-    """ Json serialize self save to file filename"""
+Durabilities = ('none', 'flush', 'fsync', 'fsync+dir') # durability levels of dumps
+"""
+    Durability levels of file dumps, from fastest to safest
+        'none', leave buffered data to be written when the file is closed
+        'flush', flush python buffers to the operating system
+        'fsync', flush and fsync the file to storage
+        'fsync+dir', fsync the file and its directory so a newly created or
+            atomically replaced file name is also durable
+"""
+
+def syncFile(f, durability='fsync'):
+    """ Flush and or fsync file object f as required by durability"""
+    if durability == 'none':
+        return
+    f.flush()
+    if durability != 'flush':
+        os.fsync(f.fileno())
+
+def syncDir(path):
+    """ fsync directory path so new or replaced entries in it are durable.
+        Only supported on posix, elsewhere does nothing.
+    """
+    if os.name != 'posix':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+@contextlib.contextmanager
+def durableOpen(filename, atomic=False, durability='fsync'):
+    """ Context manager that yields text file object open for writing filename
+        and makes what was written durable per durability on exit.
+
+        If atomic then write to a temporary file in the same directory and
+        os.replace filename with it on successful exit so a crash or error
+        mid write leaves the previous filename contents intact. The temporary
+        file takes the permissions of an existing filename.
+        Otherwise filename is truncated and written in place.
+    """
+    if durability not in Durabilities:
+        raise ParameterError("Invalid durability '%s'." % durability)
+    directory = os.path.dirname(os.path.abspath(filename))
+
+    if not atomic:
+        with ocfn(filename, "w+") as f:
+            yield f
+            syncFile(f, durability)
+    else:
+        temp = os.path.join(directory, ".%s.%s.tmp" % (os.path.basename(filename),
+                                                      uuid.uuid4().hex[:12]))
+        f = os.fdopen(os.open(temp, os.O_EXCL | os.O_CREAT | os.O_WRONLY, 436), "w") # 436 == octal 0664
+        try:
+            with f:
+                try:
+                    os.chmod(temp, stat.S_IMODE(os.stat(filename).st_mode))
+                except OSError as ex: # no existing file to take mode from
+                    pass
+                yield f
+                syncFile(f, durability)
+            os.replace(temp, filename)
+        except BaseException:
+            try:
+                os.remove(temp)
+            except OSError as ex:
+                pass
+            raise
+
+    if durability == 'fsync+dir':
+        syncDir(directory)
+
+def dump(self, filename = "", indent=2, atomic=False, durability='fsync', **kwa):
+    """ Json serialize self save to file filename
+
+        If atomic then write a temporary file and replace filename with it so
+        a crash mid dump cannot leave filename truncated.
+        durability is one of Durabilities, default 'fsync'
+    """
     if not filename:
         raise ParameterError("No filename to Dump to:")
 
+    if self._Referenced or (self._Tracked and not kwa):
+        with durableOpen(filename, atomic=atomic, durability=durability) as f:
+            f.write(self._dumps(indent=indent, **kwa))
+        return
+
     if 'default' in kwa: #allow override of default function
         default = kwa['default']
         del kwa['default']
     else:
         default = self._default
 
-    with self._ocfn(filename, "w+") as f:
-        json.dump(self, f, indent=indent, default=default, **kwa)
-        f.flush()
-        os.fsync(f.fileno())
+    with durableOpen(filename, atomic=atomic, durability=durability) as f:
+        getBackend(self._Backend).dump(self, f, indent=indent, default=default, **kwa)
 
 def load(self, filename = ""):
     """ Loads json object from filename, returns unjsoned object"""
@@ -405,77 +2216,1419 @@ def load(self, filename = ""):
         raise ParameterError("Empty filename to load.")
 
     with self._ocfn(filename) as f:
-        dct = json.load(f, object_pairs_hook=odict)
-        return self._update(dct)
+        dct = getBackend(self._Backend).load(f, hook=tagHook)
+    if self._Referenced:
+        dct = dereference(self, dct)
+    return self._update(dct)
+
+AsyncWorkers = 4 # max workers of the default executor of async file I/O
+AsyncExecutor = None # executor of async file I/O, created on first use
+AsyncOwned = None # executor created here, so shut down here when replaced
+
+def asyncExecutor(executor=None, workers=None):
+    """ Returns executor used by the async functions to offload blocking file
+        writes, reads and fsync from the event loop thread.
+
+        If executor is given it becomes the default. Otherwise when there is
+        no default, or workers is given, a new bounded ThreadPoolExecutor with
+        workers (default AsyncWorkers) threads becomes the default and any
+        previous one created here is shut down without waiting, so its pending
+        work still completes but its threads do not leak.
+        The caller owns any executor it passes in and shuts it down.
+    """
+    global AsyncExecutor, AsyncWorkers, AsyncOwned
+    if executor is not None:
+        AsyncExecutor = executor
+    elif AsyncExecutor is None or workers is not None:
+        if workers is not None:
+            AsyncWorkers = workers
+        if AsyncOwned is not None:
+            AsyncOwned.shutdown(wait=False)
+        AsyncExecutor = AsyncOwned = concurrent.futures.ThreadPoolExecutor(
+                max_workers=AsyncWorkers, thread_name_prefix="brining")
+    return AsyncExecutor
+
+def writeFile(filename, s, atomic=False, durability='fsync'):
+    """ Writes str s to file filename per atomic and durability,
+        see durableOpen. Blocking, run in an executor by the async functions.
+    """
+    with durableOpen(filename, atomic=atomic, durability=durability) as f:
+        f.write(s)
+
+def readFile(filename):
+    """ Returns contents of file filename as str.
+        Blocking, run in an executor by the async functions.
+    """
+    with ocfn(filename) as f:
+        return f.read()
+
+async def adump(self, filename="", indent=2, executor=None, atomic=False,
+                durability='fsync', **kwa):
+    """ Coroutine that Json serializes self on the event loop then saves to file
+        filename in executor so the write and fsync do not block the loop.
+        executor None means the default from asyncExecutor().
+        atomic and durability are as for dump.
+    """
+    if not filename:
+        raise ParameterError("No filename to Dump to:")
+
+    s = self._dumps(indent=indent, **kwa)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor if executor is not None else asyncExecutor(),
+                               functools.partial(writeFile,
+                                                 filename,
+                                                 s,
+                                                 atomic=atomic,
+                                                 durability=durability))
+
+async def aload(self, filename="", executor=None):
+    """ Coroutine that reads file filename in executor then deserializes it on
+        the event loop and updates self. Returns self.
+        executor None means the default from asyncExecutor().
+    """
+    if not filename:
+        raise ParameterError("Empty filename to load.")
+
+    loop = asyncio.get_running_loop()
+    s = await loop.run_in_executor(executor if executor is not None else asyncExecutor(),
+                                   readFile, filename)
+    return self._loads(s)
+
+def framing(format='jsonl', indent=None):
+    """ Returns quadruple (head, separator, tail, pad) of strings that frame
+        serialized items of format 'jsonl' or 'array' with indent. pad is the
+        indentation of array items or None.
+    """
+    if format not in ('jsonl', 'array'):
+        raise ParameterError("Invalid format '%s'." % format)
+    if format == 'jsonl':
+        return ('', '\n', '\n', None)
+    if indent is None:
+        return ('[', ', ', ']', None)
+    pad = ' ' * indent if isinstance(indent, int) else indent
+    return ('[\n' + pad, ',\n' + pad, '\n]', pad)
+
+def dumpChunk(brinees, separator, pad, backend, indent, kwa):
+    """ Returns duple (serialization, count) of list brinees joined by
+        separator with items nested by pad. Runs in pool workers of dump_many
+        so backend is the registry name of the backend.
+    """
+    encode = getBackend(backend).encoder(indent=indent, **kwa)
+    if pad is None:
+        return (separator.join([encode(brinee) for brinee in brinees]), len(brinees))
+    return (separator.join([encode(brinee).replace('\n', '\n' + pad)
+                            for brinee in brinees]), len(brinees))
+
+def poolExecutor(workers):
+    """ Returns new executor of workers for dump_many. Threads when the
+        interpreter runs without the GIL, otherwise processes.
+    """
+    if hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled():
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+
+def dump_many(brinees,
+              destination,
+              format='jsonl',
+              indent=None,
+              atomic=False,
+              durability='flush',
+              buffering=65536,
+              backend=None,
+              workers=None,
+              chunk=1024,
+              executor=None,
+              **kwa):
+    """ Json serialize brinees, an iterable such as a generator of brined
+        objects, and incrementally write them to destination, a filename or
+        a file object open for writing. Returns count of objects written.
+
+        Memory is bounded by buffering characters plus one serialized object
+        no matter how many objects are written.
+
+        format is one of:
+            'jsonl', one compact JSON object per line (JSON Lines), indent ignored
+            'array', JSON array identical to
+                json.dumps(list(brinees), default=default, indent=indent)
+
+        durability is one of Durabilities, applied once after the last
+        object. If atomic and destination is a filename then write a temporary
+        file and replace destination with it at the end, see durableOpen.
+        backend is JsonBackend or name of backend, None means global default.
+
+        If workers is more than 1 or executor is given then brinees are split
+        into lists of chunk objects serialized in parallel by executor, default
+        a new poolExecutor(workers), and written in order. At most two chunks
+        per worker are in flight so memory stays bounded. Process workers need
+        brinees to be picklable and backend to be in Backends.
+
+        Other keyword arguments are passed to the JSON encoder.
+    """
+    if not destination:
+        raise ParameterError("No destination to Dump to:")
+
+    if 'default' not in kwa:
+        kwa['default'] = default
+    if format == 'jsonl':
+        indent = None
+    head, separator, tail, pad = framing(format, indent)
+    backend = getBackend(backend)
+    encode = backend.encoder(indent=indent, **kwa)
+
+    def write(f):
+        """ Write brinees to file object f in chunks and return count"""
+        count = 0
+        size = 0
+        pending = []
+        for brinee in brinees:
+            s = encode(brinee)
+            if pad is not None:
+                s = s.replace('\n', '\n' + pad) # nest one level deeper
+            pending.append(separator if count else head)
+            pending.append(s)
+            count += 1
+            size += len(s)
+            if size >= buffering:
+                f.write(''.join(pending))
+                del pending[:]
+                size = 0
+        if count:
+            pending.append(tail)
+        elif format == 'array':
+            pending.append('[]')
+        f.write(''.join(pending))
+        return count
+
+    def writeParallel(f):
+        """ Write brinees to file object f serialized in pool and return count"""
+        pool = executor if executor is not None else poolExecutor(workers)
+        try:
+            window = 2 * (workers or getattr(pool, '_max_workers', 1))
+            iterator = iter(brinees)
+            futures = collections.deque()
+
+            def submit():
+                batch = list(itertools.islice(iterator, chunk))
+                if batch:
+                    futures.append(pool.submit(dumpChunk, batch, separator, pad,
+                                               backend.name, indent, kwa))
+                return bool(batch)
+
+            while len(futures) < window and submit():
+                pass
+            count = 0
+            while futures:
+                s, n = futures.popleft().result()
+                f.write((separator if count else head) + s)
+                count += n
+                submit()
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        if count:
+            f.write(tail)
+        elif format == 'array':
+            f.write('[]')
+        return count
+
+    if executor is not None or (workers is not None and workers > 1):
+        write = writeParallel
+
+    if hasattr(destination, 'write'):
+        if durability not in Durabilities:
+            raise ParameterError("Invalid durability '%s'." % durability)
+        count = write(destination)
+        syncFile(destination, durability)
+        return count
+
+    with durableOpen(destination, atomic=atomic, durability=durability) as f:
+        return write(f)
+
+def dumps_many(brinees,
+               format='jsonl',
+               indent=None,
+               backend=None,
+               workers=None,
+               chunk=1024,
+               executor=None,
+               **kwa):
+    """ Returns Json serialization of brinees, an iterable of brined objects,
+        as str of format 'jsonl' or 'array', see dump_many.
+        If workers is more than 1 or executor is given then serialize chunks of
+        chunk objects in parallel and stitch them in order.
+    """
+    f = io.StringIO()
+    dump_many(brinees,
+              f,
+              format=format,
+              indent=indent,
+              durability='none',
+              backend=backend,
+              workers=workers,
+              chunk=chunk,
+              executor=executor,
+              **kwa)
+    return f.getvalue()
+
+ColumnKinds = ('list', 'array', 'numpy') # column containers of to_columns
+
+def columnNames(cls, brinee):
+    """ Returns tuple of public attribute names of the columns of brined class
+        cls from _Keys if set else from the dumpable attributes of brinee
+    """
+    plan = dumpPlan(cls)
+    if plan.names is not None:
+        return plan.names
+    return tuple(key for key in brinee._dumpable() if not key.startswith('@'))
+
+def to_columns(brinees, kind='list'):
+    """ Returns odict of columns keyed by attribute name of brinees, a sequence
+        of brined objects of one class, in struct of arrays form. Column i
+        holds the values of attribute i in order of brinees so each name
+        appears once instead of once per object.
+        kind is the column container, one of ColumnKinds:
+            'list', list of values
+            'array', array.array of int ('q') or float ('d') for columns whose
+                values are all of that type and fit otherwise list
+            'numpy', numpy array for columns whose values are all int, all
+                float or all bool otherwise list, requires numpy
+        Nested brined values are kept as objects, see dumps_columns.
+    """
+    if kind not in ColumnKinds:
+        raise ParameterError("Invalid column kind '%s'." % kind)
+    if kind == 'numpy' and numpy is None:
+        raise ParameterError("Column kind 'numpy' requires numpy.")
+    if not isinstance(brinees, (list, tuple)):
+        brinees = list(brinees)
+    if not brinees:
+        return odict()
+    cls = brinees[0].__class__
+    names = columnNames(cls, brinees[0])
+    if not names:
+        return odict()
+    getter = operator.attrgetter(*names)
+    try:
+        if len(names) == 1:
+            rows = [(getter(brinee), ) for brinee in brinees]
+        else:
+            rows = [getter(brinee) for brinee in brinees]
+    except AttributeError as ex:
+        raise ParameterError("Brinees not homogeneous, %s." % ex)
+
+    columns = odict()
+    for name, values in zip(names, zip(*rows)):
+        column = list(values)
+        if kind != 'list':
+            types = set(map(type, column))
+            if kind == 'array':
+                if types == {int}:
+                    try:
+                        column = array.array('q', column)
+                    except OverflowError as ex: # beyond 64 bits so keep list
+                        pass
+                elif types == {float}:
+                    column = array.array('d', column)
+            elif len(types) == 1 and types <= {int, float, bool}:
+                try:
+                    vector = numpy.asarray(column)
+                except OverflowError as ex: # beyond 64 bits so keep list
+                    vector = None
+                if vector is not None and not vector.dtype.hasobject:
+                    column = vector
+        columns[name] = column
+    return columns
+
+def from_columns(columns, cls):
+    """ Returns list of new instances of brined class cls from columns, a
+        mapping of equal length columns keyed by attribute name as from
+        to_columns. Columns may be lists, array.array or numpy arrays.
+        As with ._update, names that cls() does not have are skipped unless
+        cls is _Extendable and dict values of nested brined attributes update
+        them in place.
+    """
+    if not columns:
+        return []
+    template = cls()
+    names = []
+    values = []
+    nested = []
+    for name, column in columns.items():
+        if name.startswith('_') or name.startswith('@'):
+            continue
+        if not hasattr(template, name) and not cls._Extendable:
+            continue
+        names.append(name)
+        values.append(column.tolist() if hasattr(column, 'tolist') else column)
+        nested.append(hasattr(getattr(template, name, None), '_Brined'))
+    if not names: # only skipped columns so count rows from any column
+        return [cls() for i in range(len(next(iter(columns.values()))))]
+    if len(set(map(len, values))) > 1:
+        raise ParameterError("Columns of unequal length.")
+
+    brinees = []
+    for row in zip(*values):
+        brinee = cls()
+        for name, value, brined in zip(names, row, nested):
+            if brined and isinstance(value, dict):
+                getattr(brinee, name)._update(value)
+            else:
+                setattr(brinee, name, value)
+        brinees.append(brinee)
+    return brinees
+
+def dumps_columns(brinees, indent=None, backend=None, **kwa):
+    """ Returns columnar Json serialization of brinees, a sequence of brined
+        objects of one class, as str of the form
+            {"@table": "Name", "@count": n, "@columns": {"x": [1, 2], "y": [...]}}
+        "@table" is the class hint, omitted when the class is not _Hinted or
+        brinees is empty. Nested brined values serialize as usual.
+    """
+    if not isinstance(brinees, (list, tuple)):
+        brinees = list(brinees)
+    table = odict()
+    if brinees and brinees[0].__class__._Hinted:
+        table["@table"] = brinees[0].__class__.__name__
+    table["@count"] = len(brinees)
+    table["@columns"] = to_columns(brinees)
+    return getBackend(backend).dumps(table, default=default, indent=indent, **kwa)
+
+def dump_columns(brinees,
+                 filename="",
+                 indent=None,
+                 atomic=False,
+                 durability='fsync',
+                 backend=None,
+                 **kwa):
+    """ Writes columnar Json serialization of brinees to filename, see
+        dumps_columns. atomic and durability are as for ._dump.
+    """
+    if not filename:
+        raise ParameterError("No filename to Dump to:")
+    s = dumps_columns(brinees, indent=indent, backend=backend, **kwa)
+    with durableOpen(filename, atomic=atomic, durability=durability) as f:
+        f.write(s)
+
+def debrines_columns(s,
+                     classes=None,
+                     propertied=False,
+                     safed=False,
+                     hinted=True,
+                     extendable=False,
+                     backend=None):
+    """ Returns list of reconstructed brined objects from columnar Json
+        serialization s, see dumps_columns. The class of the rows is the
+        class in classes named by the "@table" hint, or the first class when
+        s has no hint. Nested hinted objects are reconstructed as by debrines.
+    """
+    debriner = Debriner(classes,
+                        propertied=propertied,
+                        safed=safed,
+                        hinted=hinted,
+                        extendable=extendable,
+                        backend=backend)
+    table = debriner.parse(s)
+    if not isinstance(table, dict) or "@columns" not in table:
+        raise ValueError("Not a columnar serialization.")
+    if not table["@count"]:
+        return []
+    hint = table.get("@table")
+    if hint is not None:
+        cls = debriner.hints.get(hint)
+        if cls is None:
+            raise ParameterError("No class for hint '%s'." % hint)
+    elif classes:
+        cls = classes[0]
+    else:
+        raise ParameterError("No class for unhinted columns.")
+    brinees = from_columns(table["@columns"], cls)
+    if len(brinees) != table["@count"]:
+        raise ValueError("Columns hold %d rows not @count %d." %
+                         (len(brinees), table["@count"]))
+    return brinees
+
+def debrine_columns(filename="",
+                    classes=None,
+                    propertied=False,
+                    safed=False,
+                    hinted=True,
+                    extendable=False,
+                    backend=None):
+    """ Returns list of reconstructed brined objects from columnar Json file
+        filename, see debrines_columns
+    """
+    if not filename:
+        raise ParameterError("Empty filename.")
+    with open(filename, 'r') as f:
+        s = f.read()
+    return debrines_columns(s,
+                            classes,
+                            propertied=propertied,
+                            safed=safed,
+                            hinted=hinted,
+                            extendable=extendable,
+                            backend=backend)
+
+class Journal(object):
+    """ Journal
+
+        Journaled persistence of brined object brinee as a snapshot file plus
+        an append-only log of attribute changes so a change costs one short
+        append instead of a rewrite of the whole serialization.
+
+        The snapshot at filename is a normal ._dump of brinee. The log at
+        filename + '.log' holds one compact JSON object per line (JSON Lines)
+        of the changed attributes with the class hint so each entry replays
+        through ._update just like a ._load.
+
+        Entries are group committed: the log is synced per durability once
+        every group appends and on .commit or .close. Once the log holds
+        threshold entries .compact atomically rewrites the snapshot and
+        truncates the log. Entries set absolute values so replaying a log over
+        a snapshot that already includes it, as after a crash mid compaction,
+        is harmless.
+
+        Example Usage:
+            journal = Journal(brinee, "state.json")
+            journal.recover()
+            journal.record(x=5, y=[1, 2])
+            journal.close()
+
+        Attributes:
+            brinee, journaled brined object
+            filename, snapshot filename
+            logname, log filename
+            threshold, count of log entries that triggers compaction, None never
+            group, count of appends per sync of the log
+            durability, one of Durabilities applied to log syncs and snapshots
+            entries, count of entries in the log
+            pending, count of appends since the last sync
+    """
+    def __init__(self,
+                 brinee,
+                 filename,
+                 threshold=1024,
+                 group=1,
+                 durability='fsync',
+                 backend=None):
+        if not filename:
+            raise ParameterError("Empty filename.")
+        if durability not in Durabilities:
+            raise ParameterError("Invalid durability '%s'." % durability)
+        self.brinee = brinee
+        self.filename = filename
+        self.logname = filename + '.log'
+        self.threshold = threshold
+        self.group = max(1, group)
+        self.durability = durability
+        self.backend = getBackend(backend if backend is not None
+                                  else brinee._Backend)
+        self.encode = self.backend.encoder(default=default,
+                                           separators=(',', ':'))
+        self.log = None
+        self.entries = 0
+        self.pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def recover(self):
+        """ Loads snapshot if any into .brinee then replays the log through
+            ._update. A torn last entry from a crash mid append is dropped and
+            truncated from the log. Returns .brinee
+        """
+        if os.path.exists(self.filename):
+            self.brinee._load(self.filename)
+
+        self.entries = 0
+        if not os.path.exists(self.logname):
+            return self.brinee
+
+        good = 0 # offset of end of last good entry
+        with open(self.logname, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        dct = self.backend.loads(line.decode('utf-8'), hook=tagHook)
+                    except ValueError as ex:
+                        if line.endswith(b'\n'):
+                            raise # corrupt entry not at end of log
+                        break # torn last entry
+                    self.brinee._update(dct)
+                    self.entries += 1
+                good += len(line)
+
+        if good != os.path.getsize(self.logname):
+            with open(self.logname, 'r+b') as f:
+                f.truncate(good)
+        return self.brinee
+
+    def record(self, **changes):
+        """ Sets attributes of .brinee from changes and appends them to the
+            log as one entry. Syncs per group and compacts per threshold.
+        """
+        brinee = self.brinee
+        for name, value in changes.items():
+            setattr(brinee, name, value)
+        if brinee._Hinted:
+            changes["@class"] = brinee.__class__.__name__
+
+        if self.log is None:
+            self.log = open(self.logname, 'a')
+        self.log.write(self.encode(changes) + '\n')
+        self.entries += 1
+        self.pending += 1
+        if self.pending >= self.group:
+            self.commit()
+        if self.threshold is not None and self.entries >= self.threshold:
+            self.compact()
+
+    def commit(self):
+        """ Syncs appended entries of the log per durability"""
+        if self.log is not None and self.pending:
+            syncFile(self.log, self.durability)
+        self.pending = 0
+
+    def compact(self):
+        """ Atomically rewrites snapshot from .brinee then truncates the log"""
+        self.commit()
+        self.brinee._dump(self.filename, atomic=True, durability=self.durability)
+        if self.log is not None:
+            self.log.close()
+        self.log = open(self.logname, 'w')
+        syncFile(self.log, self.durability)
+        self.entries = 0
+
+    def close(self):
+        """ Commits and closes the log"""
+        self.commit()
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+Metering = False # When True brined classes record Metrics, see meter
+MeterSamples = 1024 # count of latest latencies kept per metric for percentiles
+Metrics = {} # Metric keyed by (class name, operation)
+BrinedClasses = weakref.WeakSet() # classes brinified, whose methods meter swaps
+
+class Metric(object):
+    """ Metric
+
+        Counts, latencies and bytes of one operation on one brined class.
+        Percentiles are over the latest MeterSamples latencies.
+
+        Attributes:
+            count, count of calls
+            total, cumulative seconds
+            bytesIn, cumulative characters deserialized
+            bytesOut, cumulative characters serialized
+            latencies, deque of latest seconds per call
+    """
+    __slots__ = ('count', 'total', 'bytesIn', 'bytesOut', 'latencies')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.bytesIn = 0
+        self.bytesOut = 0
+        self.latencies = collections.deque(maxlen=MeterSamples)
+
+    def snapshot(self):
+        """ Returns odict of count, total, mean, p50, p90, p99 and max seconds,
+            bytesIn and bytesOut
+        """
+        latencies = sorted(self.latencies)
+        last = len(latencies) - 1
+
+        def percentile(fraction):
+            return latencies[int(round(fraction * last))] if latencies else 0.0
+
+        return odict([("count", self.count),
+                      ("total", self.total),
+                      ("mean", self.total / self.count if self.count else 0.0),
+                      ("p50", percentile(0.50)),
+                      ("p90", percentile(0.90)),
+                      ("p99", percentile(0.99)),
+                      ("max", latencies[-1] if latencies else 0.0),
+                      ("bytesIn", self.bytesIn),
+                      ("bytesOut", self.bytesOut)])
+
+def record(cls, operation, elapsed, bytesIn=0, bytesOut=0):
+    """ Records call of operation on class cls that took elapsed seconds"""
+    key = (cls.__name__, operation)
+    metric = Metrics.get(key)
+    if metric is None:
+        metric = Metrics[key] = Metric()
+    metric.count += 1
+    metric.total += elapsed
+    metric.bytesIn += bytesIn
+    metric.bytesOut += bytesOut
+    metric.latencies.append(elapsed)
+
+def meteredDumps(self, indent=2, **kwa):
+    """ dumps that records its Metric"""
+    start = time.perf_counter()
+    s = dumps(self, indent, **kwa)
+    elapsed = time.perf_counter() - start
+    record(self.__class__, 'dumps', elapsed, bytesOut=len(s))
+    if SampleThreshold is not None and elapsed > SampleThreshold:
+        takeSample(self, 'dumps', elapsed, len(s))
+    return s
+
+def meteredLoads(self, s):
+    """ loads that records its Metric"""
+    start = time.perf_counter()
+    result = loads(self, s)
+    elapsed = time.perf_counter() - start
+    record(self.__class__, 'loads', elapsed, bytesIn=len(s))
+    if SampleThreshold is not None and elapsed > SampleThreshold:
+        takeSample(self, 'loads', elapsed, len(s))
+    return result
+
+def meteredUpdate(self, dct):
+    """ update that records its Metric"""
+    start = time.perf_counter()
+    result = update(self, dct)
+    record(self.__class__, 'update', time.perf_counter() - start)
+    return result
+
+def meteredDump(self, filename="", indent=2, **kwa):
+    """ dump that records its Metric"""
+    start = time.perf_counter()
+    dump(self, filename, indent, **kwa)
+    elapsed = time.perf_counter() - start
+    record(self.__class__, 'dump', elapsed, bytesOut=os.path.getsize(filename))
+
+def meteredLoad(self, filename=""):
+    """ load that records its Metric"""
+    start = time.perf_counter()
+    result = load(self, filename)
+    elapsed = time.perf_counter() - start
+    record(self.__class__, 'load', elapsed, bytesIn=os.path.getsize(filename))
+    return result
+
+MeteredMethods = (('_dumps', dumps, meteredDumps),
+                  ('_loads', loads, meteredLoads),
+                  ('_update', update, meteredUpdate),
+                  ('_dump', dump, meteredDump),
+                  ('_load', load, meteredLoad)) # (name, plain, metered) triples
+
+def meter(enabled=True, cls=None):
+    """ Turns metering on or off for all brined classes, or only for cls.
+        On swaps in methods that record Metrics per class for dumps, loads,
+        update, dump and load, and Debriners record per class of the loaded
+        brined object. Off swaps the plain methods back so there is no overhead.
+        cls may inherit its methods, as from the Brine mixin, the swapped
+        methods are then set on cls itself.
+        Classes brined later follow the global setting.
+    """
+    global Metering
+    if cls is None:
+        Metering = enabled
+        classes = list(BrinedClasses)
+    else:
+        classes = [cls]
+        BrinedClasses.add(cls) # so a later global meter also swaps them back
+    for cls in classes:
+        for name, plain, metered in MeteredMethods:
+            if getattr(cls, name, None) in (plain, metered): # not overridden
+                setattr(cls, name, metered if enabled else plain)
+
+def stats():
+    """ Returns snapshot of Metrics as odict keyed by class name of odict keyed
+        by operation of the Metric snapshot, see Metric.snapshot
+        Times are in seconds, bytes are characters of JSON.
+    """
+    result = odict()
+    for (name, operation), metric in sorted(Metrics.items()):
+        result.setdefault(name, odict())[operation] = metric.snapshot()
+    return result
+
+def resetStats():
+    """ Forgets all Metrics and Samples"""
+    Metrics.clear()
+    Samples.clear()
+
+SampleThreshold = None # seconds over which metered dumps and loads are sampled
+SampleLimit = 100 # count of latest samples kept
+Samples = collections.deque(maxlen=SampleLimit) # latest samples, see sample
+
+def sample(threshold=0.01, limit=None):
+    """ Turns on sampling of slow serializations with threshold in seconds,
+        or off when threshold is None. Sampling turns on metering, see meter.
+        Each metered _dumps or _loads of an instance that takes longer than
+        threshold adds a sample with a per attribute breakdown of bytes and
+        time to Samples, which keeps the latest limit samples.
+    """
+    global SampleThreshold, Samples
+    SampleThreshold = threshold
+    if limit is not None and limit != Samples.maxlen:
+        Samples = collections.deque(Samples, maxlen=limit)
+    if threshold is not None:
+        meter(True)
+
+def breakdown(obj, encode, rows, path=""):
+    """ Returns duple (bytes, seconds) of serializing the attributes of brined
+        obj with encode and appends (path, bytes, seconds) triples to rows
+        for each attribute. Nested brined objects are broken down too so the
+        tree is walked once and each leaf value is serialized once.
+    """
+    total = 0
+    elapsed = 0.0
+    for name, value in obj._dumpable().items():
+        if name == "@class":
+            continue
+        key = path + "." + name if path else name
+        if attrKind(value) == BRINED:
+            size, seconds = breakdown(value, encode, rows, key)
+        else:
+            start = time.perf_counter()
+            size = len(encode(value))
+            seconds = time.perf_counter() - start
+        rows.append((key, size, seconds))
+        total += size
+        elapsed += seconds
+    return (total, elapsed)
+
+def takeSample(obj, operation, elapsed, size):
+    """ Adds sample of slow operation on brined obj that took elapsed seconds
+        for size characters of JSON to Samples
+    """
+    encode = getBackend(obj._Backend).encoder(default=obj._default)
+    rows = []
+    breakdown(obj, encode, rows)
+    rows.sort(key=lambda row: row[1], reverse=True)
+    Samples.append(odict([("class", obj.__class__.__name__),
+                          ("operation", operation),
+                          ("seconds", elapsed),
+                          ("bytes", size),
+                          ("time", time.time()),
+                          ("attributes", [odict([("path", path),
+                                                 ("bytes", length),
+                                                 ("seconds", seconds)])
+                                          for path, length, seconds in rows])]))
+
+def samples():
+    """ Returns list of latest samples of slow serializations, oldest first.
+        Each is an odict of class, operation, seconds, bytes, time and
+        attributes, a list of odicts of path, bytes and seconds of each
+        attribute, nested ones with dotted paths, largest first.
+    """
+    return list(Samples)
+
+class LazyBrine(object):
+    """ LazyBrine
+
+        Stand in for a nested hinted object returned by a lazy Debriner.
+        Holds the class and the decoded dict and only reconstructs the brined
+        object with cls()._update(dct) on first attribute access, so the
+        cost of a load depends on the nested objects actually used.
+
+        Attribute gets, sets and deletes and the special methods in
+        LazyForwards are forwarded to the reconstructed object and .__class__
+        reports its class so isinstance works. Copying or pickling a stand in
+        copies or pickles the reconstructed object.
+        Dumping a stand in reconstructs it first so its serialization is the
+        same as that of an eagerly debrined object.
+        Use materialize(obj) to get the reconstructed object itself.
+    """
+    __slots__ = ('_cls_', '_dct_', '_obj_')
+
+    _Brined = True # dumped like the brined object it stands in for
+
+    def __init__(self, cls, dct):
+        object.__setattr__(self, '_cls_', cls)
+        object.__setattr__(self, '_dct_', dct)
+        object.__setattr__(self, '_obj_', None)
+
+    @property
+    def __class__(self):
+        return object.__getattribute__(self, '_cls_')
+
+    def _materialize_(self):
+        """ Returns reconstructed object, reconstructing it on first call"""
+        obj = object.__getattribute__(self, '_obj_')
+        if obj is None:
+            obj = object.__getattribute__(self, '_cls_')()
+            obj._update(object.__getattribute__(self, '_dct_'))
+            object.__setattr__(self, '_obj_', obj)
+            object.__setattr__(self, '_dct_', None)
+        return obj
+
+    def __getattr__(self, name):
+        return getattr(self._materialize_(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._materialize_(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._materialize_(), name)
+
+    def __repr__(self):
+        if object.__getattribute__(self, '_obj_') is None:
+            return "<lazy %s>" % object.__getattribute__(self, '_cls_').__name__
+        return repr(self._materialize_())
+
+    def __reduce_ex__(self, protocol):
+        return self._materialize_().__reduce_ex__(protocol)
+
+    def __copy__(self):
+        return copy.copy(self._materialize_())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._materialize_(), memo)
+
+def lazyForward(func):
+    """ Returns special method of LazyBrine that applies func to reconstructed
+        object since special methods are looked up on the type not forwarded
+        by __getattr__
+    """
+    def forward(self, *pa, **kwa):
+        return func(self._materialize_(), *pa, **kwa)
+    return forward
+
+LazyForwards = odict([('__len__', len), ('__iter__', iter),
+                      ('__reversed__', reversed), ('__bool__', bool),
+                      ('__str__', str), ('__hash__', hash),
+                      ('__contains__', operator.contains),
+                      ('__getitem__', operator.getitem),
+                      ('__setitem__', operator.setitem),
+                      ('__delitem__', operator.delitem),
+                      ('__eq__', operator.eq), ('__ne__', operator.ne),
+                      ('__lt__', operator.lt), ('__le__', operator.le),
+                      ('__gt__', operator.gt), ('__ge__', operator.ge),
+                      ('__call__', lambda obj, *pa, **kwa: obj(*pa, **kwa))])
+
+for name, func in LazyForwards.items():
+    setattr(LazyBrine, name, lazyForward(func))
+del name, func
+
+def materialize(obj):
+    """ Returns reconstructed object of LazyBrine obj otherwise obj"""
+    if type(obj) is LazyBrine:
+        return obj._materialize_()
+    return obj
+
+class Ref(object):
+    """ Placeholder for an {"@ref": ident} to an object not yet debrined.
+        dct is the original odict, kept when no object has "@id" ident.
+    """
+    __slots__ = ('ident', 'dct')
+
+    def __init__(self, ident, dct):
+        self.ident = ident
+        self.dct = dct
+
+class Decoding(object):
+    """ Decoding
+
+        State of one Debriner decode kept apart from the Debriner so a shared
+        Debriner can decode in many threads at once.
+
+        Attributes:
+            ids, dict of objects keyed by @id
+            forwards, count of forward @ref
+            segments, list of out of band buffers, see debrines_segmented
+    """
+    __slots__ = ('ids', 'forwards', 'segments')
+
+    def __init__(self, segments=None):
+        self.ids = {}
+        self.forwards = 0
+        self.segments = segments
+
+class Debriner(object):
+    """ Debriner
+
+        Reusable decoder that reconstructs brined objects from class hinted
+        JSON serializations. Build once and reuse for many loads.
+
+        classes is a list of class objects to use to reconstruct the python
+        objects. Each hint requires a class in classes whose .__name__ matches
+        the hint. The first class with a given name wins.
+        The classes are brinified once up front with the
+        propertied, safed, hinted, extendable parameters.
+        backend is JsonBackend or name of backend, None means global default.
+        If lazy then nested hinted objects are returned as LazyBrine stand ins
+        that are reconstructed on first attribute access. The top level object
+        is always reconstructed.
+        Serializations with "@id" and "@ref" keys, see referencer, are
+        rebuilt with shared objects and cycles.
+        A Debriner may be shared by threads, the state of each decode is a
+        Decoding held per thread.
+
+        Attributes:
+            hints, dict of class keyed by hint for O(1) dispatch
+            backend, JsonBackend used to parse
+            lazy, True if nested objects are reconstructed on first access
+            parse, cached parse function with .hook as object_pairs_hook
+            decoder, decode function of one argument, s
+            local, threading.local whose .decoding is the Decoding of the
+                decode running in the thread
+    """
+    def __init__(self,
+                 classes=None,
+                 propertied=False,
+                 safed=False,
+                 hinted=True,
+                 extendable=False,
+                 backend=None,
+                 lazy=False):
+        self.hints = {}
+        for cls in (classes if classes is not None else []):
+            brinify(cls,
+                    propertied=propertied,
+                    safed=safed,
+                    hinted=hinted,
+                    extendable=extendable)
+            if cls.__name__ not in self.hints:
+                self.hints[cls.__name__] = cls
+        self.backend = getBackend(backend)
+        self.lazy = lazy
+        self.parse = self.backend.decoder(hook=self.hook)
+        self.decoder = self.decode
+        self.local = threading.local()
+
+    def decoding(self):
+        """ Returns Decoding of the decode running in this thread or a new one
+            when .hook is used outside of decode
+        """
+        decoding = getattr(self.local, 'decoding', None)
+        if decoding is None:
+            decoding = self.local.decoding = Decoding()
+        return decoding
+
+    def decode(self, s, parse=None, segments=None):
+        """ Returns reconstructed object from JSON s. Resolves @ref to objects
+            whose @id comes later in s, as in cycles, once s is parsed.
+            An {"@ref": ident} with no "@id" ident in s is left as is.
+            parse if given replaces .parse, as for MessagePack.
+            segments is list of out of band buffers, see debrines_segmented.
+        """
+        start = time.perf_counter() if Metering else None
+        decoding = Decoding(segments)
+        outer = getattr(self.local, 'decoding', None)
+        self.local.decoding = decoding
+        try:
+            obj = (parse if parse is not None else self.parse)(s)
+            if decoding.forwards:
+                obj = self.resolve(obj, set(), decoding.ids)
+        finally:
+            self.local.decoding = outer
+        if self.lazy:
+            obj = materialize(obj)
+        if start is not None and hasattr(obj, '_Brined'): # not plain data
+            record(obj.__class__, 'debrines', time.perf_counter() - start,
+                   bytesIn=len(s))
+        return obj
+
+    def hook(self, pairs):
+        """ Method for simplejson object_pairs_hook
+            pairs is ordered list of key value duples
+        """
+        dct = odict(pairs)
+        try:
+            cls = self.hints.get(dct.get('@class'))
+        except TypeError as ex: # unhashable hint value
+            cls = None
+        if cls is None:
+            if len(dct) == 1 and '@ref' in dct: # exact form only
+                ident = dct['@ref']
+                decoding = self.decoding()
+                try:
+                    obj = decoding.ids.get(ident)
+                except TypeError as ex: # unhashable so plain data
+                    return dct
+                if obj is None: # forward reference or data, resolved after parse
+                    decoding.forwards += 1
+                    return Ref(ident, dct)
+                return obj
+            if '@type' in dct:
+                return decodeTagged(dct, self.decoding().segments)
+            return dct
+
+        ident = dct.pop('@id', None)
+        if self.lazy:
+            obj = LazyBrine(cls, dct)
+        else:
+            obj = cls()._update(dct)
+        if ident is not None:
+            self.decoding().ids[ident] = obj
+        return obj
+
+    def unpackb(self, data):
+        """ returns reconstructed brined object from class hinted
+            MessagePack serialization data, see packs
+        """
+        return self.decode(data, lambda data: unpackb(data, hook=self.hook))
+
+    def resolve(self, value, seen, ids):
+        """ Returns value with Ref placeholders in it and in the objects and
+            containers reachable from it replaced by their objects in ids,
+            dict of objects keyed by @id.
+            seen is set of ids of objects already walked.
+        """
+        if type(value) is Ref:
+            obj = ids.get(value.ident)
+            if obj is None: # no "@id" in this decode so plain data
+                return value.dct
+            return obj
+
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self.resolve(item, seen, ids)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self.resolve(item, seen, ids)
+        elif hasattr(value, '_Brined') and id(value) not in seen:
+            seen.add(id(value))
+            if type(value) is LazyBrine:
+                dct = object.__getattribute__(value, '_dct_')
+                if dct is not None: # not materialized
+                    self.resolve(dct, seen, ids)
+                    return value
+            obj = materialize(value)
+            for name in (list(getattr(obj, '__dict__', ())) +
+                         list(slotNames(obj.__class__))):
+                if name.startswith('_'):
+                    continue
+                try:
+                    attr = getattr(obj, name)
+                except AttributeError as ex: # unset slot
+                    continue
+                item = self.resolve(attr, seen, ids)
+                if item is not attr:
+                    setattr(obj, name, item)
+        return value
+
+    def loads(self, s):
+        """ returns reconstructed brined object from class hinted
+            JSON serialization s
+        """
+        return self.decoder(s)
+
+    def load(self, filename=""):
+        """ returns reconstructed brined object from class hinted
+            JSON serialization in file filename
+        """
+        if not filename:
+            raise ParameterError("Empty filename.")
+
+        with ocfn(filename) as f:
+            return self.decoder(f.read())
+
+    def iterload(self, source, skip=False, report=None):
+        """ generator that yields one reconstructed brined object per line of
+            JSON Lines source, a filename or a file object open for reading.
+            Only one line is held in memory at a time. Blank lines are ignored.
+
+            Malformed lines raise unless skip is True or report is given.
+            When report is given it is called as report(lineno, line, ex)
+            for each malformed line which is then skipped.
+        """
+        if hasattr(source, 'read'):
+            for obj in self._iterlines(source, skip, report):
+                yield obj
+        else:
+            with open(source, 'r') as f:
+                for obj in self._iterlines(f, skip, report):
+                    yield obj
+
+    def _iterlines(self, f, skip, report):
+        """ generator of reconstructed objects from lines of file object f"""
+        decode = self.decoder
+        for lineno, line in enumerate(f, 1):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            if not line.strip():
+                continue
+            try:
+                obj = decode(line)
+            except (ValueError, TypeError) as ex: # bad json or class hint
+                if report is not None:
+                    report(lineno, line, ex)
+                elif not skip:
+                    raise
+                continue
+            yield obj
 
 def debrines(s,
              classes=None,
              propertied=False,
              safed=False,
              hinted=True,
-             extendable=False):
+             extendable=False,
+             backend=None,
+             lazy=False):
     """ returns reconstructed brined object from class hinted JSON serialization s
         classes is a list of class objects to use to reconstruct the python objects.
         Each hint requires a class in classes whose .__name__ matches the hint
-    """
-    if classes is None:
-        classes = []
-
-    def hook(pairs):
-        """ Method for simplejson object_pairs_hook
-            pairs is ordered list of key value duples
-        """
-        dct = odict(pairs)
-        hint =  dct.get('@class')
-        for cls in classes:
-            if cls.__name__ == hint:
-                return brinify( cls,
-                                propertied=propertied,
-                                safed=safed,
-                                hinted=hinted,
-                                extendable=extendable)()._update(dct)
+        If lazy then nested objects are reconstructed on first access, see
+        LazyBrine.
 
-        return dct
-
-    obj = json.loads(s, object_pairs_hook=hook)
-    return obj
+        To load many serializations with the same classes build a Debriner
+        once and call its .loads method instead.
+    """
+    return Debriner(classes,
+                    propertied=propertied,
+                    safed=safed,
+                    hinted=hinted,
+                    extendable=extendable,
+                    backend=backend,
+                    lazy=lazy).loads(s)
 
 def debrine(filename = "",
             classes=None,
             propertied=False,
             safed=False,
             hinted=True,
-            extendable=False):
+            extendable=False,
+            backend=None,
+            lazy=False):
     """ returns reconstructed brined object from class hinted JSON serialization
         classes is a list of class objects to use to reconstruct the python objects.
         Each hint requires a class in classes whose .__name__ matches the hint
+
+        To load many files with the same classes build a Debriner
+        once and call its .load method instead.
     """
     if not filename:
         raise ParameterError("Empty filename.")
 
-    if classes is None:
-        classes = []
+    return Debriner(classes,
+                    propertied=propertied,
+                    safed=safed,
+                    hinted=hinted,
+                    extendable=extendable,
+                    backend=backend,
+                    lazy=lazy).load(filename)
+
+def iterdebrine(source,
+                classes=None,
+                propertied=False,
+                safed=False,
+                hinted=True,
+                extendable=False,
+                backend=None,
+                lazy=False,
+                skip=False,
+                report=None):
+    """ generator that yields reconstructed brined objects one per line from
+        class hinted JSON Lines source, a filename or file object.
+        classes is a list of class objects to use to reconstruct the python objects.
+        Each hint requires a class in classes whose .__name__ matches the hint
 
-    def hook(pairs):
-        """ Method for simplejson object_pairs_hook
-            pairs is ordered list of key value duples
-        """
-        dct = odict(pairs)
-        hint =  dct.get('@class')
-        for cls in classes:
-            if cls.__name__ == hint:
-                return brinify( cls,
-                                propertied=propertied,
-                                safed=safed,
-                                hinted=hinted,
-                                extendable=extendable)()._update(dct)
+        Malformed lines raise unless skip is True or report is given.
+        When report is given it is called as report(lineno, line, ex)
+        for each malformed line which is then skipped.
+    """
+    debriner = Debriner(classes,
+                        propertied=propertied,
+                        safed=safed,
+                        hinted=hinted,
+                        extendable=extendable,
+                        backend=backend,
+                        lazy=lazy)
+    return debriner.iterload(source, skip=skip, report=report)
+
+def debrineChunk(filename,
+                 start,
+                 end,
+                 classes=None,
+                 propertied=False,
+                 safed=False,
+                 hinted=True,
+                 extendable=False,
+                 backend=None,
+                 skip=False):
+    """ Returns list of reconstructed brined objects from the JSON Lines in
+        bytes start to end of file filename. Runs in pool workers of
+        debrine_parallel so backend is the registry name of the backend.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    debriner = Debriner(classes,
+                        propertied=propertied,
+                        safed=safed,
+                        hinted=hinted,
+                        extendable=extendable,
+                        backend=backend)
+    return list(debriner.iterload(io.StringIO(text), skip=skip))
+
+def debrine_parallel(filename,
+                     classes=None,
+                     propertied=False,
+                     safed=False,
+                     hinted=True,
+                     extendable=False,
+                     backend=None,
+                     workers=None,
+                     ordered=True,
+                     chunk=1 << 22,
+                     executor=None,
+                     skip=False):
+    """ generator that yields reconstructed brined objects from class hinted
+        JSON Lines file filename parsed in parallel.
+
+        The file is split on line boundaries into chunks of about chunk bytes
+        that are debrined by executor, default a new poolExecutor(workers),
+        with the same hint dispatch as debrines. At most two chunks per worker
+        are in flight. If ordered then objects are yielded in file order
+        otherwise each chunk is yielded as soon as it is done.
+        Process workers need classes to be importable and picklable and
+        backend to be in Backends. Malformed lines raise unless skip is True.
+
+        If workers is None or 1 and no executor is given parse serially.
+    """
+    if not filename:
+        raise ParameterError("Empty filename.")
 
-        return dct
+    backend = getBackend(backend)
+    if executor is None and (workers is None or workers <= 1):
+        for obj in iterdebrine(filename,
+                               classes,
+                               propertied=propertied,
+                               safed=safed,
+                               hinted=hinted,
+                               extendable=extendable,
+                               backend=backend,
+                               skip=skip):
+            yield obj
+        return
+
+    size = os.path.getsize(filename)
+    pool = executor if executor is not None else poolExecutor(workers)
+    try:
+        window = 2 * (workers or getattr(pool, '_max_workers', 1))
+        futures = collections.deque() if ordered else set()
+        offsets = [0] # start of next chunk, in a list so submit can update it
+
+        with open(filename, 'rb') as f:
+            def submit():
+                start = offsets[0]
+                if start >= size:
+                    return False
+                f.seek(min(start + chunk, size))
+                f.readline() # extend chunk to end of line
+                end = f.tell()
+                offsets[0] = end
+                future = pool.submit(debrineChunk, filename, start, end, classes,
+                                     propertied, safed, hinted, extendable,
+                                     backend.name, skip)
+                if ordered:
+                    futures.append(future)
+                else:
+                    futures.add(future)
+                return True
+
+            while len(futures) < window and submit():
+                pass
+            while futures:
+                if ordered:
+                    done = [futures.popleft()]
+                else:
+                    done, pending = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                    futures.difference_update(done)
+                for future in done:
+                    for obj in future.result():
+                        yield obj
+                    submit()
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+def debrine_packed(data,
+                   classes=None,
+                   propertied=False,
+                   safed=False,
+                   hinted=True,
+                   extendable=False,
+                   lazy=False):
+    """ returns reconstructed brined object from class hinted MessagePack
+        serialization data made with ._packb
+        classes is a list of class objects to use to reconstruct the python objects.
+        Each hint requires a class in classes whose .__name__ matches the hint
 
-    with ocfn(filename) as f:
-        obj = json.load(f, object_pairs_hook=hook)
-        return obj
+        To load many serializations with the same classes build a Debriner
+        once and call its .unpackb method instead.
+    """
+    return Debriner(classes,
+                    propertied=propertied,
+                    safed=safed,
+                    hinted=hinted,
+                    extendable=extendable,
+                    lazy=lazy).unpackb(data)
+
+def dumps_segmented(brinee, indent=None, backend=None, **kwa):
+    """ Returns duple (s, segments) of the Json serialization s of brined
+        object brinee with its buffers out of band. segments is the list of
+        the buffers, bytes like objects not copied, referenced from s by index
+        as {"@type": "bytes", "@segment": 0}. Large binary attributes are not
+        base64 encoded so s stays small and the segments can be written or
+        sent as is, see debrines_segmented.
+    """
+    segments = []
+    backend = getBackend(backend if backend is not None else brinee._Backend)
+    s = backend.dumps(brinee._dumpable(),
+                      default=segmenter(segments),
+                      indent=indent,
+                      **kwa)
+    return (s, segments)
+
+def debrines_segmented(s,
+                       segments,
+                       classes=None,
+                       propertied=False,
+                       safed=False,
+                       hinted=True,
+                       extendable=False,
+                       backend=None):
+    """ Returns reconstructed brined object from class hinted JSON
+        serialization s with out of band buffers segments, see
+        dumps_segmented. Buffers are views of their segments where the type
+        allows, numpy arrays with numpy.frombuffer.
+    """
+    debriner = Debriner(classes,
+                        propertied=propertied,
+                        safed=safed,
+                        hinted=hinted,
+                        extendable=extendable,
+                        backend=backend)
+    return debriner.decode(s, segments=segments)
+
+async def adebrine(filename="",
+                   classes=None,
+                   propertied=False,
+                   safed=False,
+                   hinted=True,
+                   extendable=False,
+                   backend=None,
+                   lazy=False,
+                   executor=None):
+    """ Coroutine that returns reconstructed brined object from class hinted
+        JSON serialization in file filename. The file is read in executor and
+        parsed on the event loop.
+        executor None means the default from asyncExecutor().
+    """
+    if not filename:
+        raise ParameterError("Empty filename.")
 
+    debriner = Debriner(classes,
+                        propertied=propertied,
+                        safed=safed,
+                        hinted=hinted,
+                        extendable=extendable,
+                        backend=backend,
+                        lazy=lazy)
+    loop = asyncio.get_running_loop()
+    s = await loop.run_in_executor(executor if executor is not None else asyncExecutor(),
+                                   readFile, filename)
+    return debriner.loads(s)
 
 @brined()
 class Brine(object):
@@ -0,0 +1,16 @@
+"""
+    benchmark package for brining module
+
+    Each bench module is runnable on its own, for example
+    $ python -m brining.benchmarks.benchDumpable
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+
+
+__all__ = ['benchDumpable', 'benchUpdate', 'benchDebriner',
+           'benchBackend', 'benchSlots',
+           'benchCompiled', 'benchAsync', 'benchLazy',
+           'benchTracked', 'benchParallel', 'benchParallelLoad',
+           'benchSuite', 'benchPacked', 'benchStruct', 'benchColumns', 'benchCodecs']
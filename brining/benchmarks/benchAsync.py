@@ -0,0 +1,73 @@
+""" Benchmark of event loop tail latency while persisting a large brined object
+    with blocking _dump on the loop versus _adump that offloads the file write
+    and fsync to an executor.
+
+    $ python -m brining.benchmarks.benchAsync
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import time
+import asyncio
+import tempfile
+
+from brining import Brine
+
+
+class State(Brine):
+    """ Large state object"""
+    def __init__(self, count=20000):
+        self.values = list(range(count))
+        self.names = ["name-%d" % i for i in range(count)]
+
+
+async def ticker(lags, stop, interval=0.001):
+    """ Records lateness of each tick of interval seconds into lags"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def persist(state, filename, blocking, count):
+    """ Persists state count times"""
+    for i in range(count):
+        if blocking:
+            state._dump(filename)
+        else:
+            await state._adump(filename)
+        await asyncio.sleep(0.005)
+
+
+async def run(state, filename, blocking, count):
+    """ Returns sorted tick lags while persisting"""
+    lags = []
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lags, stop))
+    await persist(state, filename, blocking, count)
+    stop.set()
+    await tick
+    return sorted(lags)
+
+
+def bench(size=20000, count=20):
+    """ Run benchmark and print table of results"""
+    state = State(size)
+    filename = os.path.join(tempfile.mkdtemp(), "state.json")
+    rows = []
+    for blocking in (True, False):
+        lags = asyncio.run(run(state, filename, blocking, count))
+        p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+        rows.append(("_dump" if blocking else "_adump", len(lags), p99, lags[-1]))
+
+    print("%d bytes persisted %d times" % (os.path.getsize(filename), count))
+    print("%8s %8s %14s %14s" % ("method", "ticks", "p99 lag ms", "max lag ms"))
+    for name, ticks, p99, worst in rows:
+        print("%8s %8d %14.2f %14.2f" % (name, ticks, p99 * 1e3, worst * 1e3))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,102 @@
+""" Benchmark matrix of JSON backends on the unit test fixtures and on a
+    large synthetic object graph.
+
+    $ python -m brining.benchmarks.benchBackend
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import time
+
+from collections import OrderedDict as odict
+
+from brining import Brine, Backends, Debriner, setBackend, getBackend
+
+
+class B(Brine):
+    """ Fixture like the unit test class B"""
+    X = 0
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+        self.z = 3
+
+
+class Node(Brine):
+    """ Synthetic graph node"""
+    def __init__(self):
+        self.name = ""
+        self.value = 0.0
+        self.tags = []
+        self.children = []
+
+
+def makeFixtures():
+    """ Returns odict of fixture name to brined object"""
+    flat = B()
+    over = B()
+    over.name = "Over"
+    over.under = B()
+    over.under.name = "Under"
+    over.under.under = B()
+    return odict([("flat", flat), ("recursive", over)])
+
+
+def makeGraph(breadth=20, depth=3):
+    """ Returns root Node of tree with breadth children per node"""
+    def make(level, index):
+        node = Node()
+        node.name = "node-%d-%d" % (level, index)
+        node.value = index * 1.25
+        node.tags = ["a", "b", index]
+        if level < depth:
+            node.children = [make(level + 1, i) for i in range(breadth)]
+        return node
+    return make(0, 0)
+
+
+def timed(func, number):
+    """ Returns best of three mean seconds per call of func"""
+    best = None
+    for i in range(3):
+        start = time.perf_counter()
+        for j in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench():
+    """ Run benchmark matrix and print table of results"""
+    cases = [(name, brinee, 5000) for name, brinee in makeFixtures().items()]
+    cases.append(("graph", makeGraph(), 3))
+    default = getBackend()
+    rows = []
+    try:
+        for name, brinee, number in cases:
+            reference = None
+            for backend in Backends:
+                setBackend(backend)
+                debriner = Debriner([B, Node])
+                s = brinee._dumps()
+                if reference is None:
+                    reference = s
+                same = (s == reference)
+                dumps = timed(lambda: brinee._dumps(), number)
+                loads = timed(lambda: debriner.loads(s), number)
+                rows.append((name, backend, len(s), same, dumps, loads))
+    finally:
+        setBackend(default)
+
+    print("%10s %11s %10s %9s %12s %12s" %
+          ("case", "backend", "bytes", "identical", "dumps us", "debrine us"))
+    for name, backend, size, same, dumps, loads in rows:
+        print("%10s %11s %10d %9s %12.1f %12.1f" %
+              (name, backend, size, same, dumps * 1e6, loads * 1e6))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,67 @@
+""" Benchmark of the type codec registry: dumps and debrines of an object
+    whose attributes are datetime, Decimal, UUID, Enum and set values versus
+    one with the same count of plain int attributes.
+
+    $ python -m brining.benchmarks.benchCodecs
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import enum
+import uuid
+import decimal
+import datetime
+import timeit
+
+import brining
+from brining import brined, Debriner
+
+
+class Level(enum.Enum):
+    LOW = 1
+    HIGH = 2
+
+
+@brined()
+class Typed(object):
+    """ Fixture of codec values"""
+    def __init__(self):
+        self.when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        self.cost = decimal.Decimal("12.50")
+        self.ident = uuid.UUID(int=12345)
+        self.level = Level.HIGH
+        self.tags = set(["alpha", "beta"])
+        self.items = [uuid.UUID(int=1), decimal.Decimal("0.1")]
+
+
+@brined()
+class Plain(object):
+    """ Fixture of as many int values"""
+    def __init__(self):
+        self.when = 1
+        self.cost = 2
+        self.ident = 3
+        self.level = 4
+        self.tags = 5
+        self.items = [6, 7]
+
+
+def bench(number=20000):
+    """ Run benchmark and print table of results"""
+    brining.register(Level)
+    debriner = Debriner([Typed, Plain])
+    print("backend %s, %d runs" % (brining.getBackend().name, number))
+    print("%8s %10s %10s %10s" % ("fixture", "dumps us", "debrine us", "bytes"))
+    rows = []
+    for obj in (Plain(), Typed()):
+        s = obj._dumps()
+        times = [timeit.timeit(func, number=number) / number * 1e6
+                 for func in (lambda: obj._dumps(), lambda: debriner.loads(s))]
+        print("%8s %10.2f %10.2f %10d" % tuple([obj.__class__.__name__] + times + [len(s)]))
+        rows.append((obj.__class__.__name__, times, len(s)))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,48 @@
+""" Benchmark of size and speed of columnar dumps_columns/debrines_columns
+    versus row wise dumps_many/debrines of one class of objects.
+
+    $ python -m brining.benchmarks.benchColumns
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import timeit
+
+import brining
+from brining import brined, to_columns, dumps_columns, debrines_columns, dumps_many, debrines
+
+
+@brined()
+class Reading(object):
+    """ Sensor reading record"""
+    def __init__(self, stamp=0, sensor="probe", value=0.0, valid=True):
+        self.stamp = stamp
+        self.sensor = sensor
+        self.value = value
+        self.valid = valid
+
+
+def bench(count=10000, number=5):
+    """ Run benchmark and print table of results"""
+    readings = [Reading(i, "probe%d" % (i % 8), i * 0.125, i % 5 != 0)
+                for i in range(count)]
+    rows = dumps_many(readings, format='array', indent=None)
+    columns = dumps_columns(readings)
+    times = [timeit.timeit(func, number=number) / number / count * 1e6
+             for func in (lambda: dumps_many(readings, format='array', indent=None),
+                          lambda: dumps_columns(readings),
+                          lambda: debrines(rows, [Reading]),
+                          lambda: debrines_columns(columns, [Reading]),
+                          lambda: to_columns(readings, kind='array'))]
+    print("%d records, backend %s, %d runs" % (count, brining.getBackend().name, number))
+    print("%8s %8s %10s %10s %10s %10s %10s" % ("rows B", "cols B", "rows us",
+                                                "cols us", "debrine us",
+                                                "decols us", "to_col us"))
+    print("%8d %8d %10.3f %10.3f %10.3f %10.3f %10.3f" %
+          tuple([len(rows), len(columns)] + times))
+    return (len(rows), len(columns), times)
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,55 @@
+""" Benchmark of compiled serializers generated from annotations versus the
+    generic dumpable and update path.
+
+    $ python -m brining.benchmarks.benchCompiled
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import timeit
+
+from brining import brinify
+
+
+def makeClass(count=10, compiled=False):
+    """ Returns brined class with count annotated int and str fields"""
+    annotations = {}
+    for i in range(count):
+        annotations["i%02d" % i] = int
+        annotations["s%02d" % i] = str
+
+    def init(self):
+        for name, annotation in annotations.items():
+            setattr(self, name, annotation())
+
+    cls = type("R", (object, ), dict(__annotations__=annotations, __init__=init))
+    return brinify(cls, compiled=compiled)
+
+
+def bench(number=20000):
+    """ Run benchmark and print table of results"""
+    rows = []
+    for count in (5, 20, 50):
+        timings = []
+        for compiled in (False, True):
+            r = makeClass(count, compiled=compiled)()
+            s = r._dumps()
+            dct = r._dumpable()
+            timings.append([min(timeit.repeat(func, number=number, repeat=3)) / number
+                            for func in (lambda: r._dumpable(),
+                                         lambda: r._dumps(),
+                                         lambda: r._update(dct),
+                                         lambda: r._loads(s))])
+        rows.append((count, timings[0], timings[1]))
+
+    print("%6s %10s %12s %12s %8s" % ("fields", "op", "generic us", "compiled us", "speedup"))
+    for count, generic, compiled in rows:
+        for op, old, new in zip(("_dumpable", "_dumps", "_update", "_loads"), generic, compiled):
+            print("%6d %10s %12.2f %12.2f %7.2fx" %
+                  (count * 2, op, old * 1e6, new * 1e6, old / new))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
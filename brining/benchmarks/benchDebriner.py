@@ -0,0 +1,97 @@
+""" Benchmark of a reused Debriner with O(1) hint dispatch versus debrines
+    and versus the previous debrines that scanned classes linearly per object.
+
+    $ python -m brining.benchmarks.benchDebriner
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import time
+
+from collections import OrderedDict as odict
+
+from brining import brined, brinify, Debriner, debrines, json
+
+
+def legacyDebrines(s,
+                   classes=None,
+                   propertied=False,
+                   safed=False,
+                   hinted=True,
+                   extendable=False):
+    """ Reference copy of debrines before Debriner for comparison"""
+    if classes is None:
+        classes = []
+
+    def hook(pairs):
+        dct = odict(pairs)
+        hint =  dct.get('@class')
+        for cls in classes:
+            if cls.__name__ == hint:
+                return brinify( cls,
+                                propertied=propertied,
+                                safed=safed,
+                                hinted=hinted,
+                                extendable=extendable)()._update(dct)
+        return dct
+
+    return json.loads(s, object_pairs_hook=hook)
+
+
+def makeClasses(count=60):
+    """ Returns list of count brined record classes and a root class"""
+    classes = []
+    for i in range(count):
+        def init(self):
+            self.a = 0
+            self.b = ""
+            self.c = None
+        classes.append(type("R%02d" % i, (object, ), dict(__init__=init)))
+
+    class Root(object):
+        def __init__(self):
+            self.items = []
+
+    classes.append(Root)
+    return classes
+
+
+def makeSerialization(classes, count=100000):
+    """ Returns hinted JSON with root holding count nested records"""
+    records = [odict([("a", i), ("b", "rec"), ("c", None),
+                      ("@class", classes[i % (len(classes) - 1)].__name__)])
+               for i in range(count)]
+    return json.dumps(odict([("items", records), ("@class", "Root")]))
+
+
+def timed(func, repeat=3):
+    """ Returns best wall time of repeat calls of func"""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(classCount=60, objectCount=100000, loads=5):
+    """ Run benchmark and print results"""
+    classes = makeClasses(classCount)
+    s = makeSerialization(classes, objectCount)
+    debriner = Debriner(classes)
+
+    old = timed(lambda: [legacyDebrines(s, classes) for i in range(loads)])
+    mid = timed(lambda: [debrines(s, classes) for i in range(loads)])
+    new = timed(lambda: [debriner.loads(s) for i in range(loads)])
+
+    print("%d classes, %d nested objects, %d loads" % (classCount, objectCount, loads))
+    print("%22s %10.3f s" % ("legacy debrines", old))
+    print("%22s %10.3f s %7.2fx" % ("debrines", mid, old / mid))
+    print("%22s %10.3f s %7.2fx" % ("reused Debriner", new, old / new))
+    return (old, mid, new)
+
+
+if __name__ == '__main__':
+    bench()
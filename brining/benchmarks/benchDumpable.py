@@ -0,0 +1,99 @@
+""" Benchmark of dumpable with the cached per class dump plan versus the
+    previous path that introspected the class on every call.
+
+    $ python -m brining.benchmarks.benchDumpable
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import inspect
+import timeit
+
+from collections import OrderedDict as odict
+
+from brining import brined, json
+
+
+def legacyDumpable(self, deep=False):
+    """ Reference copy of dumpable before dump plans for comparison"""
+    if self._Keys is None:
+        keys = list(self.__dict__.keys())
+        if self._Propertied:
+            props = [key for key in dir(self) if hasattr(self.__class__, key) and
+                     inspect.isdatadescriptor(getattr(self.__class__, key))]
+            keys.extend(props)
+        keys.sort()
+    else:
+        keys = self._Keys
+
+    dumpable = odict()
+    for name in keys:
+        if name.startswith('_'): continue
+        try:
+            attr = getattr(self, name)
+        except AttributeError as ex:
+            continue
+        if inspect.isroutine(attr): continue
+        if deep and hasattr(attr, '_Brined'):
+            dumpable[name] = attr._dumpable()
+            continue
+        if not hasattr(attr, '_Brined') and self._Safed:
+            try:
+                temp = json.dumps(attr)
+            except TypeError as ex:
+                continue
+        dumpable[name] = attr
+
+    if self._Hinted:
+        dumpable["@class"] = self.__class__.__name__
+    return dumpable
+
+
+def makeClass(count=10, propertied=False, keyed=False):
+    """ Returns brined class with count attributes and a few properties"""
+    names = ["a%02d" % i for i in range(count)]
+
+    @brined(keys=(names + ['p']) if keyed else None, propertied=propertied)
+    class R(object):
+        def __init__(self):
+            for i, name in enumerate(names):
+                setattr(self, name, i)
+            self._p = 0
+
+        def getp(self):
+            return self._p
+        def setp(self, value):
+            self._p = value
+        p = property(getp, setp)
+
+        def method(self):
+            pass
+
+    return R
+
+
+def bench(number=20000, repeat=3):
+    """ Run benchmark and print table of results"""
+    rows = []
+    for count in (5, 20, 50):
+        for propertied in (False, True):
+            for keyed in (False, True):
+                R = makeClass(count, propertied=propertied, keyed=keyed)
+                r = R()
+                assert legacyDumpable(r) == r._dumpable()
+                old = min(timeit.repeat(lambda: legacyDumpable(r), number=number, repeat=repeat))
+                new = min(timeit.repeat(lambda: r._dumpable(), number=number, repeat=repeat))
+                rows.append((count, propertied, keyed, old, new))
+
+    print("%5s %10s %6s %12s %12s %8s" %
+          ("attrs", "propertied", "keyed", "legacy us", "plan us", "speedup"))
+    for count, propertied, keyed, old, new in rows:
+        print("%5d %10s %6s %12.2f %12.2f %7.2fx" %
+              (count, propertied, keyed, old * 1e6 / number, new * 1e6 / number,
+               old / new))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,86 @@
+""" Benchmark of lazy versus eager Debriner loads of a large document when
+    only a few nested objects are used.
+
+    $ python -m brining.benchmarks.benchLazy
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import time
+
+from collections import OrderedDict as odict
+
+from brining import Debriner, json
+
+
+class Setting(object):
+    def __init__(self):
+        self.name = ""
+        self.value = None
+        self.limits = [0, 0]
+        self.enabled = True
+
+
+class Section(object):
+    def __init__(self):
+        self.name = ""
+        self.settings = []
+
+
+class Config(object):
+    def __init__(self):
+        self.sections = []
+
+
+def makeSerialization(sectionCount=200, settingCount=100):
+    """ Returns hinted JSON config of sectionCount sections of settingCount"""
+    sections = []
+    for i in range(sectionCount):
+        settings = [odict([("enabled", True),
+                           ("limits", [0, j]),
+                           ("name", "setting%d" % j),
+                           ("value", j),
+                           ("@class", "Setting")])
+                    for j in range(settingCount)]
+        sections.append(odict([("name", "section%d" % i),
+                               ("settings", settings),
+                               ("@class", "Section")]))
+    return json.dumps(odict([("sections", sections), ("@class", "Config")]))
+
+
+def timed(func, repeat=3):
+    """ Returns best wall time of repeat calls of func"""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(sectionCount=200, settingCount=100, loads=5, used=10):
+    """ Run benchmark and print results"""
+    s = makeSerialization(sectionCount, settingCount)
+    classes = [Config, Section, Setting]
+    eager = Debriner(classes)
+    lazy = Debriner(classes, lazy=True)
+
+    def use(debriner):
+        config = debriner.loads(s)
+        for section in config.sections[:used]:
+            section.settings[0].value
+
+    old = timed(lambda: [use(eager) for i in range(loads)])
+    new = timed(lambda: [use(lazy) for i in range(loads)])
+
+    print("%d nested objects, %d sections used, %d loads" %
+          (sectionCount * (settingCount + 1), used, loads))
+    print("%22s %10.3f s" % ("eager Debriner", old))
+    print("%22s %10.3f s %7.2fx" % ("lazy Debriner", new, old / new))
+    return (old, new)
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,91 @@
+""" Benchmark of size and speed of MessagePack ._packb/debrine_packed versus
+    JSON ._dumps/debrines on the fixtures of the unit tests.
+
+    $ python -m brining.benchmarks.benchPacked
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import timeit
+
+import brining
+from brining import brined, Debriner
+
+
+@brined()
+class B(object):
+    """ Flat fixture of the README and testBrine"""
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+        self.z = 3
+
+
+@brined()
+class Over(object):
+    """ Recursive fixture of testDebrine"""
+    def __init__(self):
+        self.a = 0
+        self.name = "Over"
+        self.under = None
+        self.x = 1
+        self.y = 2
+        self.z = 3
+
+
+@brined()
+class Under(object):
+    def __init__(self):
+        self.a = 2
+        self.name = "Bottom"
+        self.under = None
+
+
+@brined()
+class Record(object):
+    """ Mixed value record"""
+    def __init__(self):
+        self.name = "record"
+        self.value = 123456
+        self.scale = 0.125
+        self.tags = ["alpha", "beta", "gamma"]
+        self.limits = {"low": -40, "high": 85}
+        self.enabled = True
+
+
+def fixtures():
+    """ Returns list of (name, fixture object) duples"""
+    over = Over()
+    over.under = Over()
+    over.under.name = "Under"
+    over.under.under = Under()
+    return [("flat", B()), ("recursive", over), ("record", Record())]
+
+
+def bench(number=20000):
+    """ Run benchmark and print table of results"""
+    engine = "msgpack" if brining.msgpack is not None else "pure python"
+    debriner = Debriner([B, Over, Under, Record])
+    print("MessagePack engine %s, JSON backend %s, %d runs" %
+          (engine, brining.getBackend().name, number))
+    print("%10s %6s %6s %10s %10s %10s %10s" % ("fixture", "json B", "pack B",
+                                                 "dumps us", "packb us",
+                                                 "debrine us", "unpack us"))
+    rows = []
+    for name, obj in fixtures():
+        s = obj._dumps(indent=None)
+        data = obj._packb()
+        times = [timeit.timeit(func, number=number) / number * 1e6
+                 for func in (lambda: obj._dumps(indent=None),
+                              lambda: obj._packb(),
+                              lambda: debriner.loads(s),
+                              lambda: debriner.unpackb(data))]
+        print("%10s %6d %6d %10.2f %10.2f %10.2f %10.2f" %
+              tuple([name, len(s), len(data)] + times))
+        rows.append((name, len(s), len(data), times))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
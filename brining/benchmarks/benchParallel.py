@@ -0,0 +1,62 @@
+""" Benchmark of throughput scaling of dumps_many with 1 to N pool workers.
+
+    $ python -m brining.benchmarks.benchParallel
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import time
+
+from brining import brined, dumps_many, poolExecutor
+
+
+@brined()
+class Record(object):
+    """ Module level so process pool workers can unpickle it"""
+    def __init__(self, i=0):
+        self.name = "record%d" % i
+        self.value = i
+        self.scale = i * 0.5
+        self.tags = ["a", "b", "c"]
+        self.limits = {"low": 0, "high": i}
+
+
+def timed(func, repeat=3):
+    """ Returns best wall time of repeat calls of func"""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(count=200000, chunk=4096, most=None):
+    """ Run benchmark and print table of results"""
+    most = most if most is not None else max(4, os.cpu_count() or 1)
+    records = [Record(i) for i in range(count)]
+    serial = timed(lambda: dumps_many(records, format='array'))
+
+    print("%d objects, %d per chunk, %d cpus" % (count, chunk, os.cpu_count() or 1))
+    print("%8s %10s %14s %9s" % ("workers", "seconds", "objects/s", "scaling"))
+    print("%8s %10.3f %14.0f %9.2f" % ("serial", serial, count / serial, 1.0))
+    results = [(0, serial)]
+    workers = 1
+    while workers <= most:
+        with poolExecutor(workers) as executor: # started once, reused
+            elapsed = timed(lambda: dumps_many(records,
+                                               format='array',
+                                               executor=executor,
+                                               chunk=chunk))
+        print("%8d %10.3f %14.0f %9.2f" % (workers, elapsed, count / elapsed,
+                                           serial / elapsed))
+        results.append((workers, elapsed))
+        workers *= 2
+    return results
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,73 @@
+""" Benchmark of throughput scaling of debrine_parallel with 1 to N pool
+    workers versus serial iterdebrine of a JSON Lines file.
+
+    $ python -m brining.benchmarks.benchParallelLoad
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import time
+import tempfile
+
+from brining import brined, dump_many, iterdebrine, debrine_parallel, poolExecutor
+
+
+@brined()
+class Record(object):
+    """ Module level so process pool workers can pickle it"""
+    def __init__(self, i=0):
+        self.name = "record%d" % i
+        self.value = i
+        self.scale = i * 0.5
+        self.tags = ["a", "b", "c"]
+        self.limits = {"low": 0, "high": i}
+
+
+def timed(func, repeat=3):
+    """ Returns best wall time of repeat calls of func"""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(count=200000, chunk=1 << 20, most=None):
+    """ Run benchmark and print table of results"""
+    most = most if most is not None else max(4, os.cpu_count() or 1)
+    fd, filename = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    try:
+        dump_many((Record(i) for i in range(count)), filename)
+        serial = timed(lambda: list(iterdebrine(filename, [Record])))
+
+        print("%d objects, %d bytes, %d per chunk, %d cpus" %
+              (count, os.path.getsize(filename), chunk, os.cpu_count() or 1))
+        print("%8s %10s %14s %9s" % ("workers", "seconds", "objects/s", "scaling"))
+        print("%8s %10.3f %14.0f %9.2f" % ("serial", serial, count / serial, 1.0))
+        results = [(0, serial)]
+        workers = 1
+        while workers <= most:
+            with poolExecutor(workers) as executor: # started once, reused
+                for ordered in (True, False):
+                    elapsed = timed(lambda: list(debrine_parallel(filename,
+                                                                  [Record],
+                                                                  executor=executor,
+                                                                  ordered=ordered,
+                                                                  chunk=chunk)))
+                    print("%8s %10.3f %14.0f %9.2f" %
+                          ("%d%s" % (workers, "" if ordered else " u"),
+                           elapsed, count / elapsed, serial / elapsed))
+                    results.append((workers, ordered, elapsed))
+            workers *= 2
+    finally:
+        os.remove(filename)
+    return results
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,66 @@
+""" Memory and speed benchmark of dict backed versus slotted brined instances.
+
+    $ python -m brining.benchmarks.benchSlots
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import gc
+import timeit
+import tracemalloc
+
+from brining import brined
+
+
+@brined()
+class Dicted(object):
+    """ Dict backed record"""
+    def __init__(self, x=0, y=0.0, z=""):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@brined()
+class Slotted(object):
+    """ Slotted record"""
+    __slots__ = ('x', 'y', 'z')
+    def __init__(self, x=0, y=0.0, z=""):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+def measure(cls, count):
+    """ Returns bytes allocated per instance for count instances of cls"""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    records = [cls(i, i * 0.5, "z") for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del records
+    return size / float(count)
+
+
+def bench(count=100000, number=20000):
+    """ Run benchmark and print table of results"""
+    rows = []
+    for cls in (Dicted, Slotted):
+        size = measure(cls, count)
+        record = cls(1, 2.0, "z")
+        s = record._dumps()
+        dumps = min(timeit.repeat(lambda: record._dumps(), number=number, repeat=3))
+        loads = min(timeit.repeat(lambda: record._loads(s), number=number, repeat=3))
+        rows.append((cls.__name__, size, dumps / number, loads / number))
+
+    print("%d instances" % count)
+    print("%8s %16s %10s %10s" % ("class", "bytes/instance", "dumps us", "loads us"))
+    for name, size, dumps, loads in rows:
+        print("%8s %16.1f %10.2f %10.2f" % (name, size, dumps * 1e6, loads * 1e6))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
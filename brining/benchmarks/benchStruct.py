@@ -0,0 +1,56 @@
+""" Benchmark of size and speed of fixed size struct records with pack_many
+    and unpack_many versus JSON Lines with dumps_many and debrines.
+
+    $ python -m brining.benchmarks.benchStruct
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import timeit
+
+import brining
+from brining import brined, pack_many, unpack_many, dumps_many, debrines
+
+
+@brined(layout='struct')
+class Sample(object):
+    """ Numeric record"""
+    stamp: int = 0
+    value: float = 0.0
+    scale: float = 1.0
+    valid: bool = True
+
+    def __init__(self, stamp=0, value=0.0, scale=1.0, valid=True):
+        self.stamp = stamp
+        self.value = value
+        self.scale = scale
+        self.valid = valid
+
+
+def bench(count=10000, number=5):
+    """ Run benchmark and print table of results"""
+    samples = [Sample(i, i * 0.25, 1.0 / (i + 1), i % 3 != 0) for i in range(count)]
+    buffer = pack_many(samples)
+    s = dumps_many(samples, format='array', backend='json')
+    size = Sample._StructLayout.struct.size
+
+    times = [timeit.timeit(func, number=number) / number / count * 1e6
+             for func in (lambda: pack_many(samples),
+                          lambda: unpack_many(buffer, Sample),
+                          lambda: dumps_many(samples, format='array', backend='json'),
+                          lambda: debrines(s, [Sample]))]
+    middle = count // 2
+    access = timeit.timeit(lambda: unpack_many(buffer, Sample, start=middle, count=1),
+                           number=10000) / 10000 * 1e6
+    print("%d records of %d bytes, %d runs" % (count, size, number))
+    print("%8s %8s %10s %10s %10s %10s %10s" % ("struct B", "json B", "pack us",
+                                                "unpack us", "dumps us",
+                                                "debrine us", "seek us"))
+    print("%8d %8d %10.3f %10.3f %10.3f %10.3f %10.3f" %
+          tuple([len(buffer), len(s)] + times + [access]))
+    return (len(buffer), len(s), times, access)
+
+
+if __name__ == '__main__':
+    bench()
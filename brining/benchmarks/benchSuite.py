@@ -0,0 +1,289 @@
+""" Benchmark suite of the brining hot paths with machine readable results and
+    a comparison of two runs that flags regressions.
+
+    Covers _dumpable, _dumps, _update, _loads, _dump/_load, debrines and
+    debrine over a grid of attribute count, nesting depth, class settings
+    (_Propertied, _Safed, _Hinted, _Extendable) and batch size.
+
+    $ python -m brining.benchmarks.benchSuite run --output before.json
+    $ python -m brining.benchmarks.benchSuite run --output after.json
+    $ python -m brining.benchmarks.benchSuite compare before.json after.json
+
+    compare exits with status 1 when any case is slower by more than the
+    threshold, default 10%, so it can gate a CI job.
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import re
+import time
+import timeit
+import platform
+import argparse
+import tempfile
+
+from collections import OrderedDict as odict
+
+import brining
+from brining import brinify, debrines, debrine, json
+
+
+Settings = odict([("default", dict()),
+                  ("propertied", dict(propertied=True)),
+                  ("safed", dict(safed=True)),
+                  ("unhinted", dict(hinted=False)),
+                  ("extendable", dict(extendable=True))])
+
+Grid = odict([("attrs", (4, 32)),
+              ("depth", (0, 2)),
+              ("settings", tuple(Settings)),
+              ("batch", (1, 100))])
+
+QuickGrid = odict([("attrs", (8, )),
+                   ("depth", (1, )),
+                   ("settings", ("default", "safed")),
+                   ("batch", (1, 100))])
+
+Operations = ("dumpable", "dumps", "update", "loads", "dumpload", "debrines", "debrine")
+
+
+def makeClasses(attrs, depth, setting):
+    """ Returns list of brined classes for depth levels of nesting, the root
+        first. Each class has attrs attributes of mixed types, a property and
+        a child attribute holding an instance of the next class, if any.
+    """
+    classes = []
+    child = None
+    for level in range(depth, -1, -1):
+        def init(self, child=child, level=level):
+            for i in range(attrs):
+                kind = i % 4
+                if kind == 0:
+                    value = i
+                elif kind == 1:
+                    value = i * 0.5
+                elif kind == 2:
+                    value = "value%d" % i
+                else:
+                    value = [i, "x", None]
+                setattr(self, "a%02d" % i, value)
+            self._p = level
+            if child is not None:
+                self.child = child()
+
+        def getp(self):
+            return self._p
+
+        def setp(self, value):
+            self._p = value
+
+        name = "Level%d_%d_%d_%s" % (level, attrs, depth, setting)
+        cls = type(name, (object, ), dict(__init__=init, p=property(getp, setp)))
+        brinify(cls, **Settings[setting])
+        classes.insert(0, cls)
+        child = cls
+    return classes
+
+
+def measure(func, minimum=0.05, repeat=3):
+    """ Returns best seconds per call of func over repeat timings of enough
+        calls to take at least minimum seconds, and the number of calls.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= minimum / 5.0 or number >= 1 << 20:
+            break
+        number *= 2
+    number = max(1, int(number * minimum / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return (best / number, number)
+
+
+def cases(grid):
+    """ generator of (name, attrs, depth, setting, batch) cases of grid"""
+    for attrs in grid["attrs"]:
+        for depth in grid["depth"]:
+            for setting in grid["settings"]:
+                for batch in grid["batch"]:
+                    yield ("attrs=%d/depth=%d/%s/batch=%d" % (attrs, depth, setting, batch),
+                           attrs, depth, setting, batch)
+
+
+def operations(attrs, depth, setting, batch, filename, scratch):
+    """ Returns odict of operation functions for one case keyed by name.
+        Each function runs its operation on batch objects.
+        filename is written with the array of objects for debrine and
+        scratch is the file of _dump and _load.
+    """
+    classes = makeClasses(attrs, depth, setting)
+    root = classes[0]
+    objs = [root() for i in range(batch)]
+    s = objs[0]._dumps()
+    dct = json.loads(s, object_pairs_hook=odict)
+    array = json.dumps(objs, default=brining.default, indent=2)
+    with open(filename, "w") as f:
+        f.write(array)
+
+    def dumpable():
+        for obj in objs:
+            obj._dumpable()
+
+    def dumps():
+        for obj in objs:
+            obj._dumps()
+
+    def update():
+        for obj in objs:
+            obj._update(dct)
+
+    def loads():
+        for obj in objs:
+            obj._loads(s)
+
+    def dumpload():
+        for obj in objs:
+            obj._dump(scratch, durability='none')
+            obj._load(scratch)
+
+    def debrinesArray():
+        debrines(array, classes, **Settings[setting])
+
+    def debrineArray():
+        debrine(filename, classes, **Settings[setting])
+
+    return odict([("dumpable", dumpable),
+                  ("dumps", dumps),
+                  ("update", update),
+                  ("loads", loads),
+                  ("dumpload", dumpload),
+                  ("debrines", debrinesArray),
+                  ("debrine", debrineArray)])
+
+
+def run(grid=Grid, pattern=None, minimum=0.05, repeat=3, report=None):
+    """ Runs benchmark cases of grid whose names match regex pattern.
+        Returns results dict with "meta" and "results" keyed by case name
+        of dicts with seconds per object, batch, calls and repeat.
+        report if given is called as report(name, result) after each case.
+    """
+    matcher = re.compile(pattern) if pattern else None
+    results = odict()
+    fd, filename = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    fd, scratch = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        for base, attrs, depth, setting, batch in cases(grid):
+            funcs = None
+            for operation in Operations:
+                name = "%s/%s" % (operation, base)
+                if matcher is not None and not matcher.search(name):
+                    continue
+                if funcs is None:
+                    funcs = operations(attrs, depth, setting, batch, filename, scratch)
+                seconds, number = measure(funcs[operation], minimum, repeat)
+                result = odict([("seconds", seconds / batch),
+                                ("batch", batch),
+                                ("calls", number),
+                                ("repeat", repeat)])
+                results[name] = result
+                if report is not None:
+                    report(name, result)
+    finally:
+        os.remove(filename)
+        os.remove(scratch)
+
+    meta = odict([("python", platform.python_version()),
+                  ("implementation", platform.python_implementation()),
+                  ("platform", platform.platform()),
+                  ("backend", brining.getBackend().name),
+                  ("time", time.strftime("%Y-%m-%dT%H:%M:%S"))])
+    return odict([("meta", meta), ("results", results)])
+
+
+def compare(old, new, threshold=0.10):
+    """ Returns list of (name, old seconds, new seconds, ratio, flag) tuples for
+        cases in both results dicts old and new. flag is "REGRESSION" when new
+        is slower than old by more than threshold fraction, "faster" when new
+        is faster by more than threshold, else "".
+    """
+    rows = []
+    for name, result in new["results"].items():
+        before = old["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["seconds"] / before["seconds"]
+        if ratio > 1.0 + threshold:
+            flag = "REGRESSION"
+        elif ratio < 1.0 / (1.0 + threshold):
+            flag = "faster"
+        else:
+            flag = ""
+        rows.append((name, before["seconds"], result["seconds"], ratio, flag))
+    return rows
+
+
+def main(argv=None):
+    """ Command line entry point, returns exit status"""
+    parser = argparse.ArgumentParser(prog="python -m brining.benchmarks.benchSuite",
+                                     description="Benchmark suite of brining hot paths.")
+    commands = parser.add_subparsers(dest="command")
+
+    runner = commands.add_parser("run", help="run benchmarks and save results")
+    runner.add_argument("--output", "-o", default="bench_results.json",
+                        help="results file, default bench_results.json")
+    runner.add_argument("--filter", "-k", default=None,
+                        help="regex of case names to run")
+    runner.add_argument("--quick", "-q", action="store_true",
+                        help="run a small grid")
+    runner.add_argument("--minimum", type=float, default=0.05,
+                        help="minimum seconds per timing, default 0.05")
+    runner.add_argument("--repeat", type=int, default=3,
+                        help="timings per case, best is kept, default 3")
+
+    comparer = commands.add_parser("compare", help="compare two results files")
+    comparer.add_argument("old", help="baseline results file")
+    comparer.add_argument("new", help="new results file")
+    comparer.add_argument("--threshold", "-t", type=float, default=0.10,
+                          help="slowdown fraction flagged as regression, default 0.10")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        def report(name, result):
+            print("%-60s %12.3f us" % (name, result["seconds"] * 1e6))
+
+        results = run(QuickGrid if args.quick else Grid,
+                      pattern=args.filter,
+                      minimum=args.minimum,
+                      repeat=args.repeat,
+                      report=report)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print("Wrote %d results to %s" % (len(results["results"]), args.output))
+        return 0
+
+    if args.command == "compare":
+        with open(args.old, "r") as f:
+            old = json.load(f)
+        with open(args.new, "r") as f:
+            new = json.load(f)
+        rows = compare(old, new, threshold=args.threshold)
+        print("%-60s %12s %12s %8s" % ("case", "old us", "new us", "ratio"))
+        for name, before, after, ratio, flag in rows:
+            print("%-60s %12.3f %12.3f %8.2f %s" % (name, before * 1e6, after * 1e6,
+                                                     ratio, flag))
+        regressions = [row for row in rows if row[4] == "REGRESSION"]
+        print("%d cases compared, %d regressions over %.0f%%" %
+              (len(rows), len(regressions), args.threshold * 100))
+        return 1 if regressions else 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
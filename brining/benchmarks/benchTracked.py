@@ -0,0 +1,66 @@
+""" Benchmark of repeated dumps of a large mostly unchanged tree of tracked
+    brined objects that splice cached fragments versus untracked objects.
+
+    $ python -m brining.benchmarks.benchTracked
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import time
+
+from brining import brined
+
+
+class Record(object):
+    def __init__(self, i=0):
+        self.name = "record%d" % i
+        self.value = i
+        self.scale = 1.5
+        self.tags = ["a", "b", "c"]
+
+
+class Group(object):
+    def __init__(self, i=0, count=100):
+        self.name = "group%d" % i
+        self.records = [self.Record(j) for j in range(count)]
+
+
+class Tree(object):
+    def __init__(self, groups=100, records=100):
+        self.groups = [self.Group(i, records) for i in range(groups)]
+
+
+def make(tracked=False):
+    """ Returns root class of brined tree classes tracked or not"""
+    record = brined(tracked=tracked)(type("Record", (Record, ), {}))
+    group = brined(tracked=tracked)(type("Group", (Group, ), dict(Record=record)))
+    return brined(tracked=tracked)(type("Tree", (Tree, ), dict(Group=group)))
+
+
+def timed(tree, dumps=10, changes=10):
+    """ Returns wall time of dumps of tree each after changes assignments"""
+    tree._dumps() # warm cache
+    start = time.perf_counter()
+    for i in range(dumps):
+        for j in range(changes):
+            group = tree.groups[(i * changes + j) * 7 % len(tree.groups)]
+            group.records[j].value = i
+        tree._dumps()
+    return time.perf_counter() - start
+
+
+def bench(groups=100, records=100, dumps=10, changes=10):
+    """ Run benchmark and print results"""
+    old = timed(make()(groups, records), dumps, changes)
+    new = timed(make(tracked=True)(groups, records), dumps, changes)
+
+    print("%d objects, %d changes per dump, %d dumps" %
+          (groups * (records + 1) + 1, changes, dumps))
+    print("%22s %10.3f s" % ("untracked", old))
+    print("%22s %10.3f s %7.2fx" % ("tracked", new, old / new))
+    return (old, new)
+
+
+if __name__ == '__main__':
+    bench()
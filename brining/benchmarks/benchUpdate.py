@@ -0,0 +1,114 @@
+""" Benchmark of update with the cached per class update plan versus the
+    previous path that rebuilt the key list and did linear membership tests.
+
+    $ python -m brining.benchmarks.benchUpdate
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import inspect
+import timeit
+
+from collections import OrderedDict as odict
+
+from brining import brined, json
+
+
+def legacyUpdate(self, dct):
+    """ Reference copy of update before update plans for comparison"""
+    if self._Hinted:
+        if dct.get("@class") != self.__class__.__name__:
+            raise TypeError("Class hint '%s' does not match class name '%s'."
+                            % (dct.get("@class"), self.__class__.__name__))
+
+    if self._Keys == None:
+        keys = list(self.__dict__.keys())
+    else:
+        keys = [key for key in self._Keys if key in self.__dict__]
+    if self._Propertied:
+        props = [key for key in dir(self) if hasattr(self.__class__, key) and
+                 inspect.isdatadescriptor(getattr(self.__class__, key)) ]
+        if props:
+            if self._Keys is None:
+                keys.extend(props)
+            else:
+                keys.extend([key for key in props if key in self._Keys])
+
+    if self._Extendable:
+        extends = [key for key in dct if not hasattr(self, key) and key != '@class']
+        if extends:
+            if self._Keys is None:
+                keys.extend(extends)
+            else:
+                keys.extend([key for key in extends if key in self._Keys])
+
+    for key, value in dct.items():
+        if key not in keys:
+            continue
+        if key.startswith('_'):
+            continue
+        try:
+            attr = getattr(self, key)
+        except AttributeError as ex:
+            if self._Extendable:
+                setattr(self, key, value)
+            continue
+        if inspect.isroutine(attr):
+            continue
+        if hasattr(attr, '_Brined'):
+            attr._update(value)
+            continue
+        if not hasattr(attr, '_Brined') and self._Safed:
+            try:
+                temp = json.dumps(attr)
+            except TypeError as ex:
+                continue
+        setattr(self, key, value)
+    return self
+
+
+def makeClass(count=10, propertied=False, extendable=False):
+    """ Returns brined class with count attributes"""
+    names = ["a%03d" % i for i in range(count)]
+
+    @brined(propertied=propertied, extendable=extendable)
+    class R(object):
+        def __init__(self):
+            for i, name in enumerate(names):
+                setattr(self, name, i)
+            self._p = 0
+
+        def getp(self):
+            return self._p
+        def setp(self, value):
+            self._p = value
+        p = property(getp, setp)
+
+    return R
+
+
+def bench(number=500, repeat=3):
+    """ Run benchmark and print table of results"""
+    rows = []
+    for count in (10, 100, 500):
+        for propertied in (False, True):
+            for extendable in (False, True):
+                R = makeClass(count, propertied=propertied, extendable=extendable)
+                r = R()
+                dct = r._dumpable()
+                old = min(timeit.repeat(lambda: legacyUpdate(r, dct), number=number, repeat=repeat))
+                new = min(timeit.repeat(lambda: r._update(dct), number=number, repeat=repeat))
+                rows.append((count, propertied, extendable, old, new))
+
+    print("%5s %10s %10s %12s %12s %8s" %
+          ("attrs", "propertied", "extendable", "legacy us", "plan us", "speedup"))
+    for count, propertied, extendable, old, new in rows:
+        print("%5d %10s %10s %12.2f %12.2f %7.2fx" %
+              (count, propertied, extendable, old * 1e6 / number, new * 1e6 / number,
+               old / new))
+    return rows
+
+
+if __name__ == '__main__':
+    bench()
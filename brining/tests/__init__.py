@@ -6,17 +6,38 @@ Copyright (c) <2013> <Samuel M. Smith>
 """
 
 
-__all__ = ['testBrine', 'testBrined', 'testDebrine']
+__all__ = ['testBrine', 'testBrined', 'testDebrine', 'testBulk', 'testBackend',
+           'testAsync', 'testJournal', 'testMetrics', 'testPacked', 'testStruct', 'testColumns', 'testBuffers', 'testCodecs']
 
 
 def testAll():
     import testBrine
     import testBrined
     import testDebrine
+    import testBulk
+    import testBackend
+    import testAsync
+    import testJournal
+    import testMetrics
+    import testPacked
+    import testStruct
+    import testColumns
+    import testBuffers
+    import testCodecs
 
     testBrine.testAll()
     testBrined.testAll()
     testDebrine.testAll()
+    testBulk.testAll()
+    testBackend.testAll()
+    testAsync.testAll()
+    testJournal.testAll()
+    testMetrics.testAll()
+    testPacked.testAll()
+    testStruct.testAll()
+    testColumns.testAll()
+    testBuffers.testAll()
+    testCodecs.testAll()
 
 
 if __name__ == '__main__' and __package__ is None:
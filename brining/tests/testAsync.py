@@ -0,0 +1,137 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import asyncio
+import unittest
+import concurrent.futures
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import Brine, adebrine, asyncExecutor
+
+class AsyncTestCase(unittest.TestCase):
+    """ Test asyncio dump and load"""
+
+    def setUp(self):
+        class B(Brine):
+            def __init__(self):
+                self.x = 1
+                self.y = 2
+                self.z = 3
+
+        self.B = B
+        self.filename = ".testdumpfile"
+
+    def tearDown(self):
+        pass
+
+    def testDumpLoad(self):
+        """ Async dump to file and load from file"""
+        logger.debug("\nAsync Dump Load\n")
+        brinee = self.B()
+        brinee.x = 10
+
+        async def run():
+            await brinee._adump(self.filename)
+            with open(self.filename, "r") as f:
+                self.assertEqual(f.read(), brinee._dumps())
+
+            other = self.B()
+            result = await other._aload(self.filename)
+            self.assertIs(result, other)
+            self.assertEqual(other.x, 10)
+
+            debrinee = await adebrine(self.filename, [self.B])
+            self.assertIsInstance(debrinee, self.B)
+            self.assertEqual(debrinee._dumps(), brinee._dumps())
+
+            with self.assertRaises(brining.ParameterError):
+                await brinee._adump("")
+
+        asyncio.run(run())
+
+    def testExecutor(self):
+        """ Caller configured executor"""
+        logger.debug("\nAsync Executor\n")
+        default = asyncExecutor()
+        self.assertIs(asyncExecutor(), default)
+
+        brinee = self.B()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            async def run():
+                await brinee._adump(self.filename, executor=executor)
+                return await adebrine(self.filename, [self.B], executor=executor)
+
+            self.assertEqual(asyncio.run(run()).x, 1)
+
+            self.assertIs(asyncExecutor(executor), executor)
+            self.assertEqual(asyncio.run(run()).y, 2)
+
+        self.assertIs(asyncExecutor(default), default)
+
+        workers = brining.AsyncWorkers
+        resized = asyncExecutor(workers=2) # replaces and shuts down default
+        self.assertIsNot(resized, default)
+        self.assertEqual(resized._max_workers, 2)
+        with self.assertRaises(RuntimeError):
+            default.submit(len, "")
+
+        async def load():
+            await brinee._adump(self.filename)
+            return await adebrine(self.filename, [self.B])
+
+        self.assertEqual(asyncio.run(load()).z, 3)
+        asyncExecutor(workers=workers) # restore default size
+        with self.assertRaises(RuntimeError):
+            resized.submit(len, "")
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testDumpLoad')
+    tests.append('testExecutor')
+
+
+    suite = unittest.TestSuite(map(AsyncTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(AsyncTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
@@ -0,0 +1,152 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import unittest
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import (Brine, brined, Backends, JsonBackend, getBackend, setBackend,
+                     detectBackend, debrines)
+
+class BackendTestCase(unittest.TestCase):
+    """ Test pluggable JSON backends"""
+
+    def setUp(self):
+        class B(Brine):
+            def __init__(self):
+                self.a = 1.5
+                self.name = "Over"
+                self.under = None
+                self.items = [1, 2, OrderedDict([("k", None)])]
+                self.text = u"café"
+
+        self.B = B
+        self.brined = B()
+        self.brined.under = B()
+        self.brined.under.name = "Under"
+        self.default = brining.ActiveBackend
+
+    def tearDown(self):
+        setBackend(self.default)
+
+    def testRegistry(self):
+        """ Backend registry and selection"""
+        logger.debug("\nBackend Registry %s\n" % list(Backends.keys()))
+        self.assertIn('json', Backends)
+        self.assertIs(getBackend(), brining.ActiveBackend)
+        self.assertIs(getBackend('json'), Backends['json'])
+        self.assertIs(getBackend(Backends['json']), Backends['json'])
+        with self.assertRaises(brining.ParameterError):
+            getBackend('nosuch')
+
+        self.assertIs(setBackend('json'), Backends['json'])
+        self.assertIs(brining.ActiveBackend, Backends['json'])
+        self.assertIs(setBackend(), Backends[detectBackend()])
+        self.assertNotEqual(detectBackend(), 'orjson') # slower while guarded
+
+    def testIdenticalOutput(self):
+        """ Every backend produces identical output and loads"""
+        s = None
+        for name, backend in Backends.items():
+            setBackend(name)
+            dumped = self.brined._dumps()
+            logger.debug("Backend %s Dumps:\n%s" % (name, dumped))
+            if s is None:
+                s = dumped
+            self.assertEqual(dumped, s)
+            self.assertEqual(backend.dumps(OrderedDict([("f", 1e-05), ("g", 1e100)]),
+                                           indent=2),
+                             '{\n  "f": 1e-05,\n  "g": 1e+100\n}')
+            fallback = getattr(backend, 'fallback', backend)
+            for value in (float('nan'), float('inf'), float('-inf')):
+                data = OrderedDict([("f", value), ("n", None)])
+                try:
+                    expected = fallback.dumps(data, separators=(',', ':'))
+                except ValueError as ex:
+                    with self.assertRaises(ValueError):
+                        backend.dumps(data, separators=(',', ':'))
+                else:
+                    self.assertEqual(backend.dumps(data, separators=(',', ':')), expected)
+                    self.assertNotIn('"f":null', expected)
+            self.assertEqual(backend.loads('{"big": 123456789012345678901234}'),
+                             OrderedDict([("big", 123456789012345678901234)]))
+
+            debrinee = debrines(s, [self.B])
+            self.assertIsInstance(debrinee.under, self.B)
+            self.assertEqual(debrinee._dumps(), s)
+
+    def testClassBackend(self):
+        """ Per class _Backend"""
+        class Probe(JsonBackend):
+            def dumps(self, obj, **kwa):
+                self.count += 1
+                return super(Probe, self).dumps(obj, **kwa)
+
+        probe = Probe('probe', json)
+        probe.count = 0
+
+        @brined(backend=probe)
+        class C(object):
+            def __init__(self):
+                self.x = 1
+
+        self.assertIs(C._Backend, probe)
+        self.assertEqual(C()._dumps(), '{\n  "x": 1,\n  "@class": "C"\n}')
+        self.assertEqual(probe.count, 1)
+        self.brined._dumps()
+        self.assertEqual(probe.count, 1)
+
+        self.B._Backend = 'json'
+        self.assertEqual(self.brined._loads(self.brined._dumps()).name, "Over")
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testRegistry')
+    tests.append('testIdenticalOutput')
+    tests.append('testClassBackend')
+
+
+    suite = unittest.TestSuite(map(BackendTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(BackendTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
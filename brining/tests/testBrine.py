@@ -719,6 +719,119 @@ class BrineTestCase(unittest.TestCase):
         logger.debug("Over deep: \n%s" % (dumpable, ))
         self.assertDictEqual(dumpable, OrderedDict([('name', 'Over'), ('@class', 'B')]))
 
+    def testDumpPlan(self):
+        """ Dump plan cached per class and rebuilt on reassignment"""
+        from brining import dumpPlan
+        logger.debug("\nDump Plan\n")
+
+        self.brined._dumpable()
+        plan = dumpPlan(self.B)
+        self.assertIs(plan, self.B.__dict__['_DumpPlan'])
+        self.assertIsNot(plan, Brine.__dict__['_DumpPlan']) # per subclass plan
+        self.assertIsNone(plan.names)
+        self.assertEqual(plan.props, ())
+        self.assertEqual(plan.hint, 'B')
+        self.brined._dumpable()
+        self.assertIs(dumpPlan(self.B), plan) # reused
+
+        self.B._Propertied = True
+        plan = dumpPlan(self.B)
+        self.assertEqual(plan.props, ('p', ))
+        self.assertEqual(list(self.brined._dumpable().keys()),
+                         ['p', 'x', 'y', 'z', '@class'])
+
+        self.B._Keys = ['z', '_u', 'x']
+        plan = dumpPlan(self.B)
+        self.assertEqual(plan.names, ('z', 'x'))
+        self.assertEqual(list(self.brined._dumpable().keys()),
+                         ['z', 'x', '@class'])
+
+        self.B._Hinted = False
+        self.assertIsNone(dumpPlan(self.B).hint)
+        self.assertEqual(list(self.brined._dumpable().keys()), ['z', 'x'])
+
+    def testUpdatePlan(self):
+        """ Update plan cached per class and rebuilt on reassignment"""
+        from brining import updatePlan, attrKind, PLAIN, BRINED, ROUTINE
+        logger.debug("\nUpdate Plan\n")
+
+        self.assertEqual(attrKind(1), PLAIN)
+        self.assertEqual(attrKind(self.brined), BRINED)
+        self.assertEqual(attrKind(self.B.pest), ROUTINE)
+        self.assertEqual(attrKind(self.brined.getp), ROUTINE)
+
+        class Plain(object):
+            pass
+
+        self.assertEqual(attrKind(self.B), PLAIN) # classes are values not brinees
+        self.assertEqual(attrKind(Plain), PLAIN)
+        self.brined.y = Plain
+        self.assertIs(self.brined._dumpable(deep=True)['y'], Plain)
+        self.brined.y = 2
+
+        plan = updatePlan(self.B)
+        self.assertIs(plan, self.B.__dict__['_UpdatePlan'])
+        self.assertIsNone(plan.keyset)
+        self.assertEqual(plan.hint, 'B')
+
+        self.B._Propertied = True
+        self.B._Keys = ['x', 'p', 'w', '_u']
+        plan = updatePlan(self.B)
+        self.assertEqual(plan.keyset, frozenset(['x', 'p', 'w']))
+        self.assertEqual(plan.props, frozenset(['p']))
+
+        self.brined._update(OrderedDict([('x', 10), ('y', 20), ('p', 30),
+                                         ('w', 40), ('_u', 50), ('@class', 'B')]))
+        self.assertEqual((self.brined.x, self.brined.y, self.brined.p),
+                         (10, 2, 30))
+        self.assertFalse(hasattr(self.brined, 'w'))
+        self.assertEqual(self.brined._u, 4)
+
+        self.B._Extendable = True
+        self.assertIsNot(updatePlan(self.B), plan)
+        self.brined._update(OrderedDict([('w', 40), ('v', 60), ('@class', 'B')]))
+        self.assertEqual(self.brined.w, 40)
+        self.assertFalse(hasattr(self.brined, 'v'))
+        self.assertFalse(hasattr(self.brined, '@class'))
+
+        with self.assertRaises(TypeError):
+            self.brined._update(OrderedDict([('x', 1), ('@class', 'C')]))
+
+    def testBrineSafe(self):
+        """ Type driven serializibility check"""
+        import decimal
+        from brining import brineSafe, SafeKinds, SAFE, UNSAFE
+        logger.debug("\nBrine Safe\n")
+
+        class A(object):
+            pass
+
+        for value in (None, True, 1, 1.5, "s", u"u", [], (), {},
+                      [1, "a", [None, {"k": 2.0}]], {1: "a", None: [True]},
+                      self.brined, [self.brined], decimal.Decimal("1.1"), set([1])):
+            self.assertTrue(brineSafe(value), value) # set and Decimal have codecs
+
+        for value in (A(), [1, A()], {"k": (A(), )}, {(1, 2): 1}):
+            self.assertFalse(brineSafe(value), value)
+
+        cycle = [1]
+        cycle.append(cycle)
+        self.assertFalse(brineSafe(cycle))
+        shared = [1]
+        self.assertTrue(brineSafe([shared, shared])) # shared is not circular
+
+        self.assertEqual(SafeKinds[A], UNSAFE)
+        self.assertEqual(SafeKinds[int], SAFE)
+
+        self.B._Safed = True
+        self.brined.nsa = [A()]
+        self.brined.sa = [self.brined.x, {"y": self.brined.y}]
+        self.assertEqual(list(self.brined._dumpable().keys()),
+                         ['sa', 'x', 'y', 'z', '@class'])
+        self.brined._update(OrderedDict([('nsa', 1), ('sa', [2]), ('@class', 'B')]))
+        self.assertIsInstance(self.brined.nsa[0], A)
+        self.assertEqual(self.brined.sa, [2])
+
 
 def setupLogging():
     """ Setup loggin for tests"""
@@ -750,6 +863,9 @@ def testSome():
     tests.append('testDumpsUnhintedlyRecursive')
     tests.append('testLoadsUnhintedlyRecursive')
     tests.append('testDumpableDeepRecursive')
+    tests.append('testDumpPlan')
+    tests.append('testUpdatePlan')
+    tests.append('testBrineSafe')
 
 
     suite = unittest.TestSuite(map(BrineTestCase, tests))
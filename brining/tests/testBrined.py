@@ -15,7 +15,7 @@ from collections import OrderedDict
 import simplejson as json
 
 #from libs import brining
-from brining import Brine, brined
+from brining import Brine, brined, debrines, dumpPlan, updatePlan
 
 class BrineTestCase(unittest.TestCase):
     """ Test decorator """
@@ -530,6 +530,38 @@ class BrineTestCase(unittest.TestCase):
         logger.debug("After Load: \n%s" % brinee._dumps())
         self.assertEqual(brinee._dumps(), w)
 
+    def testDumpAtomic(self):
+        """ Atomic Dump to File leaves previous file intact on failure"""
+        brinee = self.B()
+        brinee.x =  1
+        brinee.y =  2
+        brinee.z =  3
+
+        filename = ".testdumpfile"
+        logger.debug("\nAtomic Dump to filename %s" % filename)
+        brinee._dump(filename, atomic=True, durability='fsync+dir')
+        with open(filename, "r") as f:
+            r = f.read()
+        self.assertEqual(brinee._dumps(), r)
+
+        brinee.x = 10
+        brinee.z = object()  # not serializable so dump fails part way
+        with self.assertRaises(TypeError):
+            brinee._dump(filename, atomic=True)
+        with open(filename, "r") as f:
+            self.assertEqual(f.read(), r)
+        self.assertEqual([name for name in os.listdir(".")
+                          if name.startswith(filename + ".")], [])
+
+        brinee.z = 30
+        brinee._dump(filename, durability='none')
+        brinee.x = 1
+        brinee._load(filename)
+        self.assertEqual(brinee.x, 10)
+
+        with self.assertRaises(ValueError):
+            brinee._dump(filename, durability='bogus')
+
     def testDumpsUnhintedlyRecursive(self):
         """ Dumps unhintely recursive"""
         self.B._Hinted = False
@@ -718,6 +750,214 @@ class BrineTestCase(unittest.TestCase):
         logger.debug("Over deep: \n%s" % (dumpable, ))
         self.assertDictEqual(dumpable, OrderedDict([('name', 'Over'), ('@class', 'B')]))
 
+    def testSlots(self):
+        """ Slotted brined classes"""
+        logger.debug("\nSlots\n")
+
+        @brined()
+        class S(object):
+            __slots__ = ('x', 'y', '_z')
+            def __init__(self):
+                self.x = 1
+                self._z = 3 # y is left unset
+
+        class T(S): # inherits brining from S
+            _Propertied = True
+            __slots__ = 'w'
+            def __init__(self):
+                super(T, self).__init__()
+                self.w = 4
+
+            @property
+            def p(self):
+                return self.x * 10
+
+        s = S()
+        self.assertFalse(hasattr(s, '__dict__'))
+        self.assertEqual(S._DumpPlan.slots, ('x', 'y'))
+        self.assertEqual(s._dumps(), '{\n  "x": 1,\n  "@class": "S"\n}')
+
+        s._loads('{"x": 5, "y": 6, "z": 7, "_z": 8, "@class": "S"}')
+        self.assertEqual((s.x, s.y, s._z), (5, 6, 3))
+        self.assertEqual(s._dumps(), '{\n  "x": 5,\n  "y": 6,\n  "@class": "S"\n}')
+
+        t = T()
+        self.assertEqual(dumpPlan(T).slots, ('w', 'x', 'y'))
+        self.assertEqual(dumpPlan(T).props, ('p', ))
+        self.assertEqual(list(t._dumpable().keys()), ['p', 'w', 'x', '@class'])
+
+        t = debrines('{"w": 0, "x": 2, "y": 3, "@class": "T"}', [T])
+        self.assertIsInstance(t, T)
+        self.assertEqual((t.w, t.x, t.y, t.p), (0, 2, 3, 20))
+
+        @brined(extendable=True)
+        class E(object):
+            __slots__ = ('x', )
+            def __init__(self):
+                self.x = 1
+
+        e = debrines('{"x": 2, "extra": 4, "@class": "E"}', [E]) # no __dict__ to extend
+        self.assertIsInstance(e, E)
+        self.assertEqual(e.x, 2)
+        self.assertFalse(hasattr(e, 'extra'))
+
+    def testCompiled(self):
+        """ Compiled serializers from annotations"""
+        import typing
+        logger.debug("\nCompiled\n")
+
+        @brined(compiled=True)
+        class C(object):
+            x: int
+            name: str
+            under: typing.Optional["C"]
+            tags: list
+            def __init__(self):
+                self.x = 1
+                self.name = "Over"
+                self.under = None
+                self.tags = []
+                self.extra = 5 # not annotated so not serialized
+
+            def method(self):
+                pass
+
+        self.assertIsNone(dumpPlan(self.B).compiled) # not compiled
+        self.assertIsNotNone(dumpPlan(C).compiled)
+        self.assertIsNotNone(updatePlan(C).compiled)
+
+        c = C()
+        c.under = C()
+        c.under.name = "Under"
+        c.under.tags = [1, 2]
+        s = \
+"""{
+  "name": "Over",
+  "tags": [],
+  "under": {
+    "name": "Under",
+    "tags": [
+      1,
+      2
+    ],
+    "under": null,
+    "x": 1,
+    "@class": "C"
+  },
+  "x": 1,
+  "@class": "C"
+}"""
+        logger.debug("Compiled Dumps:\n%s" % c._dumps())
+        self.assertEqual(c._dumps(), s)
+        self.assertEqual(c._dumpable(deep=True)['under'],
+                         OrderedDict([('name', 'Under'), ('tags', [1, 2]),
+                                      ('under', None), ('x', 1), ('@class', 'C')]))
+
+        under = c.under
+        c._loads(s.replace('"Under"', '"Lower"').replace('"x": 1,\n  "@class"',
+                                                         '"x": 7,\n  "@class"'))
+        self.assertIs(c.under, under) # updated in place
+        self.assertEqual((c.x, c.under.name), (7, "Lower"))
+        with self.assertRaises(TypeError):
+            c._loads('{"x": 1, "@class": "B"}')
+
+        d = debrines(s, [C])
+        self.assertEqual(d._dumps(), s)
+
+        C._Keys = ['x', 'name']
+        self.assertEqual(c._dumps(), '{\n  "x": 7,\n  "name": "Over",\n  "@class": "C"\n}')
+
+        C._Compiled = False
+        self.assertIsNone(dumpPlan(C).compiled)
+        self.assertEqual(c._dumps(), '{\n  "x": 7,\n  "name": "Over",\n  "@class": "C"\n}')
+
+        @brined(compiled=True)
+        class U(object): # no annotations so generic path
+            def __init__(self):
+                self.y = 2
+
+        self.assertIsNone(dumpPlan(U).compiled)
+        self.assertEqual(U()._dumps(), '{\n  "y": 2,\n  "@class": "U"\n}')
+
+    def testTracked(self):
+        """ Tracked dumps splice cached fragments of clean objects"""
+        logger.debug("\nTracked\n")
+
+        @brined(tracked=True)
+        class Leaf(object):
+            def __init__(self, v=0):
+                self.v = v
+                self.tags = ["a", "b"]
+
+        @brined(tracked=True)
+        class Node(object):
+            def __init__(self):
+                self.name = "n"
+                self.kids = [Leaf(1), [Leaf(2)]]
+                self.one = Leaf(3)
+                self.table = {"k": Leaf(4)}
+
+        @brined()
+        class Plain(object):
+            def __init__(self):
+                self.name = "n"
+                self.kids = [Leaf(1), [Leaf(2)]]
+                self.one = Leaf(3)
+                self.table = {"k": Leaf(4)}
+
+        @brined()
+        class Other(object):
+            def __init__(self):
+                self.w = 1
+
+        def expect(indent=2):
+            return plain._dumps(indent=indent).replace('"Plain"', '"Node"')
+
+        node = Node()
+        plain = Plain()
+        self.assertTrue(Node._Tracked)
+        self.assertFalse(Plain._Tracked)
+        for indent in (2, None, 4):
+            s = node._dumps(indent=indent)
+            self.assertEqual(s, expect(indent))
+            self.assertIs(node._dumps(indent=indent), s) # cached
+        self.assertIn('_Fragments', node.one.__dict__)
+
+        s = node._dumps()
+        node.kids[1][0].v = 5
+        plain.kids[1][0].v = 5
+        self.assertNotIn('_Fragments', node.kids[1][0].__dict__)
+        self.assertEqual(node._dumps(), expect())
+        self.assertNotEqual(node._dumps(), s)
+
+        node.name = "m"
+        plain.name = "m"
+        self.assertEqual(node._dumps(), expect())
+
+        node.one.tags.append("c") # in place change needs touch
+        plain.one.tags.append("c")
+        self.assertNotEqual(node._dumps(), expect())
+        node.one._touch()
+        self.assertEqual(node._dumps(), expect())
+
+        node.one = Other() # untracked child so not cached
+        plain.one = Other()
+        self.assertEqual(node._dumps(), expect())
+        self.assertNotIn('_Fragments', node.__dict__)
+        self.assertEqual(Node()._dumps(indent=2, sort_keys=False),
+                         Node()._dumps())
+
+        node = Node()
+        s = node._dumps()
+        Leaf._Keys = ["v"] # class change drops cached fragments
+        try:
+            self.assertNotEqual(node._dumps(), s)
+            self.assertNotIn('"tags"', node._dumps())
+            self.assertEqual(node.one._dumps(), '{\n  "v": 3,\n  "@class": "Leaf"\n}')
+        finally:
+            Leaf._Keys = None
+        self.assertEqual(node._dumps(), s)
+
 
 def setupLogging():
     """ Setup loggin for tests"""
@@ -746,9 +986,13 @@ def testSome():
     tests.append('testLoadsSafely')
     tests.append('testLoadsRecursive')
     tests.append('testDumpLoad')
+    tests.append('testDumpAtomic')
     tests.append('testDumpsUnhintedlyRecursive')
     tests.append('testLoadsUnhintedlyRecursive')
     tests.append('testDumpableDeepRecursive')
+    tests.append('testSlots')
+    tests.append('testCompiled')
+    tests.append('testTracked')
 
 
     suite = unittest.TestSuite(map(BrineTestCase, tests))
@@ -0,0 +1,160 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import unittest
+
+from collections import OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import (Brine, debrines, debrine_packed, encodeBuffer, decodeBuffer,
+                     dumps_segmented, debrines_segmented)
+
+class BuffersTestCase(unittest.TestCase):
+    """ Test buffer attribute codecs"""
+
+    def setUp(self):
+        class B(Brine):
+            def __init__(self):
+                self.raw = b"\x00\xffraw"
+                self.buf = bytearray(b"xyz")
+                self.view = memoryview(b"hello")
+                self.ints = memoryview(bytes(range(8))).cast('i')
+                self.name = "b"
+
+        self.B = B
+
+    def tearDown(self):
+        pass
+
+    def testEncodeDecode(self):
+        """ Encode and decode buffers"""
+        logger.debug("\nEncode Decode\n")
+        tagged = encodeBuffer(b"\x00\xff")
+        self.assertEqual(tagged, OrderedDict([("@type", "bytes"), ("@data", "AP8=")]))
+        self.assertEqual(decodeBuffer(tagged), b"\x00\xff")
+        self.assertIsNone(encodeBuffer("text"))
+
+        view = memoryview(bytes(range(12))).cast('h', [2, 3])
+        tagged = encodeBuffer(view)
+        self.assertEqual(tagged["format"], "h")
+        self.assertEqual(tagged["shape"], [2, 3])
+        self.assertEqual(decodeBuffer(tagged).tolist(), view.tolist())
+
+        segments = []
+        data = bytearray(b"big")
+        tagged = encodeBuffer(data, segments=segments)
+        self.assertEqual(tagged["@segment"], 0)
+        self.assertIs(segments[0], data)
+        with self.assertRaises(ValueError):
+            decodeBuffer(tagged)
+        self.assertEqual(decodeBuffer(tagged, segments), bytearray(b"big"))
+        segment = b"seg"
+        self.assertIs(decodeBuffer(OrderedDict([("@type", "bytes"), ("@segment", 0)]),
+                                   [segment]), segment)
+
+        if brining.numpy is not None:
+            numpy = brining.numpy
+            array = numpy.arange(6, dtype="<f4").reshape(2, 3).T
+            tagged = encodeBuffer(array)
+            self.assertEqual(tagged["dtype"], "<f4")
+            self.assertEqual(tagged["shape"], [3, 2])
+            self.assertTrue((decodeBuffer(tagged) == array).all())
+
+    def testDumpsLoads(self):
+        """ Dumps and loads brined objects with buffer attributes"""
+        logger.debug("\nDumps Loads\n")
+        brinee = self.B()
+        s = brinee._dumps()
+        logger.debug(s)
+        self.assertEqual(json.loads(s)["raw"], {"@type": "bytes", "@data": "AP9yYXc="})
+
+        for debrinee in (debrines(s, [self.B]), self.B()._loads(s)):
+            self.assertEqual(debrinee.raw, b"\x00\xffraw")
+            self.assertIsInstance(debrinee.buf, bytearray)
+            self.assertEqual(debrinee.buf, bytearray(b"xyz"))
+            self.assertEqual(debrinee.view.tobytes(), b"hello")
+            self.assertEqual(debrinee.ints.format, "i")
+            self.assertEqual(debrinee.ints.tolist(), brinee.ints.tolist())
+            self.assertEqual(debrinee._dumps(), s)
+
+        for backend in brining.Backends:
+            self.assertEqual(brinee._dumps(indent=None, default=brining.default),
+                             brining.getBackend(backend).dumps(brinee._dumpable(),
+                                                               default=brining.default))
+
+        self.B._Safed = True
+        self.assertEqual(brinee._dumps(), s) # not dropped
+        self.B._Safed = False
+
+        debrinee = debrine_packed(brinee._packb(), [self.B])
+        self.assertEqual(debrinee.raw, b"\x00\xffraw")
+        self.assertEqual(bytes(debrinee.ints), bytes(range(8)))
+        self.assertEqual(debrinee.buf, brinee.buf)
+        self.assertIsInstance(debrinee.buf, bytearray)
+        self.assertEqual(debrinee.ints.format, "i")
+
+    def testSegmented(self):
+        """ Out of band buffers"""
+        logger.debug("\nSegmented\n")
+        brinee = self.B()
+        s, segments = dumps_segmented(brinee)
+        logger.debug(s)
+        self.assertEqual(len(segments), 4)
+        self.assertNotIn("@data", s)
+        self.assertIs(segments[0], brinee.buf)
+        debrinee = debrines_segmented(s, segments, [self.B])
+        self.assertIsInstance(debrinee, self.B)
+        self.assertIs(debrinee.raw, brinee.raw)
+        self.assertEqual(debrinee._dumps(), brinee._dumps())
+        with self.assertRaises(ValueError):
+            debrines(s, [self.B])
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testEncodeDecode')
+    tests.append('testDumpsLoads')
+    tests.append('testSegmented')
+
+
+    suite = unittest.TestSuite(map(BuffersTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(BuffersTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
@@ -0,0 +1,150 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import io
+import logging
+import unittest
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import Brine, dump_many, dumps_many, iterdebrine
+
+class Record(Brine):
+    """ Module level so process pool workers can unpickle it"""
+    def __init__(self, x=1):
+        self.x = x
+        self.y = [x, x + 1]
+
+class BulkTestCase(unittest.TestCase):
+    """ Test bulk dump of many brined objects"""
+
+    def setUp(self):
+        class B(Brine):
+            def __init__(self, x=1):
+                self.x = x
+                self.y = [x, x + 1]
+                self.z = OrderedDict([("n", x)])
+
+        self.B = B
+
+    def tearDown(self):
+        pass
+
+    def brinees(self, count=5):
+        """ generator of brined objects"""
+        for i in range(count):
+            yield self.B(i)
+
+    def testDumpManyJsonLines(self):
+        """ Dump many as JSON Lines"""
+        logger.debug("\nDump Many JSON Lines\n")
+        f = io.StringIO()
+        count = dump_many(self.brinees(), f, buffering=16)
+        self.assertEqual(count, 5)
+        lines = f.getvalue().split("\n")
+        logger.debug("Dumped:\n%s" % f.getvalue())
+        self.assertEqual(lines[-1], "")
+        self.assertEqual(lines[0],
+            '{"x": 0, "y": [0, 1], "z": {"n": 0}, "@class": "B"}')
+        self.assertEqual(len(lines), 6)
+
+        filename = ".testdumpfile"
+        count = dump_many(self.brinees(3), filename, durability="fsync")
+        self.assertEqual(count, 3)
+        debrinees = list(iterdebrine(filename, [self.B]))
+        self.assertEqual([debrinee.x for debrinee in debrinees], [0, 1, 2])
+
+        self.assertEqual(dump_many([], filename), 0)
+        with open(filename, "r") as f:
+            self.assertEqual(f.read(), "")
+
+    def testDumpManyArray(self):
+        """ Dump many as JSON array"""
+        logger.debug("\nDump Many Array\n")
+        for indent in (None, 2, 4):
+            for count in (0, 1, 5):
+                f = io.StringIO()
+                dump_many(self.brinees(count), f, format='array', indent=indent,
+                          buffering=32)
+                s = json.dumps(list(self.brinees(count)), default=brining.default,
+                               indent=indent)
+                self.assertEqual(f.getvalue(), s)
+
+        with self.assertRaises(brining.ParameterError):
+            dump_many(self.brinees(), io.StringIO(), format='xml')
+
+    def testDumpManyParallel(self):
+        """ Dump many in parallel chunks"""
+        import concurrent.futures
+        logger.debug("\nDump Many Parallel\n")
+        records = [Record(i) for i in range(50)]
+        for format in ('jsonl', 'array'):
+            for indent in (None, 2):
+                s = dumps_many(records, format=format, indent=indent)
+                self.assertEqual(dumps_many(iter(records), format=format,
+                                            indent=indent, workers=2, chunk=7), s)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            s = dumps_many(self.brinees(20), format='array', indent=2,
+                           executor=executor, chunk=3)
+            self.assertEqual(s, json.dumps(list(self.brinees(20)),
+                                           default=brining.default, indent=2))
+            self.assertEqual(dumps_many([], format='array', executor=executor), '[]')
+            self.assertEqual(dumps_many([], executor=executor), '')
+
+        filename = ".testdumpfile"
+        count = dump_many(records, filename, workers=2, chunk=16, atomic=True)
+        self.assertEqual(count, 50)
+        debrinees = list(iterdebrine(filename, [Record]))
+        self.assertEqual([debrinee.x for debrinee in debrinees], list(range(50)))
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testDumpManyJsonLines')
+    tests.append('testDumpManyArray')
+    tests.append('testDumpManyParallel')
+
+
+    suite = unittest.TestSuite(map(BulkTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(BulkTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
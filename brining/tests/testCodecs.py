@@ -0,0 +1,228 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import enum
+import uuid
+import decimal
+import datetime
+import logging
+import unittest
+
+from collections import OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import (Brine, ParameterError, debrines, debrine_packed,
+                     register, unregister, Codecs, CodecNames)
+
+class Color(enum.Enum):
+    RED = 1
+    BLUE = 2
+
+class Point(object):
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+class CodecsTestCase(unittest.TestCase):
+    """ Test type codec registry"""
+
+    def setUp(self):
+        register(Point, 'point', lambda p: [p.x, p.y], lambda data: Point(*data))
+        register(Color)
+
+        class B(Brine):
+            def __init__(self):
+                self.when = datetime.datetime(2024, 1, 2, 3, 4, 5, 6)
+                self.day = datetime.date(2024, 1, 2)
+                self.clock = datetime.time(7, 8, 9)
+                self.gap = datetime.timedelta(days=1, seconds=2, microseconds=3)
+                self.cost = decimal.Decimal("1.10")
+                self.ident = uuid.UUID(int=5)
+                self.color = Color.BLUE
+                self.tags = set(["b", "a"])
+                self.frozen = frozenset([3, 1])
+                self.point = Point(1, 2)
+                self.items = [uuid.UUID(int=6), {"cost": decimal.Decimal("2")}]
+
+        self.B = B
+
+    def tearDown(self):
+        unregister(Point)
+        unregister(Color)
+
+    def testEncode(self):
+        """ Encode values with codecs"""
+        logger.debug("\nEncode\n")
+        brinee = self.B()
+        dumpable = brinee._dumpable()
+        self.assertEqual(dumpable["ident"],
+                         OrderedDict([("@type", "uuid"),
+                                      ("@data", "00000000-0000-0000-0000-000000000005")]))
+        self.assertEqual(dumpable["tags"]["@data"], ["a", "b"])
+        self.assertEqual(dumpable["color"]["@data"], 2)
+        self.assertEqual(dumpable["point"]["@data"], [1, 2])
+
+        s = brinee._dumps()
+        logger.debug(s)
+        for backend in brining.Backends:
+            self.assertEqual(brining.getBackend(backend).dumps(brinee._dumpable(),
+                                                               default=brining.default,
+                                                               indent=2), s)
+        nested = OrderedDict([("colors", [Color.RED, {"c": Color.BLUE}])])
+        for backend in brining.Backends:
+            self.assertEqual(brining.getBackend(backend).dumps(nested,
+                                                               default=brining.default,
+                                                               separators=(',', ':')),
+                             '{"colors":[{"@type":"Color","@data":1},'
+                             '{"c":{"@type":"Color","@data":2}}]}')
+        self.assertEqual(debrines(brining.getBackend().dumps(nested, default=brining.default)),
+                         OrderedDict([("colors", [Color.RED, {"c": Color.BLUE}])]))
+        items = json.loads(s)["items"]
+        self.assertEqual(items[1]["cost"], {"@type": "decimal", "@data": "2"})
+
+        self.assertIs(Codecs[datetime.datetime], CodecNames["datetime"])
+        class Special(Point):
+            pass
+        self.assertEqual(brining.default(Special(3, 4))["@data"], [3, 4])
+        self.assertIs(Codecs[Special], Codecs[Point]) # memoized subclass
+        unregister(Point)
+        self.assertNotIn(Special, Codecs)
+        with self.assertRaises(TypeError):
+            brining.default(Point())
+        with self.assertRaises(ParameterError):
+            register(Point)
+
+    def testDecode(self):
+        """ Decode tagged values"""
+        logger.debug("\nDecode\n")
+        brinee = self.B()
+        s = brinee._dumps()
+        other = self.B()
+        for attr in brinee.__dict__:
+            setattr(other, attr, None)
+        debrinees = [debrines(s, [self.B]),
+                     other._loads(s),
+                     debrine_packed(brinee._packb(), [self.B])]
+        for debrinee in debrinees:
+            for attr in ("when", "day", "clock", "gap", "cost", "ident", "tags",
+                         "frozen"):
+                self.assertEqual(getattr(debrinee, attr), getattr(brinee, attr))
+            self.assertIs(debrinee.color, Color.BLUE)
+            self.assertIsInstance(debrinee.frozen, frozenset)
+            self.assertEqual((debrinee.point.x, debrinee.point.y), (1, 2))
+            self.assertEqual(debrinee.items[0], uuid.UUID(int=6))
+            self.assertEqual(debrinee.items[1]["cost"], decimal.Decimal("2"))
+            self.assertEqual(debrinee._dumps(), s)
+
+        unknown = '{"x": {"@type": "nothing", "@data": 1}}'
+        self.assertEqual(debrines(unknown), {"x": {"@type": "nothing", "@data": 1}})
+
+    def testLinkedData(self):
+        """ Dicts with @type that are not tagged values stay plain data"""
+        logger.debug("\nLinked Data\n")
+        class C(Brine):
+            def __init__(self):
+                self.meta = None
+
+        for meta in ('{"@type": "date", "name": "x"}',
+                     '{"@type": "Person", "@id": "http://example.com/p"}',
+                     '{"@type": ["set", "Thing"], "@data": 1}',
+                     '{"@type": "set", "@data": 5}',
+                     '{"@type": "bytes", "@data": "AA==", "name": "x"}',
+                     '{"@type": "ndarray", "@data": "AA=="}'):
+            s = '{"meta": %s, "@class": "C"}' % meta
+            expected = json.loads(meta, object_pairs_hook=OrderedDict)
+            self.assertEqual(debrines(s, [C]).meta, expected)
+            self.assertEqual(C()._loads(s).meta, expected)
+        self.assertEqual(debrines('{"@type": "set", "@data": [1]}'), set([1]))
+
+    def testEnums(self):
+        """ Enums auto registered on first use by qualified name"""
+        logger.debug("\nEnums\n")
+
+        def status():
+            class Status(enum.Enum):
+                OK = 1
+                BAD = 2
+            return Status
+
+        First = status()
+        Second = status()
+        self.assertIsNot(First, Second)
+        class Status(enum.Enum): # same name, distinct qualified name
+            OK = 1
+            BAD = 2
+
+        class A(Brine):
+            def __init__(self):
+                self.a = Status.OK
+                self.b = First.BAD
+
+        brining.attrKind(1)
+        self.assertIn(int, brining.AttrKinds)
+        brinee = A()
+        s = brinee._dumps()
+        self.assertIn(int, brining.AttrKinds) # memos kept while dumping
+        self.assertEqual(brinee._dumpable()["a"]["@type"],
+                         "%s.%s" % (__name__, Status.__qualname__))
+        debrinee = debrines(s, [A])
+        self.assertIs(debrinee.a, Status.OK)
+        self.assertIs(debrinee.b, First.BAD)
+
+        with self.assertRaises(ParameterError): # same qualified name as First
+            brining.default(Second.OK)
+        with self.assertRaises(ParameterError):
+            register(Point, 'Color')
+        self.assertIs(CodecNames['Color'].cls, Color)
+        unregister(Status)
+        unregister(First)
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testEncode')
+    tests.append('testDecode')
+    tests.append('testLinkedData')
+    tests.append('testEnums')
+
+
+    suite = unittest.TestSuite(map(CodecsTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(CodecsTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
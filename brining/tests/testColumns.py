@@ -0,0 +1,169 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import array
+import logging
+import tempfile
+import unittest
+
+from collections import OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import (Brine, ParameterError, to_columns, from_columns,
+                     dumps_columns, dump_columns, debrines_columns, debrine_columns)
+
+class ColumnsTestCase(unittest.TestCase):
+    """ Test columnar serialization"""
+
+    def setUp(self):
+        class C(Brine):
+            def __init__(self):
+                self.a = 2
+                self.name = "Other"
+
+        class B(Brine):
+            def __init__(self):
+                self.x = 1
+                self.y = 0.5
+                self.name = "b"
+                self.on = True
+                self.under = C()
+
+        self.B = B
+        self.C = C
+        self.brinees = []
+        for i in range(4):
+            b = B()
+            b.x = i
+            b.y = i * 0.25
+            b.name = "b%d" % i
+            b.on = i % 2 == 0
+            b.under.a = i * 10
+            self.brinees.append(b)
+
+    def tearDown(self):
+        pass
+
+    def testColumns(self):
+        """ To and from columns"""
+        logger.debug("\nColumns\n")
+        columns = to_columns(self.brinees)
+        self.assertEqual(list(columns), ["name", "on", "under", "x", "y"])
+        self.assertEqual(columns["x"], [0, 1, 2, 3])
+        self.assertEqual(columns["on"], [True, False, True, False])
+        self.assertIs(columns["under"][1], self.brinees[1].under)
+
+        arrays = to_columns(self.brinees, kind='array')
+        self.assertEqual(arrays["x"], array.array('q', [0, 1, 2, 3]))
+        self.assertEqual(arrays["y"], array.array('d', [0.0, 0.25, 0.5, 0.75]))
+        self.assertIsInstance(arrays["on"], list)
+        self.brinees[0].x = 2 ** 64 # does not fit 'q'
+        self.assertEqual(to_columns(self.brinees, kind='array')["x"], [2 ** 64, 1, 2, 3])
+        self.brinees[0].x = 0
+        self.assertIsInstance(arrays["name"], list)
+
+        for kind in ('list', 'array'):
+            brinees = from_columns(to_columns(self.brinees, kind=kind), self.B)
+            self.assertEqual([b._dumps() for b in brinees],
+                             [b._dumps() for b in self.brinees])
+            self.assertIs(type(brinees[2].x), int)
+
+        self.assertEqual(to_columns([]), OrderedDict())
+        self.assertEqual(from_columns(OrderedDict(), self.B), [])
+        self.assertEqual(len(from_columns(OrderedDict([("skip", [1, 2])]), self.B)), 2)
+        with self.assertRaises(ParameterError):
+            to_columns(self.brinees, kind='frame')
+        with self.assertRaises(ParameterError):
+            from_columns(OrderedDict([("x", [1, 2]), ("y", [1.0])]), self.B)
+        odd = self.B()
+        del odd.y
+        with self.assertRaises(ParameterError):
+            to_columns(self.brinees + [odd])
+        if brining.numpy is None:
+            with self.assertRaises(ParameterError):
+                to_columns(self.brinees, kind='numpy')
+        else:
+            vectors = to_columns(self.brinees, kind='numpy')
+            self.assertEqual(vectors["y"].sum(), 1.5)
+            self.assertEqual(from_columns(vectors, self.B)[3]._dumps(),
+                             self.brinees[3]._dumps())
+
+    def testDumpsColumns(self):
+        """ Columnar Json serialization"""
+        logger.debug("\nDumps Columns\n")
+        s = dumps_columns(self.brinees)
+        logger.debug(s)
+        table = json.loads(s, object_pairs_hook=OrderedDict)
+        self.assertEqual(list(table), ["@table", "@count", "@columns"])
+        self.assertEqual(table["@table"], "B")
+        self.assertEqual(table["@count"], 4)
+        self.assertEqual(table["@columns"]["under"][3],
+                         OrderedDict([("a", 30), ("name", "Other"), ("@class", "C")]))
+        self.assertLess(len(s), len(brining.dumps_many(self.brinees, format='array')))
+
+        brinees = debrines_columns(s, [self.B, self.C])
+        self.assertEqual([b._dumps() for b in brinees],
+                         [b._dumps() for b in self.brinees])
+        self.assertIsInstance(brinees[0].under, self.C)
+        self.assertEqual(debrines_columns(dumps_columns([]), [self.B]), [])
+        with self.assertRaises(ParameterError):
+            debrines_columns(s, [self.C])
+        with self.assertRaises(ValueError):
+            debrines_columns('{"x": [1]}', [self.B])
+
+        fd, filename = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            dump_columns(self.brinees, filename, indent=2, atomic=True)
+            brinees = debrine_columns(filename, [self.B, self.C])
+            self.assertEqual(brinees[1]._dumps(), self.brinees[1]._dumps())
+        finally:
+            os.remove(filename)
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testColumns')
+    tests.append('testDumpsColumns')
+
+
+    suite = unittest.TestSuite(map(ColumnsTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(ColumnsTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
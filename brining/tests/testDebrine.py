@@ -15,7 +15,13 @@ from collections import OrderedDict
 import simplejson as json
 
 #from libs import brining
-from brining import Brine, debrines,  debrine
+from brining import Brine, Debriner, debrines,  debrine, iterdebrine, debrine_parallel
+
+class Record(Brine):
+    """ Module level so process pool workers can pickle it"""
+    def __init__(self, x=0):
+        self.x = x
+        self.name = "record"
 
 class DebrineTestCase(unittest.TestCase):
     """ Test mixin"""
@@ -254,6 +260,328 @@ class DebrineTestCase(unittest.TestCase):
         logger.debug( "Dumpable:\n%s" % (debrinee._dumpable()))
         logger.debug( "Dumps:\n%s" % (debrinee._dumps()))
         self.assertEqual(debrinee._dumps(), w)
+    def testDebriner(self):
+        """ Reusable Debriner"""
+        logger.debug("\nDebriner\n")
+
+        class C(object):
+            def __init__(self):
+                self.a = 0
+                self.under = None
+
+        class D(object): # same name as C so C wins
+            pass
+        D.__name__ = 'C'
+
+        debriner = Debriner([self.B, C, D])
+        self.assertEqual(list(debriner.hints.keys()), ['B', 'C'])
+        self.assertIs(debriner.hints['C'], C)
+        self.assertTrue(hasattr(C, '_Brined')) # brinified up front
+
+        s = \
+"""{
+  "a": 5,
+  "under": {
+    "x": 7,
+    "y": 8,
+    "z": 9,
+    "@class": "B"
+  },
+  "@class": "C"
+}"""
+        for i in range(2): # reuse
+            debrinee = debriner.loads(s)
+            self.assertIsInstance(debrinee, C)
+            self.assertIsInstance(debrinee.under, self.B)
+            self.assertEqual(debrinee.under.x, 7)
+            self.assertEqual(debrinee._dumps(), s)
+
+        unknown = debriner.loads('{"a": 1, "@class": "E", "b": {"@class": [1]}}')
+        self.assertEqual(unknown, OrderedDict([('a', 1), ('@class', 'E'),
+                                               ('b', OrderedDict([('@class', [1])]))]))
+
+        filename = ".testdumpfile"
+        with open(filename, "w") as f:
+            f.write(s)
+        debrinee = debriner.load(filename)
+        self.assertEqual(debrinee._dumps(), s)
+
+    def testIterdebrine(self):
+        """ Iterdebrine from JSON Lines"""
+        import io
+        logger.debug("\nIterdebrine JSON Lines\n")
+
+        lines = ['{"x": 10, "y": 20, "z": 30, "@class": "B"}\n',
+                 '\n',
+                 '{"x": 11, "y": 21,\n',
+                 '{"x": 12, "@class": "C"}\n',
+                 '{"x": 13, "y": 23, "z": 33, "@class": "B"}']
+
+        filename = ".testdumpfile"
+        with open(filename, "w") as f:
+            f.writelines(lines)
+
+        with self.assertRaises(ValueError):
+            list(iterdebrine(filename, [self.B]))
+
+        debrinees = list(iterdebrine(filename, [self.B], skip=True))
+        self.assertEqual(len(debrinees), 3)
+        self.assertIsInstance(debrinees[0], self.B)
+        self.assertEqual(debrinees[0].x, 10)
+        self.assertEqual(debrinees[1], OrderedDict([('x', 12), ('@class', 'C')]))
+        self.assertIsInstance(debrinees[2], self.B)
+        self.assertEqual(debrinees[2].x, 13)
+
+        reports = []
+        debrinees = list(iterdebrine(io.StringIO("".join(lines)), [self.B],
+                                     report=lambda *pa: reports.append(pa)))
+        self.assertEqual(len(debrinees), 3)
+        self.assertEqual([report[0] for report in reports], [3])
+        self.assertIsInstance(reports[0][2], ValueError)
+
+        debriner = Debriner([self.B])
+        debrinees = list(debriner.iterload(io.BytesIO("".join(lines).encode()),
+                                           skip=True))
+        self.assertEqual([debrinee.x for debrinee in debrinees[::2]], [10, 13])
+
+    def testLazy(self):
+        """ Lazy debrine reconstructs nested objects on first access"""
+        logger.debug("\nLazy Debrine\n")
+        from brining import LazyBrine, materialize
+
+        class C(Brine):
+            def __init__(self):
+                self.a = 2
+                self.under = None
+
+        made = []
+        class D(Brine):
+            def __init__(self):
+                made.append(self)
+                self.a = 0
+                self.under = None
+
+        s = \
+"""{
+  "a": 1,
+  "under": {
+    "a": 3,
+    "under": {
+      "a": 4,
+      "under": null,
+      "@class": "D"
+    },
+    "@class": "C"
+  },
+  "@class": "C"
+}"""
+        debrinee = debrines(s, [C, D], lazy=True)
+        self.assertIs(type(debrinee), C)
+        self.assertIs(type(debrinee.under), LazyBrine)
+        self.assertIsInstance(debrinee.under, C)
+        self.assertEqual(debrinee.under.a, 3)
+        self.assertEqual(made, [])
+        self.assertEqual(repr(debrinee.under.under), "<lazy D>")
+
+        debrinee.under.under.a = 5
+        self.assertEqual(len(made), 1)
+        self.assertIs(materialize(debrinee.under.under), made[0])
+        self.assertEqual(made[0].a, 5)
+        self.assertIs(materialize(made[0]), made[0])
+
+        self.assertEqual(debrinee._dumps(), s.replace('"a": 4', '"a": 5'))
+        eager = debrines(s, [C, D])
+        self.assertEqual(debrines(s, [C, D], lazy=True)._dumps(), eager._dumps())
+
+        import pickle
+        import copy
+        s = '{"a": 1, "under": {"x": 7, "name": "r", "@class": "Record"}, "@class": "C"}'
+        for copier in (lambda obj: pickle.loads(pickle.dumps(obj)),
+                       copy.copy, copy.deepcopy):
+            lazy = debrines(s, [C, Record], lazy=True).under
+            self.assertIs(type(lazy), LazyBrine)
+            clone = copier(lazy) # copies or pickles reconstructed object
+            self.assertIs(type(clone), Record)
+            self.assertIsNot(clone, materialize(lazy))
+            self.assertEqual((clone.x, clone.name), (7, "r"))
+
+        class L(Brine):
+            def __init__(self):
+                self.items = []
+            def __len__(self):
+                return len(self.items)
+            def __getitem__(self, index):
+                return self.items[index]
+            def __eq__(self, other):
+                return isinstance(other, L) and self.items == other.items
+            __hash__ = None
+
+        s = '{"a": 1, "under": {"items": [1, 2], "@class": "L"}, "@class": "C"}'
+        lazy = debrines(s, [C, L], lazy=True).under
+        self.assertIs(type(lazy), LazyBrine)
+        self.assertEqual(len(lazy), 2)
+        self.assertEqual(lazy[1], 2)
+        self.assertEqual(list(lazy), [1, 2])
+        self.assertIn(2, lazy)
+        self.assertTrue(lazy == debrines(s, [C, L]).under)
+        with self.assertRaises(TypeError):
+            hash(lazy)
+
+    def testReferenced(self):
+        """ Shared objects and cycles with @id and @ref"""
+        logger.debug("\nReferenced\n")
+        from brining import brined, referencer
+
+        @brined(referenced=True)
+        class Node(object):
+            def __init__(self):
+                self.name = ""
+                self.parent = None
+                self.kids = []
+
+        root = Node()
+        root.name = "root"
+        shared = Node()
+        shared.name = "shared"
+        for i in range(2):
+            kid = Node()
+            kid.name = "kid%d" % i
+            kid.parent = root
+            kid.kids = [shared]
+            root.kids.append(kid)
+
+        s = root._dumps(indent=None)
+        logger.debug("Dumps:\n%s" % s)
+        self.assertEqual(s,
+            '{"kids": [{"kids": [{"kids": [], "name": "shared", "parent": null, '
+            '"@class": "Node", "@id": 3}], "name": "kid0", "parent": {"@ref": 1}, '
+            '"@class": "Node", "@id": 2}, {"kids": [{"@ref": 3}], "name": "kid1", '
+            '"parent": {"@ref": 1}, "@class": "Node", "@id": 4}], "name": "root", '
+            '"parent": null, "@class": "Node", "@id": 1}')
+
+        debrinee = debrines(s, [Node])
+        self.assertIsInstance(debrinee, Node)
+        self.assertEqual(debrinee.name, "root")
+        self.assertEqual([kid.name for kid in debrinee.kids], ["kid0", "kid1"])
+        self.assertIs(debrinee.kids[0].parent, debrinee)
+        self.assertIs(debrinee.kids[1].parent, debrinee)
+        self.assertIs(debrinee.kids[0].kids[0], debrinee.kids[1].kids[0])
+        self.assertNotIn('@id', debrinee.__dict__)
+        self.assertEqual(debrinee._dumps(), root._dumps())
+
+        lazy = debrines(s, [Node], lazy=True)
+        self.assertEqual(lazy.kids[0].kids[0].name, "shared")
+        self.assertEqual(lazy.kids[0].parent.kids[1].parent.name, "root")
+
+        other = Node() # loads into self in place
+        self.assertIs(other._loads(s), other)
+        self.assertEqual(other._dumps(), root._dumps())
+
+        @brined(referenced=True)
+        class Pair(object):
+            def __init__(self):
+                self.a = Node()
+                self.b = Node()
+
+        pair = Pair()
+        pair.b = pair.a # shared
+        pair.a.parent = pair # cycle
+        pair.a.name = "a"
+        other = Pair()._loads(pair._dumps())
+        self.assertIs(other.a, other.b)
+        self.assertIs(other.a.parent, other)
+        self.assertEqual(other.a.name, "a")
+        self.assertEqual(other._dumps(), pair._dumps())
+        self.assertIs(Pair()._unpackb(Pair()._packb()).b.__class__, Node)
+
+        filename = ".testdumpfile"
+        root._dump(filename)
+        debrinee = debrine(filename, [Node], extendable=True)
+        self.assertIs(debrinee.kids[1].parent, debrinee)
+        self.assertNotIn('@id', debrinee.__dict__)
+        kids = json.loads(json.dumps(list(root.kids),
+                                     default=referencer(),
+                                     check_circular=False))
+        self.assertEqual(kids[0]["@id"], 1)
+        self.assertEqual(kids[1], {"@ref": 4}) # emitted inside root
+
+        shared.kids = [root.kids[1]] # cycle below root
+        debrinee = debrines(root._dumps(), [Node])
+        kid = debrinee.kids[1]
+        self.assertIs(kid.kids[0].kids[0], kid)
+
+        debrinee = debrines('{"kids": [{"@ref": 7}], "@class": "Node", "@id": 1}', [Node])
+        self.assertEqual(debrinee.kids, [{"@ref": 7}]) # no @id 7 so plain data
+        self.assertEqual(debrines('[{"@ref": 1}, {"@ref": [1]}]', []),
+                         [{"@ref": 1}, {"@ref": [1]}])
+        self.assertEqual(debrines('{"@ref": "http://x"}', []), {"@ref": "http://x"})
+        class A(Brine):
+            def __init__(self):
+                self.x = None
+        debrinee = debrines('{"x": {"@ref": "http://x"}, "@class": "A"}', [A])
+        self.assertEqual(debrinee.x, {"@ref": "http://x"})
+        self.assertIsInstance(debrinee.x, OrderedDict)
+
+        import threading
+        s = root._dumps(indent=None)
+        debriner = Debriner([Node]) # shared by threads
+        broken = []
+
+        def worker():
+            for i in range(100):
+                debrinee = debriner.loads(s)
+                kid = debrinee.kids[1]
+                if (debrinee.kids[0].parent is not debrinee or
+                        kid.kids[0].kids[0] is not kid):
+                    broken.append(i)
+
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # switch threads mid decode
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(broken, [])
+
+    def testDebrineParallel(self):
+        """ Debrine JSON Lines in parallel chunks"""
+        import concurrent.futures
+        from brining import dump_many
+        logger.debug("\nDebrine Parallel\n")
+
+        filename = ".testdumpfile"
+        dump_many((Record(i) for i in range(100)), filename)
+        with open(filename, "a") as f:
+            f.write('\n{"x": 100, "name": "odd", "@class": "Other"}\n')
+
+        debrinees = list(debrine_parallel(filename, [Record], workers=2, chunk=64))
+        self.assertEqual(len(debrinees), 101)
+        self.assertIsInstance(debrinees[0], Record)
+        self.assertEqual([debrinee.x for debrinee in debrinees[:100]], list(range(100)))
+        self.assertEqual(debrinees[100]["name"], "odd")
+
+        debrinees = list(debrine_parallel(filename, [Record], workers=3, chunk=100,
+                                          ordered=False))
+        self.assertEqual(sorted(debrinee.x if isinstance(debrinee, Record)
+                                else debrinee["x"] for debrinee in debrinees),
+                         list(range(101)))
+
+        self.assertEqual(len(list(debrine_parallel(filename, [Record]))), 101)
+
+        with open(filename, "a") as f:
+            f.write('{"x": 101, "@cl\n')
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValueError):
+                list(debrine_parallel(filename, [Record], executor=executor,
+                                      chunk=256))
+            debrinees = list(debrine_parallel(filename, [Record], executor=executor,
+                                              chunk=1 << 20, skip=True))
+        self.assertEqual(len(debrinees), 101)
+
 
 def setupLogging():
     """ Setup loggin for tests"""
@@ -278,6 +606,11 @@ def testSome():
     tests.append('testDebrinesRecursive')
     tests.append('testDebrinesExtendable')
     tests.append('testDebrine')
+    tests.append('testDebriner')
+    tests.append('testIterdebrine')
+    tests.append('testLazy')
+    tests.append('testReferenced')
+    tests.append('testDebrineParallel')
 
 
     suite = unittest.TestSuite(map(DebrineTestCase, tests))
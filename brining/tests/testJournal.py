@@ -0,0 +1,194 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import datetime
+import logging
+import unittest
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import Brine, Journal
+
+class JournalTestCase(unittest.TestCase):
+    """ Test journaled persistence"""
+
+    def setUp(self):
+        class C(Brine):
+            def __init__(self):
+                self.a = 0
+
+        class B(Brine):
+            def __init__(self):
+                self.x = 1
+                self.y = [1, 2]
+                self.c = C()
+
+        self.B = B
+        self.C = C
+        self.filename = ".testjournal"
+        self.remove()
+
+    def tearDown(self):
+        self.remove()
+
+    def remove(self):
+        for name in (self.filename, self.filename + ".log"):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def testRecordRecover(self):
+        """ Record changes then recover from snapshot and log"""
+        logger.debug("\nJournal Record Recover\n")
+        brinee = self.B()
+        with Journal(brinee, self.filename, threshold=None, group=2) as journal:
+            self.assertIs(journal.recover(), brinee)
+            journal.record(x=5)
+            journal.record(y=[3], x=6)
+            c = self.C()
+            c.a = 7
+            journal.record(c=c)
+            self.assertEqual(journal.entries, 3)
+            self.assertEqual(journal.pending, 1)
+        self.assertFalse(os.path.exists(self.filename))
+
+        with open(self.filename + ".log", "r") as f:
+            lines = f.read().splitlines()
+        logger.debug("Log:\n%s" % "\n".join(lines))
+        self.assertEqual(lines[0], '{"x":5,"@class":"B"}')
+        self.assertEqual(len(lines), 3)
+
+        other = Journal(self.B(), self.filename).recover()
+        self.assertEqual(other.x, 6)
+        self.assertEqual(other.y, [3])
+        self.assertIsInstance(other.c, self.C)
+        self.assertEqual(other.c.a, 7)
+        self.assertEqual(other._dumps(), brinee._dumps())
+
+    def testTornEntry(self):
+        """ Torn last entry is dropped on recovery"""
+        logger.debug("\nJournal Torn Entry\n")
+        with Journal(self.B(), self.filename) as journal:
+            journal.record(x=5)
+        with open(self.filename + ".log", "a") as f:
+            f.write('{"x":6,"@cl')
+
+        journal = Journal(self.B(), self.filename)
+        self.assertEqual(journal.recover().x, 5)
+        self.assertEqual(journal.entries, 1)
+        journal.record(x=7)
+        journal.close()
+        self.assertEqual(Journal(self.B(), self.filename).recover().x, 7)
+
+    def testCompact(self):
+        """ Compaction rewrites snapshot and truncates log"""
+        logger.debug("\nJournal Compact\n")
+        brinee = self.B()
+        journal = Journal(brinee, self.filename, threshold=3, durability='flush')
+        for i in range(4):
+            journal.record(x=i)
+        journal.close()
+        self.assertEqual(journal.entries, 1)
+        with open(self.filename, "r") as f:
+            self.assertEqual(json.loads(f.read())["x"], 2)
+        with open(self.filename + ".log", "r") as f:
+            self.assertEqual(f.read(), '{"x":3,"@class":"B"}\n')
+
+        self.assertEqual(Journal(self.B(), self.filename).recover().x, 3)
+
+        with self.assertRaises(brining.ParameterError):
+            Journal(brinee, self.filename, durability='bogus')
+
+    def testCodecValues(self):
+        """ Recover codec values recorded in the log"""
+        logger.debug("\nJournal Codec Values\n")
+        when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        with Journal(self.B(), self.filename, threshold=None) as journal:
+            journal.record(x=when, y={"ids": set([1, 2]), "raw": b"\x00\x01"})
+
+        other = Journal(self.B(), self.filename).recover()
+        self.assertEqual(other.x, when)
+        self.assertEqual(other.y, {"ids": set([1, 2]), "raw": b"\x00\x01"})
+
+    def testReferenced(self):
+        """ Recover shared objects and cycles of a referenced class"""
+        logger.debug("\nJournal Referenced\n")
+        from brining import brined
+
+        @brined(referenced=True)
+        class L(object):
+            def __init__(self):
+                self.v = 1
+                self.n = None
+
+        @brined(referenced=True)
+        class N(object):
+            def __init__(self):
+                self.a = L()
+                self.b = L()
+
+        brinee = N()
+        brinee.b = brinee.a # shared
+        brinee.a.n = brinee # cycle
+        journal = Journal(brinee, self.filename, threshold=None, durability='flush')
+        brinee.a.v = 5
+        journal.compact()
+        journal.close()
+
+        other = Journal(N(), self.filename).recover()
+        self.assertIs(other.a, other.b)
+        self.assertIs(other.a.n, other)
+        self.assertEqual(other.a.v, 5)
+        self.assertEqual(other._dumps(), brinee._dumps())
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testRecordRecover')
+    tests.append('testTornEntry')
+    tests.append('testCompact')
+    tests.append('testCodecValues')
+    tests.append('testReferenced')
+
+
+    suite = unittest.TestSuite(map(JournalTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(JournalTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
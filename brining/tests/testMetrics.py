@@ -0,0 +1,187 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import unittest
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import Brine, brined, debrines, meter, stats, resetStats, sample, samples
+
+class MetricsTestCase(unittest.TestCase):
+    """ Test opt-in serialization metrics"""
+
+    def setUp(self):
+        class C(Brine):
+            def __init__(self):
+                self.a = 1
+
+        class B(Brine):
+            def __init__(self):
+                self.x = 1
+                self.c = C()
+
+        self.B = B
+        self.C = C
+        resetStats()
+
+    def tearDown(self):
+        sample(None)
+        meter(False)
+        resetStats()
+
+    def testOff(self):
+        """ Nothing is recorded and plain methods are used when off"""
+        logger.debug("\nMetrics Off\n")
+        brinee = self.B()
+        brinee._loads(brinee._dumps())
+        self.assertEqual(stats(), OrderedDict())
+        self.assertIs(self.B._dumps, brining.dumps)
+        self.assertIs(Brine.__dict__['_dumps'], brining.dumps)
+
+    def testStats(self):
+        """ Counts, percentiles and bytes per class"""
+        logger.debug("\nMetrics Stats\n")
+        meter()
+        self.assertIs(Brine.__dict__['_dumps'], brining.meteredDumps)
+        brinee = self.B()
+        for i in range(3):
+            s = brinee._dumps()
+        brinee._loads(s)
+        debrinee = debrines(s, [self.B, self.C])
+
+        @brined()
+        class D(object):
+            def __init__(self):
+                self.d = 1
+        D()._dumps()
+
+        filename = ".testdumpfile"
+        brinee._dump(filename, durability='none')
+        brinee._load(filename)
+
+        result = stats()
+        logger.debug("Stats:\n%s" % json.dumps(result, indent=2))
+        self.assertEqual(list(result), ['B', 'C', 'D'])
+        self.assertEqual(list(result['B']),
+                         ['debrines', 'dump', 'dumps', 'load', 'loads', 'update'])
+        dumps = result['B']['dumps']
+        self.assertEqual(dumps['count'], 3)
+        self.assertEqual(dumps['bytesOut'], 3 * len(s))
+        self.assertEqual(dumps['bytesIn'], 0)
+        self.assertTrue(0 < dumps['p50'] <= dumps['p90'] <= dumps['p99'] <= dumps['max'])
+        self.assertAlmostEqual(dumps['mean'], dumps['total'] / 3)
+        self.assertEqual(result['B']['loads']['bytesIn'], len(s))
+        self.assertEqual(result['B']['dump']['bytesOut'], len(s))
+        self.assertEqual(result['B']['debrines']['count'], 1)
+        self.assertEqual(result['C']['update']['count'], 3) # loads, debrines, load
+        self.assertEqual(result['D']['dumps']['count'], 1)
+
+        meter(False)
+        self.assertIs(self.B._dumps, brining.dumps)
+        brinee._dumps()
+        self.assertEqual(stats()['B']['dumps']['count'], 3)
+        resetStats()
+        self.assertEqual(stats(), OrderedDict())
+
+    def testClass(self):
+        """ Metering one class that inherits its methods from Brine"""
+        logger.debug("\nMetrics Class\n")
+        meter(True, self.B)
+        self.assertIs(self.B._dumps, brining.meteredDumps)
+        self.assertIs(Brine.__dict__['_dumps'], brining.dumps)
+        self.assertIs(self.C._dumps, brining.dumps)
+        brinee = self.B()
+        brinee._dumps()
+        brinee.c._dumps()
+        self.assertEqual(list(stats()), ['B'])
+        self.assertEqual(stats()['B']['dumps']['count'], 1)
+
+        meter()
+        self.assertEqual(debrines('[1, {"a": 2}]', []), [1, {"a": 2}])
+        self.assertNotIn('list', stats()) # only brined results
+        meter(False)
+        self.assertIs(self.B._dumps, brining.dumps)
+
+    def testSample(self):
+        """ Slow serializations are sampled with attribute breakdown"""
+        logger.debug("\nMetrics Sample\n")
+        brinee = self.B()
+        brinee.c.a = list(range(1000)) # bloated
+        s = brinee._dumps()
+        self.assertEqual(samples(), [])
+
+        sample(0.0, limit=2)
+        self.assertIs(self.B._dumps, brining.meteredDumps)
+        brinee._dumps()
+        brinee._loads(s)
+        brinee._dumps()
+        result = samples()
+        logger.debug("Samples:\n%s" % json.dumps(result, indent=2))
+        self.assertEqual(len(result), 2)
+        self.assertEqual([entry["operation"] for entry in result], ["loads", "dumps"])
+        entry = result[1]
+        self.assertEqual(entry["class"], "B")
+        self.assertEqual(entry["bytes"], len(s))
+        self.assertEqual([attribute["path"] for attribute in entry["attributes"]],
+                         ["c.a", "c", "x"]) # largest first
+        self.assertEqual(entry["attributes"][0]["bytes"],
+                         len(json.dumps(list(range(1000)))))
+
+        sample(1000.0)
+        brinee._dumps()
+        self.assertEqual(len(samples()), 2)
+        resetStats()
+        self.assertEqual(samples(), [])
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testOff')
+    tests.append('testStats')
+    tests.append('testClass')
+    tests.append('testSample')
+
+
+    suite = unittest.TestSuite(map(MetricsTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(MetricsTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
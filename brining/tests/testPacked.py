@@ -0,0 +1,181 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import unittest
+
+from collections import OrderedDict
+#from ioflo.aid import odict as OrderedDict
+
+import simplejson as json
+
+#from libs import brining
+import brining
+from brining import Brine, Debriner, debrine_packed, pyPackb, pyUnpackb
+
+class PackedTestCase(unittest.TestCase):
+    """ Test MessagePack serialization"""
+
+    def setUp(self):
+        class C(Brine):
+            def __init__(self):
+                self.a = 2
+                self.under = None
+                self.name = "Other"
+
+        class B(Brine):
+            def __init__(self):
+                self.x = 1
+                self.y = [1.5, "two", None, True]
+                self.z = OrderedDict([("k", -1)])
+                self.under = None
+
+        self.B = B
+        self.C = C
+
+    def tearDown(self):
+        pass
+
+    def testPure(self):
+        """ Pure Python MessagePack engine"""
+        logger.debug("\nPure MessagePack\n")
+        vectors = [(None, b"\xc0"),
+                   (False, b"\xc2"),
+                   (True, b"\xc3"),
+                   (0, b"\x00"),
+                   (127, b"\x7f"),
+                   (128, b"\xcc\x80"),
+                   (-1, b"\xff"),
+                   (-33, b"\xd0\xdf"),
+                   (65536, b"\xce\x00\x01\x00\x00"),
+                   (-2 ** 63, b"\xd3\x80\x00\x00\x00\x00\x00\x00\x00"),
+                   (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+                   ("abc", b"\xa3abc"),
+                   ("a" * 32, b"\xd9\x20" + b"a" * 32),
+                   (b"\x01\x02", b"\xc4\x02\x01\x02"),
+                   ([1, [2]], b"\x92\x01\x91\x02"),
+                   (list(range(16)), b"\xdc\x00\x10" + bytes(range(16))),
+                   (OrderedDict([("a", 1), (0, "B")]), b"\x82\xa1a\x01\x00\xa1B")]
+        for obj, data in vectors:
+            self.assertEqual(pyPackb(obj), data)
+            self.assertEqual(pyUnpackb(data), obj)
+        self.assertEqual(pyPackb((1, 2)), pyPackb([1, 2]))
+        self.assertEqual(pyPackb(bytearray(b"ab")), pyPackb(memoryview(b"ab")))
+        self.assertIsInstance(pyUnpackb(b"\x81\xa1a\x01"), OrderedDict)
+
+        with self.assertRaises(TypeError):
+            pyPackb(object())
+        with self.assertRaises(OverflowError):
+            pyPackb(2 ** 64)
+        self.assertEqual(pyPackb(object(), default=lambda obj: "o"), b"\xa1o")
+        for data in (b"", b"\x92\x01", b"\xa3ab", b"\x01\x02", b"\xc1"):
+            with self.assertRaises(ValueError):
+                pyUnpackb(data)
+
+    def testPackUnpack(self):
+        """ Pack and unpack brined objects"""
+        logger.debug("\nPack Unpack\n")
+        brinee = self.B()
+        brinee.under = self.C()
+        data = brinee._packb()
+        logger.debug("Packed %d bytes versus %d JSON" %
+                     (len(data), len(brinee._dumps(indent=None))))
+        self.assertEqual(data, brining.packb(json.loads(brinee._dumps(),
+                                                        object_pairs_hook=OrderedDict)))
+
+        other = self.B()
+        other.under = self.C()
+        other.x = 5
+        self.assertIs(other._unpackb(data), other)
+        self.assertEqual(other._dumps(), brinee._dumps())
+
+        debrinee = debrine_packed(data, [self.B, self.C])
+        self.assertIsInstance(debrinee, self.B)
+        self.assertIsInstance(debrinee.under, self.C)
+        self.assertEqual(debrinee._dumps(), brinee._dumps())
+        debriner = Debriner([self.B, self.C])
+        self.assertEqual(debriner.unpackb(data)._dumps(), brinee._dumps())
+
+        brinee.z = OrderedDict([(0, "C"), (1, "one")]) # integer keys are data
+        debrinee = debrine_packed(brinee._packb(), [self.B, self.C])
+        self.assertEqual(debrinee.z, OrderedDict([(0, "C"), (1, "one")]))
+        self.assertEqual(self.B()._unpackb(brinee._packb()).z, brinee.z)
+        brinee.z = OrderedDict([("k", -1)])
+
+        with self.assertRaises(TypeError): # hint mismatch
+            self.C()._unpackb(data)
+        with self.assertRaises(ValueError):
+            debrine_packed(data[:-1], [self.B, self.C])
+
+    def testBuffers(self):
+        """ Pack and unpack bytes, bytearray and memoryview attributes"""
+        import array
+        logger.debug("\nPack Buffers\n")
+        brinee = self.B()
+        brinee.x = b"\x00\x01"
+        brinee.y = [bytearray(b"ab"), 3]
+        brinee.z = OrderedDict([("v", memoryview(array.array('d', [1.5, -2.0])))])
+        data = brinee._packb()
+
+        for debrinee in (self.B()._unpackb(data),
+                         debrine_packed(data, [self.B, self.C]),
+                         Debriner([self.B, self.C]).unpackb(data)):
+            self.assertIsInstance(debrinee.x, bytes)
+            self.assertEqual(debrinee.x, b"\x00\x01")
+            self.assertIsInstance(debrinee.y[0], bytearray)
+            self.assertEqual(debrinee.y, [bytearray(b"ab"), 3])
+            view = debrinee.z["v"]
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual((view.format, view.shape), ('d', (2, )))
+            self.assertEqual(view.tolist(), [1.5, -2.0])
+
+        self.assertIsInstance(brinee.y[0], bytearray) # dumpable not changed
+        self.assertEqual(self.B()._unpackb(self.B()._packb()).y,
+                         [1.5, "two", None, True])
+
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testPure')
+    tests.append('testPackUnpack')
+    tests.append('testBuffers')
+
+
+    suite = unittest.TestSuite(map(PackedTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PackedTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
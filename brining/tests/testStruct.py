@@ -0,0 +1,141 @@
+""" Unit Tests
+
+
+See LICENSE.txt for Licensing details
+Copyright (c) <2013> <Samuel M. Smith>
+"""
+import sys
+import os
+import logging
+import unittest
+
+#from libs import brining
+import brining
+from brining import brined, ParameterError, pack_many, unpack_many
+
+class StructTestCase(unittest.TestCase):
+    """ Test fixed size binary record layout"""
+
+    def setUp(self):
+        @brined(layout='struct')
+        class Point(object):
+            x: int = 0
+            y: float = 0.0
+            on: bool = False
+
+            def __init__(self, x=0, y=0.0, on=False):
+                self.x = x
+                self.y = y
+                self.on = on
+
+        @brined(keys=["b", "a"], layout='struct')
+        class Keyed(object):
+            def __init__(self):
+                self.a = 1
+                self.b = 2.5
+                self.name = "ignored"
+
+        self.Point = Point
+        self.Keyed = Keyed
+
+    def tearDown(self):
+        pass
+
+    def testPackUnpack(self):
+        """ Pack and unpack one record"""
+        logger.debug("\nPack Unpack\n")
+        layout = self.Point._StructLayout
+        self.assertEqual(layout.names, ("x", "y", "on"))
+        self.assertEqual(layout.struct.format, "<qd?")
+        self.assertEqual(layout.struct.size, 17)
+
+        data = self.Point(-7, 1.5, True)._pack()
+        self.assertEqual(len(data), 17)
+        point = self.Point()
+        self.assertIs(point._unpack(data), point)
+        self.assertEqual((point.x, point.y, point.on), (-7, 1.5, True))
+        point._unpack(b"pad" + data, offset=3)
+        self.assertEqual(point.x, -7)
+
+        keyed = self.Keyed()
+        self.assertEqual(keyed.__class__._StructLayout.names, ("b", "a"))
+        self.assertEqual(len(keyed._pack()), 16)
+
+        with self.assertRaises(ParameterError):
+            @brined(layout='struct')
+            class Bad(object):
+                name: str = ""
+        with self.assertRaises(ParameterError):
+            @brined(layout='table')
+            class Worse(object):
+                x: int = 0
+        @brined()
+        class Plain(object):
+            x: int = 0
+        with self.assertRaises(ParameterError):
+            Plain()._pack()
+
+    def testPackMany(self):
+        """ Pack and unpack many records with random access"""
+        logger.debug("\nPack Many\n")
+        points = [self.Point(i, i * 0.5, i % 2 == 0) for i in range(10)]
+        buffer = pack_many(points)
+        self.assertIsInstance(buffer, bytearray)
+        self.assertEqual(len(buffer), 170)
+        self.assertEqual(bytes(buffer[17:34]), points[1]._pack())
+
+        loaded = unpack_many(buffer, self.Point)
+        self.assertEqual([(p.x, p.y, p.on) for p in loaded],
+                         [(p.x, p.y, p.on) for p in points])
+        some = unpack_many(memoryview(buffer), self.Point, start=7, count=2)
+        self.assertEqual([p.x for p in some], [7, 8])
+        self.assertEqual(unpack_many(buffer, self.Point, start=10), [])
+        with self.assertRaises(ParameterError):
+            unpack_many(buffer, self.Point, start=9, count=2)
+
+        target = bytearray(4 + 170)
+        self.assertIs(pack_many(iter(points), target, offset=4), target)
+        self.assertEqual(bytes(target[4:]), bytes(buffer))
+        self.assertEqual(unpack_many(target, self.Point, start=3, count=1, offset=4)[0].x, 3)
+        with self.assertRaises(ParameterError):
+            pack_many(points, bytearray(169))
+
+
+def setupLogging():
+    """ Setup loggin for tests"""
+    global logger
+
+    logger = logging.getLogger(__name__) #name logger after module
+    logger.setLevel(logging.DEBUG)
+
+    basicConsoleHandler = logging.StreamHandler() #sys.stderr
+    basicformatter = logging.Formatter('%(message)s') #standard format
+    basicConsoleHandler.setFormatter(basicformatter)
+    logger.addHandler(basicConsoleHandler)
+    logger.propagate = False
+
+
+def testSome():
+    """ Unittest runner """
+    setupLogging()
+
+    tests = []
+    tests.append('testPackUnpack')
+    tests.append('testPackMany')
+
+
+    suite = unittest.TestSuite(map(StructTestCase, tests))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def testAll():
+    """ Unittest runner """
+    setupLogging()
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(StructTestCase)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    testAll() #run all unittests
+
+    #testSome()#only run some
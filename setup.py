@@ -19,6 +19,7 @@ setup(  name='brining',
         author='Samuel M Smith',
         author_email='smith.samuel.m@gmail.com',
         install_requires = ['simplejson'],
+        extras_require = {'fast': ['orjson', 'msgpack'], 'numpy': ['numpy']},
         packages = find_packages(exclude=[]),
         package_data={'': ['*.txt',  '*.ico',  '*.json', '*.md', '*.conf']},
         tests_require = ['nose'],